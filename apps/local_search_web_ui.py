@@ -17,22 +17,36 @@ This app reads from:
 
 from __future__ import annotations
 
-from collections import Counter, deque
-import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+import inspect
 import re
 from pathlib import Path
 import sys
-from typing import Any
+from typing import Any, Callable
 
 import altair as alt
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import streamlit as st
-from sqlalchemy import text
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from sqlalchemy import bindparam, inspect as sa_inspect, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql.elements import TextClause
 
 # Allow running directly from repo root without package installation.
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from db.connections import create_traceability_mart_engine, create_traceability_staging_engine  # noqa: E402
+from db.literal_sql import render_mysql_literal  # noqa: E402
+
+try:
+    import connectorx as cx
+except ImportError:  # Optional: install the "arrow" extra for Arrow-native explorer reads.
+    cx = None
 
 
 DATASET_SPECS: dict[str, dict[str, Any]] = {
@@ -48,9 +62,12 @@ DATASET_SPECS: dict[str, dict[str, Any]] = {
             ("loaded_at", "t.loaded_at", "Loaded At"),
         ],
         "search_exprs": ["t.fund_id", "t.fund_name", "t.source", "t.currency"],
+        "fulltext_groups": [("t.fund_id", "t.fund_name", "t.source", "t.currency")],
         "as_of_expr": "t.as_of_date",
         "source_expr": "t.source",
         "default_sort": "fund_id",
+        "key_columns": ["fund_id", "as_of_date"],
+        "default_projection": ["fund_id", "fund_name", "source", "currency", "as_of_date"],
     },
     "holdings": {
         "label": "Holdings",
@@ -69,9 +86,11 @@ DATASET_SPECS: dict[str, dict[str, Any]] = {
             ("as_of_date", "h.as_of_date", "As Of"),
         ],
         "search_exprs": ["h.fund_id", "f.fund_name", "f.source", "h.asset_id", "h.asset_name", "h.asset_type"],
+        "fulltext_groups": [("h.fund_id", "h.asset_id", "h.asset_name", "h.asset_type"), ("f.fund_name", "f.source")],
         "as_of_expr": "h.as_of_date",
         "source_expr": "f.source",
         "default_sort": "fund_id",
+        "key_columns": ["fund_id", "asset_id", "as_of_date"],
     },
     "links": {
         "label": "Links",
@@ -95,13 +114,39 @@ DATASET_SPECS: dict[str, dict[str, Any]] = {
             "l.master_fund_id",
             "mf.fund_name",
         ],
+        "fulltext_groups": [("l.feeder_fund_id", "l.master_fund_id"), ("ff.fund_name",), ("mf.fund_name",)],
         "as_of_expr": "l.as_of_date",
         "source_expr": "COALESCE(ff.source, mf.source)",
         "default_sort": "feeder_fund_id",
+        "key_columns": ["feeder_fund_id", "master_fund_id", "as_of_date"],
+        "default_projection": ["feeder_fund_id", "feeder_name", "master_fund_id", "master_name", "confidence", "as_of_date"],
     },
 }
 
+# Per-dataset keyword fragments; only the bind name changes per token. Search columns are all
+# VARCHAR under a case-insensitive collation, so tokens are lowercased once and compared without CAST/LOWER.
+SEARCH_TEMPLATES = {
+    name: " OR ".join(f"{expr} LIKE :{{key}}" for expr in spec["search_exprs"])
+    for name, spec in DATASET_SPECS.items()
+}
+FULLTEXT_TEMPLATES = {
+    name: " OR ".join(f"MATCH({', '.join(cols)}) AGAINST (:{{key}} IN BOOLEAN MODE)" for cols in spec["fulltext_groups"])
+    for name, spec in DATASET_SPECS.items()
+}
+
 FUND_LIKE_TYPES = {"fund", "etf"}
+DIRECT_ROWS_LIMIT = 5000
+EXPLORER_MAX_OFFSET = 10_000
+# DECIMAL(18,8) weights need float64; depth is a small bounded int (NOT NULL in the mart DDL).
+MART_EXPOSURE_DTYPES = {"effective_weight": "float64", "path_depth": "int16"}
+THAI_TICKER_PATTERN = re.compile(r"(\.BK$|\bBK\b|-BK$)", re.IGNORECASE)
+FULLTEXT_INDEXES = {"ft_stg_funds", "ft_stg_funds_name_source", "ft_stg_funds_name", "ft_stg_holdings", "ft_stg_links"}
+# InnoDB skips words shorter than innodb_ft_min_token_size (3) and its default stopwords.
+FULLTEXT_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z]{3,}")
+FULLTEXT_STOPWORDS = {
+    "about", "are", "com", "for", "from", "how", "that", "the", "this", "und", "was", "what", "when", "where",
+    "who", "will", "with", "www",
+}
 
 
 def _inject_css() -> None:
@@ -159,6 +204,111 @@ def _inject_css() -> None:
     )
 
 
+@lru_cache(maxsize=256)
+def _sql(statement: str, expanding: tuple[str, ...] = ()) -> TextClause:
+    """Return one shared ``text()`` clause per SQL string so compiled forms are reused across reruns.
+
+    ``expanding`` names IN-list parameters; they are bound once here so list queries share the clause too.
+    """
+    clause = text(statement)
+    if expanding:
+        clause = clause.bindparams(*(bindparam(name, expanding=True) for name in expanding))
+    return clause
+
+
+def _params(**values: Any) -> dict[str, Any]:
+    """Bind parameters with the ``"All"``/``None`` sentinels dropped; always a dict."""
+    return {
+        key: value
+        for key, value in values.items()
+        if value is not None and not (isinstance(value, str) and value == "All")
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _cache_stats() -> dict[str, dict[str, int]]:
+    return {}
+
+
+def _cached_with_stats(resource: bool = False, versioned: bool = False, **cache_kwargs: Any):
+    """``st.cache_data`` that also counts calls and misses per function for the ``?debug=1`` panel.
+
+    ``resource=True`` uses ``st.cache_resource`` instead: hits return the cached object itself rather than
+    an unpickled copy, so callers must treat the result as read-only.
+
+    ``versioned=True`` adds the snapshot's ``_ingest_version`` to the cache key, so entries stay valid until
+    the ETL rewrites that as-of date and the ttl can be long.
+    """
+
+    def decorator(func):
+        name = func.__name__
+        signature = inspect.signature(func)
+        as_of_param = next((p for p in ("as_of_date", "as_of") if p in signature.parameters), None)
+        if versioned and as_of_param is None:
+            raise TypeError(f"{name} needs an as_of/as_of_date parameter to be versioned")
+
+        @wraps(func)
+        def compute(*args: Any, data_version: Any = None, **kwargs: Any):
+            _cache_stats().setdefault(name, {"calls": 0, "misses": 0})["misses"] += 1
+            return func(*args, **kwargs)
+
+        cached = (st.cache_resource if resource else st.cache_data)(**cache_kwargs)(compute)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any):
+            _cache_stats().setdefault(name, {"calls": 0, "misses": 0})["calls"] += 1
+            if versioned:
+                as_of = signature.bind(*args, **kwargs).arguments[as_of_param]
+                kwargs["data_version"] = _ingest_version(as_of)
+            return cached(*args, **kwargs)
+
+        wrapper.clear = cached.clear
+        return wrapper
+
+    return decorator
+
+
+def _latest_stamp_sql(table_name: str, column: str, as_of_date: str) -> str:
+    # Both shapes are answered from the (as_of_date, <stamp>) index: one seek, or a loose scan per date.
+    if as_of_date != "All":
+        return f"SELECT MAX({column}) FROM {table_name} WHERE as_of_date = :as_of_date"
+    return f"SELECT MAX(latest) FROM (SELECT MAX({column}) AS latest FROM {table_name} GROUP BY as_of_date) d"
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _ingest_version(as_of_date: str) -> tuple[Any, ...]:
+    """Last load time per table for one snapshot; every staging/mart rewrite stamps its rows anew."""
+    params = _params(as_of_date=as_of_date)
+    staging_query = _sql(
+        "SELECT "
+        + ", ".join(
+            f"({_latest_stamp_sql(table_name, 'loaded_at', as_of_date)})"
+            for table_name in ("stg_funds", "stg_holdings", "stg_fund_links")
+        )
+    )
+    mart_query = _sql(_latest_stamp_sql("mart_true_exposure", "calculated_at", as_of_date))
+    with _staging_engine().connect() as conn:
+        staging = tuple(conn.execute(staging_query, params).one())
+    with _mart_engine().connect() as conn:
+        try:
+            mart = conn.execute(mart_query, params).scalar_one()
+        except DBAPIError:
+            conn.rollback()
+            # The mart is optional until the first build; anything else is a real failure.
+            if sa_inspect(conn).has_table("mart_true_exposure"):
+                raise
+            mart = None
+    return (*staging, mart)
+
+
+def _cache_stats_frame() -> pd.DataFrame:
+    rows = [
+        {"function": name, "calls": c["calls"], "misses": c["misses"], "hits": c["calls"] - c["misses"]}
+        for name, c in sorted(_cache_stats().items())
+    ]
+    return pd.DataFrame(rows, columns=["function", "calls", "misses", "hits"])
+
+
 @st.cache_resource(show_spinner=False)
 def _staging_engine():
     return create_traceability_staging_engine()
@@ -169,170 +319,199 @@ def _mart_engine():
     return create_traceability_mart_engine()
 
 
-@st.cache_data(ttl=20, show_spinner=False)
-def _list_as_of_dates() -> list[str]:
-    query = text(
-        """
-        SELECT DISTINCT as_of_date
-        FROM (
-            SELECT as_of_date FROM stg_funds
-            UNION
-            SELECT as_of_date FROM stg_holdings
-            UNION
-            SELECT as_of_date FROM stg_fund_links
-        ) d
-        WHERE as_of_date IS NOT NULL
-        ORDER BY as_of_date DESC
-        """
-    )
+def _distinct_as_of_dates(table_name: str) -> set[Any]:
+    query = _sql(f"SELECT DISTINCT as_of_date FROM {table_name} WHERE as_of_date IS NOT NULL")
     with _staging_engine().connect() as conn:
-        return [str(r[0]) for r in conn.execute(query).fetchall()]
+        return {r[0] for r in conn.execute(query).fetchall()}
+
+
+@_cached_with_stats(ttl=600, show_spinner=False)
+def _list_as_of_dates() -> list[str]:
+    # One DISTINCT probe per table, each on its own pooled connection, merged here.
+    tables = ("stg_funds", "stg_holdings", "stg_fund_links")
+    with ThreadPoolExecutor(max_workers=len(tables)) as pool:
+        results = list(pool.map(_distinct_as_of_dates, tables))
+    return [str(v) for v in sorted(set().union(*results), reverse=True)]
 
 
 def _default_as_of(as_of_dates: list[str]) -> str:
     return as_of_dates[0] if as_of_dates else "All"
 
 
-@st.cache_data(ttl=20, show_spinner=False)
-def _list_sources(as_of_date: str) -> list[str]:
-    params: dict[str, Any] = {}
-    where = "WHERE source IS NOT NULL AND TRIM(source) <> ''"
-    if as_of_date != "All":
-        where += " AND as_of_date = :as_of_date"
-        params["as_of_date"] = as_of_date
-
-    query = text(
+def _persisted_filter_values(conn: Any, as_of_date: str) -> dict[str, list[str]] | None:
+    """Sources/feeders from ``stg_filter_values``, or None unless every requested partition was recorded."""
+    params = _params(as_of_date=as_of_date)
+    where = "" if as_of_date == "All" else "AND as_of_date = :as_of_date"
+    query = _sql(
         f"""
-        SELECT DISTINCT source
-        FROM stg_funds
-        {where}
-        ORDER BY source
+        SELECT DISTINCT kind, value
+        FROM stg_filter_values
+        WHERE kind IN ('partition', 'source', 'feeder') {where}
+        ORDER BY kind, value
         """
     )
-    with _staging_engine().connect() as conn:
-        values = [str(r[0]) for r in conn.execute(query, params if params else None).fetchall()]
-    return ["All"] + values
+    try:
+        rows = conn.execute(query, params).fetchall()
+    except Exception:
+        # Table not created yet (staging built before it existed).
+        conn.rollback()
+        return None
 
+    lists: dict[str, list[str]] = {"partition": [], "source": [], "feeder": []}
+    for kind, value in rows:
+        lists[str(kind)].append(str(value))
+    expected = len(_list_as_of_dates()) if as_of_date == "All" else 1
+    if not lists["partition"] or len(lists["partition"]) < expected:
+        return None
+    return lists
 
-@st.cache_data(ttl=20, show_spinner=False)
-def _count_cards(as_of_date: str) -> dict[str, int]:
-    params = {"as_of_date": as_of_date}
-    filters = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
 
-    out: dict[str, int] = {}
+@_cached_with_stats(versioned=True, ttl=3600, show_spinner=False)
+def _sidebar_lists(as_of_date: str) -> dict[str, list[str]]:
+    """Sources, feeder ids and root ids for the sidebar, one connection per database."""
+    params = _params(as_of_date=as_of_date)
     with _staging_engine().connect() as conn:
-        out["stg_funds"] = int(
-            conn.execute(
-                text(f"SELECT COUNT(*) FROM stg_funds {filters}"),
-                params if as_of_date != "All" else None,
-            ).scalar_one()
-        )
-        out["stg_holdings"] = int(
-            conn.execute(
-                text(f"SELECT COUNT(*) FROM stg_holdings {filters}"),
-                params if as_of_date != "All" else None,
-            ).scalar_one()
-        )
-        out["stg_fund_links"] = int(
-            conn.execute(
-                text(f"SELECT COUNT(*) FROM stg_fund_links {filters}"),
-                params if as_of_date != "All" else None,
-            ).scalar_one()
-        )
+        lists = _persisted_filter_values(conn, as_of_date)
+        if lists is None:
+            lists = {"source": [], "feeder": []}
+            source_where = "WHERE source IS NOT NULL AND TRIM(source) <> ''"
+            link_where = ""
+            if as_of_date != "All":
+                source_where += " AND as_of_date = :as_of_date"
+                link_where = "WHERE as_of_date = :as_of_date"
+            query = _sql(
+                f"""
+                SELECT DISTINCT 'source' AS kind, source AS value FROM stg_funds {source_where}
+                UNION ALL
+                SELECT DISTINCT 'feeder' AS kind, feeder_fund_id AS value FROM stg_fund_links {link_where}
+                ORDER BY kind, value
+                """
+            )
+            for kind, value in conn.execute(query, params).fetchall():
+                lists[str(kind)].append(str(value))
 
-    # Mart may be empty/not created yet.
+    roots: list[str] = []
     try:
+        mart_where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
+        mart_query = _sql(f"SELECT DISTINCT root_fund_id FROM mart_true_exposure {mart_where} ORDER BY root_fund_id")
         with _mart_engine().connect() as conn:
-            mart_filters = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
-            out["mart_true_exposure"] = int(
-                conn.execute(
-                    text(f"SELECT COUNT(*) FROM mart_true_exposure {mart_filters}"),
-                    params if as_of_date != "All" else None,
-                ).scalar_one()
-            )
+            roots = [str(r[0]) for r in conn.execute(mart_query, params).fetchall()]
     except Exception:
-        out["mart_true_exposure"] = 0
+        pass
 
-    return out
+    # Fallback to feeder ids from links when the mart is empty or missing.
+    return {
+        "sources": ["All"] + lists["source"],
+        "feeders": lists["feeder"],
+        "roots": roots or list(lists["feeder"]),
+    }
 
 
-@st.cache_data(ttl=20, show_spinner=False)
-def _freshness(as_of_date: str) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date}
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=8, show_spinner=False)
+def _dashboard_bundle(as_of_date: str) -> tuple[dict[str, int], pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Cards, freshness, source histogram and top-20 funds for the dashboard, on one staging connection."""
+    params = _params(as_of_date=as_of_date)
     filters = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
+    tables = ("stg_funds", "stg_holdings", "stg_fund_links")
 
-    queries = [
-        ("stg_funds", f"SELECT MAX(loaded_at) AS ts FROM stg_funds {filters}"),
-        ("stg_holdings", f"SELECT MAX(loaded_at) AS ts FROM stg_holdings {filters}"),
-        ("stg_fund_links", f"SELECT MAX(loaded_at) AS ts FROM stg_fund_links {filters}"),
-    ]
-    rows: list[dict[str, Any]] = []
-    with _staging_engine().connect() as conn:
-        for name, q in queries:
-            ts = conn.execute(text(q), params if as_of_date != "All" else None).scalar_one()
-            rows.append({"table": name, "max_loaded_at": ts})
+    summary_query = _sql(
+        f"""
+        SELECT
+            (SELECT COUNT(*) FROM stg_funds {filters}) AS stg_funds,
+            (SELECT COUNT(*) FROM stg_holdings {filters}) AS stg_holdings,
+            (SELECT COUNT(*) FROM stg_fund_links {filters}) AS stg_fund_links,
+            (SELECT MAX(loaded_at) FROM stg_funds {filters}) AS stg_funds_ts,
+            (SELECT MAX(loaded_at) FROM stg_holdings {filters}) AS stg_holdings_ts,
+            (SELECT MAX(loaded_at) FROM stg_fund_links {filters}) AS stg_fund_links_ts
+        """
+    )
+    source_query = _sql(
+        f"""
+        SELECT TRIM(source) AS source, COUNT(DISTINCT TRIM(fund_id)) AS funds
+        FROM stg_funds
+        {filters}
+        GROUP BY TRIM(source)
+        ORDER BY funds DESC, source
+        """
+    )
+    top_query = _sql(
+        f"""
+        SELECT fund_id, COUNT(*) AS holdings_count, SUM(weight) AS weight_sum
+        FROM stg_holdings
+        {filters}
+        GROUP BY fund_id
+        ORDER BY holdings_count DESC
+        LIMIT 20
+        """
+    )
+    mart_query = _sql(f"SELECT COUNT(*) FROM mart_true_exposure {filters}")
+
+    def read_summary() -> Any:
+        with _staging_engine().connect() as conn:
+            return conn.execute(summary_query, params).mappings().one()
+
+    def read_frame(query: TextClause) -> pd.DataFrame:
+        with _staging_engine().connect() as conn:
+            return pd.read_sql(query, conn, params=params)
 
-    return pd.DataFrame(rows)
+    def read_mart_count() -> int:
+        # Mart may be empty/not created yet.
+        try:
+            with _mart_engine().connect() as conn:
+                return int(conn.execute(mart_query, params).scalar_one())
+        except Exception:
+            return 0
+
+    summary, source_hist, top20, mart_rows = _gather(
+        read_summary,
+        lambda: read_frame(source_query),
+        lambda: read_frame(top_query),
+        read_mart_count,
+    )
 
+    cards: dict[str, int] = {name: int(summary[name] or 0) for name in tables}
+    cards["mart_true_exposure"] = mart_rows
+    freshness = pd.DataFrame([{"table": name, "max_loaded_at": summary[f"{name}_ts"]} for name in tables])
 
-@st.cache_data(ttl=20, show_spinner=False)
+    return cards, freshness, source_hist, top20
+
+
+def _gather(*calls: Callable[[], Any]) -> list[Any]:
+    """Run independent reads concurrently, each on its own pooled connection, so round-trips overlap."""
+    with ThreadPoolExecutor(max_workers=min(4, len(calls))) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
+@_cached_with_stats(resource=True, versioned=True, ttl=3600, max_entries=8, show_spinner=False)
 def _fund_catalog(as_of_date: str) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date}
+    params = _params(as_of_date=as_of_date)
     where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
 
     with _staging_engine().connect() as conn:
         funds = pd.read_sql(
-            text(f"SELECT fund_id, fund_name, source, currency, as_of_date FROM stg_funds {where}"),
+            _sql(f"SELECT fund_id, fund_name, source, currency FROM stg_funds {where}"),
             conn,
-            params=params if as_of_date != "All" else None,
+            params=params,
+            dtype_backend="pyarrow",
         )
 
     if funds.empty:
         return funds
 
-    funds["fund_id"] = funds["fund_id"].astype(str).str.strip()
-    funds["fund_name"] = funds["fund_name"].astype(str).str.strip()
-    funds["source"] = funds["source"].astype(str).str.strip()
-    funds["currency"] = funds["currency"].astype(str).str.strip()
-    return funds
-
-
-@st.cache_data(ttl=20, show_spinner=False)
-def _root_funds(as_of_date: str) -> list[str]:
-    params = {"as_of_date": as_of_date}
-
-    try:
-        where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
-        query = text(f"SELECT DISTINCT root_fund_id FROM mart_true_exposure {where} ORDER BY root_fund_id")
-        with _mart_engine().connect() as conn:
-            values = [str(r[0]) for r in conn.execute(query, params if as_of_date != "All" else None).fetchall()]
-        if values:
-            return values
-    except Exception:
-        pass
-
-    # Fallback to feeder ids from links.
-    where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
-    query = text(f"SELECT DISTINCT feeder_fund_id FROM stg_fund_links {where} ORDER BY feeder_fund_id")
-    with _staging_engine().connect() as conn:
-        return [str(r[0]) for r in conn.execute(query, params if as_of_date != "All" else None).fetchall()]
-
-
-@st.cache_data(ttl=20, show_spinner=False)
-def _feeder_funds(as_of_date: str) -> list[str]:
-    params = {"as_of_date": as_of_date}
-    where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
-    query = text(f"SELECT DISTINCT feeder_fund_id FROM stg_fund_links {where} ORDER BY feeder_fund_id")
-    with _staging_engine().connect() as conn:
-        return [str(r[0]) for r in conn.execute(query, params if as_of_date != "All" else None).fetchall()]
+    # Arrow strings trim in native kernels and keep NULLs as <NA> instead of "None".
+    for column in ("fund_id", "fund_name", "source", "currency"):
+        funds[column] = funds[column].astype("string[pyarrow]").str.strip()
+    # A handful of distinct sources/currencies repeat across every fund row.
+    return funds.astype({"source": "category", "currency": "category"})
 
 
-@st.cache_data(ttl=20, show_spinner=False)
+@_cached_with_stats(resource=True, versioned=True, ttl=3600, max_entries=8, show_spinner=False)
 def _asset_catalog(as_of_date: str) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date}
+    params = _params(as_of_date=as_of_date)
     where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
 
-    query = text(
+    query = _sql(
         f"""
         SELECT asset_id, asset_name, asset_type
         FROM stg_holdings
@@ -341,142 +520,338 @@ def _asset_catalog(as_of_date: str) -> pd.DataFrame:
     )
 
     with _staging_engine().connect() as conn:
-        df = pd.read_sql(query, conn, params=params if as_of_date != "All" else None)
+        df = pd.read_sql(query, conn, params=params)
 
     if df.empty:
-        return pd.DataFrame(columns=["asset_id", "asset_name", "asset_type"])
+        return pd.DataFrame(
+            {
+                "asset_id": pd.Series(dtype=object),
+                "asset_name": pd.Series(dtype=object),
+                "asset_type": pd.Categorical([], categories=[""]),
+            }
+        )
 
     df["asset_id"] = df["asset_id"].fillna("").astype(str).str.strip()
     df["asset_name"] = df["asset_name"].fillna("").astype(str).str.strip()
     df["asset_type"] = df["asset_type"].fillna("").astype(str).str.strip().str.lower()
 
-    def pick_name(values: pd.Series) -> str:
-        for v in values:
-            if v:
-                return v
-        return ""
-
-    def pick_type(values: pd.Series) -> str:
-        cleaned = [v for v in values if v]
-        if not cleaned:
-            return ""
-        return Counter(cleaned).most_common(1)[0][0]
+    # First non-empty name per asset, in row order.
+    names = df.loc[df["asset_name"].ne(""), ["asset_id", "asset_name"]].drop_duplicates("asset_id")
+
+    # Most common non-empty type per asset; ties go to the type seen first.
+    typed = df.loc[df["asset_type"].ne(""), ["asset_id", "asset_type"]]
+    types = (
+        typed.assign(row_order=np.arange(len(typed)))
+        .groupby(["asset_id", "asset_type"], as_index=False, sort=False)
+        .agg(type_count=("row_order", "size"), first_seen=("row_order", "min"))
+        .sort_values(by=["asset_id", "type_count", "first_seen"], ascending=[True, False, True])
+        .drop_duplicates("asset_id")[["asset_id", "asset_type"]]
+    )
 
     grouped = (
-        df.groupby("asset_id", as_index=False)
-        .agg(asset_name=("asset_name", pick_name), asset_type=("asset_type", pick_type))
-        .sort_values(by=["asset_id"])
-        .reset_index(drop=True)
+        pd.DataFrame({"asset_id": np.sort(df["asset_id"].unique())})
+        .merge(names, on="asset_id", how="left")
+        .merge(types, on="asset_id", how="left")
+        .fillna({"asset_name": "", "asset_type": ""})
     )
 
+    # A few distinct types repeat across every asset; "" stays a category so left-merge gaps can be filled.
+    grouped["asset_type"] = pd.Categorical(
+        grouped["asset_type"], categories=sorted(set(grouped["asset_type"]) | {""})
+    )
     return grouped
 
 
-def _build_where(spec: dict[str, Any], as_of: str, source: str, keyword: str) -> tuple[str, dict[str, Any]]:
+def _asset_type_options(assets: pd.DataFrame) -> list[str]:
+    return [t for t in assets["asset_type"].cat.categories.tolist() if t]
+
+
+@_cached_with_stats(ttl=300, show_spinner=False)
+def _fulltext_ready() -> bool:
+    """True when staging is MySQL and the FULLTEXT indexes from sql/30_indexes.sql exist."""
+    engine = _staging_engine()
+    if engine.dialect.name not in {"mysql", "mariadb"}:
+        return False
+    query = _sql(
+        """
+        SELECT DISTINCT INDEX_NAME
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND INDEX_TYPE = 'FULLTEXT'
+        """
+    )
+    try:
+        with engine.connect() as conn:
+            names = {str(r[0]) for r in conn.execute(query).fetchall()}
+    except Exception:
+        return False
+    return FULLTEXT_INDEXES <= names
+
+
+def _fulltext_term(token: str) -> str | None:
+    if not FULLTEXT_TOKEN_PATTERN.fullmatch(token) or token.lower() in FULLTEXT_STOPWORDS:
+        return None
+    return f"+{token}*"
+
+
+@_cached_with_stats(resource=True, versioned=True, ttl=3600, max_entries=8, show_spinner=False)
+def _asset_lookup(as_of_date: str) -> pd.DataFrame:
+    """Asset catalog indexed by asset_id; the index hash table is built once and reused by every lookup."""
+    return _asset_catalog(as_of_date).set_index("asset_id")
+
+
+@_cached_with_stats(resource=True, versioned=True, ttl=3600, max_entries=16, show_spinner=False)
+def _root_search_index(as_of_date: str, feeder_only: bool) -> pd.DataFrame:
+    """Root fund ids with a lowercased copy, so per-keystroke filtering is one Arrow substring scan."""
+    roots = pd.Series(_sidebar_lists(as_of_date)["feeders" if feeder_only else "roots"], dtype="string[pyarrow]")
+    return pd.DataFrame({"fund_id": roots, "_search_blob": roots.str.lower()})
+
+
+@_cached_with_stats(resource=True, versioned=True, ttl=3600, max_entries=8, show_spinner=False)
+def _asset_search_index(as_of_date: str) -> pd.DataFrame:
+    """Asset catalog plus one lowercased id/name search column, computed once per snapshot rather than per keystroke."""
+    assets = _asset_catalog(as_of_date)
+    # "\x1f" cannot be typed into the search box, so a hit never spans the id/name boundary.
+    blob = (assets["asset_id"] + "\x1f" + assets["asset_name"]).str.lower()
+    return assets.assign(_search_blob=blob.astype("string[pyarrow]"))
+
+
+@lru_cache(maxsize=256)
+def _where_template(dataset: str, has_as_of: bool, has_source: bool, token_modes: tuple[bool, ...]) -> str:
+    spec = DATASET_SPECS[dataset]
     conditions: list[str] = []
-    params: dict[str, Any] = {}
 
-    if as_of != "All":
+    if has_as_of:
         conditions.append(f"{spec['as_of_expr']} = :as_of_date")
-        params["as_of_date"] = as_of
 
-    if source != "All" and spec.get("source_expr"):
+    if has_source:
         conditions.append(f"{spec['source_expr']} = :source")
-        params["source"] = source
 
-    cleaned = keyword.strip()
-    if cleaned:
+    if token_modes:
+        # One FULLTEXT index covers every column: all prefix terms go into a single MATCH.
+        single_match = len(spec["fulltext_groups"]) == 1
         groups: list[str] = []
-        for idx, token in enumerate(cleaned.split()):
-            key = f"kw{idx}"
-            params[key] = f"%{token}%"
-            inner = " OR ".join(f"CAST({expr} AS CHAR) LIKE :{key}" for expr in spec["search_exprs"])
-            groups.append(f"({inner})")
+        if single_match and any(token_modes):
+            groups.append("(" + FULLTEXT_TEMPLATES[dataset].format(key="kw_match") + ")")
+        for idx, fulltext in enumerate(token_modes):
+            if fulltext and single_match:
+                continue
+            template = FULLTEXT_TEMPLATES[dataset] if fulltext else SEARCH_TEMPLATES[dataset]
+            groups.append("(" + template.format(key=f"kw{idx}") + ")")
         conditions.append("(" + " AND ".join(groups) + ")")
 
     if not conditions:
-        return "", params
+        return ""
+
+    return "WHERE " + " AND ".join(conditions)
+
+
+def _build_where(dataset: str, as_of: str, source: str, keyword: str) -> tuple[str, dict[str, Any]]:
+    spec = DATASET_SPECS[dataset]
+    params: dict[str, Any] = {}
+
+    has_as_of = as_of != "All"
+    if has_as_of:
+        params["as_of_date"] = as_of
+
+    has_source = source != "All" and bool(spec.get("source_expr"))
+    if has_source:
+        params["source"] = source
+
+    # Index-friendly prefix MATCH where FULLTEXT is available; LIKE for short/punctuated tokens and SQLite.
+    fulltext = bool(keyword.strip()) and _fulltext_ready()
+    single_match = len(spec["fulltext_groups"]) == 1
+    token_modes: list[bool] = []
+    match_terms: list[str] = []
+    for idx, token in enumerate(keyword.lower().split()):
+        term = _fulltext_term(token) if fulltext else None
+        token_modes.append(term is not None)
+        if term is None:
+            params[f"kw{idx}"] = f"%{token}%"
+        elif single_match:
+            match_terms.append(term)
+        else:
+            params[f"kw{idx}"] = term
+    if match_terms:
+        params["kw_match"] = " ".join(match_terms)
 
-    return "WHERE " + " AND ".join(conditions), params
+    # Identical filter shapes share one WHERE string, and therefore one cached clause.
+    return _where_template(dataset, has_as_of, has_source, tuple(token_modes)), params
 
 
 def _sanitize_page_size(raw: int) -> int:
     return 25 if raw < 1 else min(raw, 500)
 
 
-@st.cache_data(ttl=10, show_spinner=False)
-def _run_explorer_query(
+def _read_arrow(engine: Any, statement: TextClause, params: dict[str, Any]) -> pd.DataFrame | None:
+    """Read through connectorx into Arrow-backed columns, or None when the fast path is unavailable."""
+    if cx is None or engine.dialect.name not in {"mysql", "mariadb"}:
+        return None
+    # connectorx takes plain SQL, so binds are rendered (and escaped) by the MySQL dialect.
+    rendered = render_mysql_literal(statement, params, engine.dialect)
+    url = engine.url.set(drivername="mysql").render_as_string(hide_password=False)
+    table = cx.read_sql(url, rendered, return_type="arrow")
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
+def _explorer_count(dataset: str, as_of: str, source: str, keyword: str) -> int:
+    # Cached apart from the page query so paging/sorting the same filters skips the COUNT.
+    spec = DATASET_SPECS[dataset]
+    where_sql, params = _build_where(dataset, as_of, source, keyword)
+    with _staging_engine().connect() as conn:
+        return int(conn.execute(_sql(f"SELECT COUNT(*) {spec['from_sql']} {where_sql}"), params).scalar_one())
+
+
+def _keyset_condition(sort_expr: str | None, key_exprs: list[str], descending: bool, sort_is_null: bool) -> str:
+    """Seek predicate for rows after the cursor under ``ORDER BY sort, keys`` (NULL sorts first ascending)."""
+    op = "<" if descending else ">"
+    keys = ", ".join(key_exprs)
+    cursor_keys = ", ".join(f":cur_k{idx}" for idx in range(len(key_exprs)))
+    if sort_expr is None:
+        return f"({keys}) {op} ({cursor_keys})"
+    if sort_is_null:
+        after_nulls = f"({sort_expr} IS NULL AND ({keys}) {op} ({cursor_keys}))"
+        return after_nulls if descending else f"({after_nulls} OR {sort_expr} IS NOT NULL)"
+    after_value = f"({sort_expr}, {keys}) {op} (:cur_sort, {cursor_keys})"
+    return f"({after_value} OR {sort_expr} IS NULL)" if descending else after_value
+
+
+def _cursor_value(value: Any) -> Any:
+    # Arrow scalars come back as pandas NA/Timestamp; cursors must be plain, literal-renderable values.
+    if pd.isna(value):
+        return None
+    return value.to_pydatetime() if isinstance(value, pd.Timestamp) else value
+
+
+@_cached_with_stats(ttl=10, show_spinner=False)
+def _explorer_page(
     dataset: str,
     as_of: str,
     source: str,
     keyword: str,
     sort_by: str,
     sort_desc: bool,
-    page: int,
     page_size: int,
-) -> tuple[pd.DataFrame, int, int]:
+    after: tuple[Any, ...] | None = None,
+    offset: int = 0,
+) -> tuple[pd.DataFrame, tuple[Any, ...] | None]:
+    """One explorer page and the cursor that continues after its last row.
+
+    With ``after`` the page is read by seeking past that cursor; otherwise ``offset`` rows are skipped.
+    """
     spec = DATASET_SPECS[dataset]
-    valid_sort = {c[0] for c in spec["columns"]}
-    sort_field = sort_by if sort_by in valid_sort else spec["default_sort"]
+    columns = {name: expr for name, expr, _ in spec["columns"]}
+    sort_field = sort_by if sort_by in columns else spec["default_sort"]
+    key_fields = [name for name in spec["key_columns"] if name != sort_field]
+    order_fields = [sort_field] + key_fields
 
-    where_sql, params = _build_where(spec, as_of, source, keyword)
-    select_sql = ", ".join(f"{expr} AS {name}" for name, expr, _ in spec["columns"])
+    # Audit columns such as loaded_at are only read when the user sorts by them.
+    projection = set(spec.get("default_projection", columns)) | {sort_field}
 
-    count_q = f"SELECT COUNT(*) {spec['from_sql']} {where_sql}"
+    where_sql, params = _build_where(dataset, as_of, source, keyword)
+    select_sql = ", ".join(f"{expr} AS {name}" for name, expr, _ in spec["columns"] if name in projection)
     direction = "DESC" if sort_desc else "ASC"
-    data_q = (
-        f"SELECT {select_sql} {spec['from_sql']} {where_sql} "
-        f"ORDER BY {sort_field} {direction} "
-        "LIMIT :limit_rows OFFSET :offset_rows"
-    )
-
-    with _staging_engine().connect() as conn:
-        total_rows = int(conn.execute(text(count_q), params).scalar_one())
-        total_pages = max(1, math.ceil(total_rows / page_size)) if total_rows else 1
-
-        actual_page = max(1, min(page, total_pages))
-        run_params = dict(params)
-        run_params["limit_rows"] = page_size
-        run_params["offset_rows"] = (actual_page - 1) * page_size
-
-        rows = conn.execute(text(data_q), run_params).mappings().all()
-        df = pd.DataFrame([dict(r) for r in rows])
-
-    if not df.empty:
-        for c in df.columns:
-            if "weight" in c or "confidence" in c:
-                df[c] = pd.to_numeric(df[c], errors="ignore")
-
-    return df, total_rows, total_pages
+    order_sql = ", ".join(f"{columns[name]} {direction}" for name in order_fields)
+
+    run_params = dict(params)
+    run_params["limit_rows"] = page_size
+    if after is not None:
+        if sort_field in spec["key_columns"]:
+            # Sorting by a key column: the whole cursor is one non-null row value.
+            seek = _keyset_condition(None, [columns[name] for name in order_fields], sort_desc, False)
+            key_values = after
+        else:
+            seek = _keyset_condition(columns[sort_field], [columns[name] for name in key_fields], sort_desc, after[0] is None)
+            key_values = after[1:]
+            if after[0] is not None:
+                run_params["cur_sort"] = after[0]
+        where_sql = f"{where_sql} AND {seek}" if where_sql else f"WHERE {seek}"
+        run_params.update({f"cur_k{idx}": value for idx, value in enumerate(key_values)})
+        page_sql = "LIMIT :limit_rows"
+    else:
+        run_params["offset_rows"] = offset
+        page_sql = "LIMIT :limit_rows OFFSET :offset_rows"
+
+    data_q = f"SELECT {select_sql} {spec['from_sql']} {where_sql} ORDER BY {order_sql} {page_sql}"
+    engine = _staging_engine()
+    df = _read_arrow(engine, _sql(data_q), run_params)
+    if df is not None:
+        last = df.iloc[-1] if len(df) == page_size else None
+        next_after = None if last is None else tuple(_cursor_value(last[name]) for name in order_fields)
+        return df, next_after
+
+    with engine.connect() as conn:
+        result = conn.execute(_sql(data_q), run_params)
+        names = list(result.keys())
+        rows = result.fetchall()
+    # DECIMAL weight/confidence (or an all-NULL page of them) land as float64 in one astype.
+    numeric = {name: "float64" for name in names if "weight" in name or "confidence" in name}
+    df = pd.DataFrame.from_records(rows, columns=names).astype(numeric)
+
+    next_after = tuple(rows[-1][names.index(name)] for name in order_fields) if len(rows) == page_size else None
+    return df, next_after
+
+
+@_cached_with_stats(ttl=60, show_spinner=False)
+def _explorer_page_csv(
+    dataset: str,
+    as_of: str,
+    source: str,
+    keyword: str,
+    sort_by: str,
+    sort_desc: bool,
+    page_size: int,
+    after: tuple[Any, ...] | None = None,
+    offset: int = 0,
+) -> bytes:
+    # Keyed on the page arguments, so reruns of the same page skip re-encoding.
+    df, _ = _explorer_page(dataset, as_of, source, keyword, sort_by, sort_desc, page_size, after, offset)
+    return _csv_bytes(df)
+
+
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """Encode with Arrow's multi-threaded CSV writer; timestamps are rendered as pandas' to_csv text."""
+    # Arrow prints timestamps at fixed nanosecond width with a Z suffix; pandas keeps the values' own precision.
+    timestamps = [
+        name
+        for name, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(dtype)
+    ]
+    if timestamps:
+        df = df.assign(**{name: df[name].astype(str).where(df[name].notna(), None) for name in timestamps})
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink)
+    return sink.getvalue().to_pybytes()
 
 
-@st.cache_data(ttl=10, show_spinner=False)
-def _direct_holdings(fund_id: str, as_of_date: str) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date, "fund_id": fund_id}
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
+def _direct_holdings(fund_id: str, as_of_date: str, top_n: int = DIRECT_ROWS_LIMIT) -> pd.DataFrame:
+    params = _params(as_of_date=as_of_date, fund_id=fund_id, top_n=top_n)
     where = "WHERE fund_id = :fund_id"
     if as_of_date != "All":
         where += " AND as_of_date = :as_of_date"
 
-    query = text(
+    query = _sql(
         f"""
-        SELECT fund_id, asset_id, asset_name, asset_type, weight
+        SELECT fund_id, asset_id, asset_name, asset_type, CAST(weight AS DOUBLE) AS weight
         FROM stg_holdings
         {where}
         ORDER BY weight DESC
+        LIMIT :top_n
         """
     )
     with _staging_engine().connect() as conn:
-        return pd.read_sql(query, conn, params=params if as_of_date != "All" else {"fund_id": fund_id})
+        return pd.read_sql(query, conn, params=params)
 
 
-@st.cache_data(ttl=10, show_spinner=False)
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
 def _true_exposure_for_fund(fund_id: str, as_of_date: str, min_weight: float) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date, "fund_id": fund_id, "min_weight": min_weight}
+    params = _params(as_of_date=as_of_date, fund_id=fund_id, min_weight=min_weight)
     where = "WHERE root_fund_id = :fund_id AND effective_weight >= :min_weight"
     if as_of_date != "All":
         where += " AND as_of_date = :as_of_date"
 
-    query = text(
+    query = _sql(
         f"""
         SELECT root_fund_id, final_asset_id, effective_weight, path_depth
         FROM mart_true_exposure
@@ -486,24 +861,61 @@ def _true_exposure_for_fund(fund_id: str, as_of_date: str, min_weight: float) ->
     )
 
     with _mart_engine().connect() as conn:
-        df = pd.read_sql(query, conn, params=params if as_of_date != "All" else {"fund_id": fund_id, "min_weight": min_weight})
+        return pd.read_sql(query, conn, params=params, dtype=MART_EXPOSURE_DTYPES)
 
-    if df.empty:
-        return df
 
-    df["effective_weight"] = pd.to_numeric(df["effective_weight"], errors="coerce")
-    df["path_depth"] = pd.to_numeric(df["path_depth"], errors="coerce")
-    return df
+def _enrich_exposure(
+    exposure: pd.DataFrame, asset_lookup: pd.DataFrame, asset_types: tuple[str, ...], aum: float | None
+) -> pd.DataFrame:
+    labels = asset_lookup.reindex(exposure["final_asset_id"].to_numpy())
+    enriched = exposure.assign(asset_name=labels["asset_name"].to_numpy(), asset_type=labels["asset_type"].array)
+    if asset_types:
+        enriched = enriched[enriched["asset_type"].isin(asset_types)]
+
+    enriched = enriched.sort_values(by=["effective_weight"], ascending=False).reset_index(drop=True)
+    if aum is not None:
+        enriched["notional_value"] = enriched["effective_weight"] * aum
+    return enriched
+
+
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
+def _fund_exposure_csv(
+    fund_id: str, as_of_date: str, min_weight: float, asset_types: tuple[str, ...], aum: float | None
+) -> bytes:
+    exposure = _true_exposure_for_fund(fund_id, as_of_date, min_weight)
+    enriched = _enrich_exposure(exposure, _asset_lookup(as_of_date), asset_types, aum)
+    return _csv_bytes(enriched)
+
+
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
+def _fund_exposure_chart(
+    fund_id: str, as_of_date: str, min_weight: float, asset_types: tuple[str, ...]
+) -> dict[str, Any]:
+    """Vega-Lite spec for the top-20 exposure bar chart, built once per filter combination."""
+    exposure = _true_exposure_for_fund(fund_id, as_of_date, min_weight)
+    enriched = _enrich_exposure(exposure, _asset_lookup(as_of_date), asset_types, None)
+
+    chart_df = enriched.head(20).copy()
+    chart_df["label"] = chart_df["final_asset_id"].astype(str)
+    if "asset_name" in chart_df.columns:
+        chart_df["label"] = chart_df["label"] + " | " + chart_df["asset_name"].fillna("").astype(str)
+
+    chart = alt.Chart(chart_df).mark_bar(color="#10b981").encode(
+        x=alt.X("effective_weight:Q", title="Effective Weight"),
+        y=alt.Y("label:N", sort="-x", title="Top Assets"),
+        tooltip=["final_asset_id:N", "asset_name:N", "asset_type:N", "effective_weight:Q", "path_depth:Q"],
+    )
+    return chart.to_dict()
 
 
-@st.cache_data(ttl=10, show_spinner=False)
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
 def _funds_exposed_to_asset(asset_id: str, as_of_date: str, min_weight: float) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date, "asset_id": asset_id, "min_weight": min_weight}
+    params = _params(as_of_date=as_of_date, asset_id=asset_id, min_weight=min_weight)
     where = "WHERE final_asset_id = :asset_id AND effective_weight >= :min_weight"
     if as_of_date != "All":
         where += " AND as_of_date = :as_of_date"
 
-    query = text(
+    query = _sql(
         f"""
         SELECT root_fund_id, effective_weight, path_depth
         FROM mart_true_exposure
@@ -513,37 +925,36 @@ def _funds_exposed_to_asset(asset_id: str, as_of_date: str, min_weight: float) -
     )
 
     with _mart_engine().connect() as conn:
-        df = pd.read_sql(query, conn, params=params if as_of_date != "All" else {"asset_id": asset_id, "min_weight": min_weight})
-
-    if df.empty:
-        return df
+        return pd.read_sql(query, conn, params=params, dtype=MART_EXPOSURE_DTYPES)
 
-    df["effective_weight"] = pd.to_numeric(df["effective_weight"], errors="coerce")
-    df["path_depth"] = pd.to_numeric(df["path_depth"], errors="coerce")
-    return df
 
-
-@st.cache_data(ttl=10, show_spinner=False)
-def _direct_holders_of_asset(asset_id: str, as_of_date: str) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date, "asset_id": asset_id}
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
+def _direct_holders_of_asset(asset_id: str, as_of_date: str, top_n: int = DIRECT_ROWS_LIMIT) -> pd.DataFrame:
+    params = _params(as_of_date=as_of_date, asset_id=asset_id, top_n=top_n)
     where = "WHERE asset_id = :asset_id"
     if as_of_date != "All":
         where += " AND as_of_date = :as_of_date"
 
-    query = text(
+    query = _sql(
         f"""
-        SELECT fund_id, asset_id, asset_name, asset_type, weight
+        SELECT fund_id, asset_id, asset_name, asset_type, CAST(weight AS DOUBLE) AS weight
         FROM stg_holdings
         {where}
         ORDER BY weight DESC
+        LIMIT :top_n
         """
     )
 
     with _staging_engine().connect() as conn:
-        return pd.read_sql(query, conn, params=params if as_of_date != "All" else {"asset_id": asset_id})
+        return pd.read_sql(query, conn, params=params)
+
 
+def _like_contains(value: str) -> str:
+    escaped = value.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    return f"%{escaped}%"
 
-@st.cache_data(ttl=10, show_spinner=False)
+
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
 def _top_assets(
     as_of_date: str,
     asset_types: list[str],
@@ -553,98 +964,213 @@ def _top_assets(
     aum_map: dict[str, float] | None,
     root_fund_ids: set[str] | None,
 ) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date}
-    where = "" if as_of_date == "All" else "WHERE e.as_of_date = :as_of_date"
+    output_columns = ["asset_id", "asset_name", "asset_type", "total_weight", "total_value"]
 
-    query = text(
-        f"""
-        SELECT e.root_fund_id, e.final_asset_id, e.effective_weight
-        FROM mart_true_exposure e
-        {where}
-        """
-    )
+    conditions: list[str] = []
+    params: dict[str, Any] = {}
+    if as_of_date != "All":
+        conditions.append("e.as_of_date = :as_of_date")
+        params["as_of_date"] = as_of_date
+    if root_fund_ids:
+        conditions.append("e.root_fund_id IN :root_fund_ids")
+        params["root_fund_ids"] = sorted(root_fund_ids)
+    if contains.strip():
+        conditions.append("e.final_asset_id LIKE :contains ESCAPE '!'")
+        params["contains"] = _like_contains(contains.strip())
+    where = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+    metric = "total_value" if aum_map else "total_weight"
+    if aum_map:
+        # AUM weighting stays in pandas over the per-(asset, root fund) sums so the UI needs read-only grants.
+        sql = (
+            "SELECT e.final_asset_id, e.root_fund_id, SUM(e.effective_weight) AS total_weight "
+            f"FROM mart_true_exposure e {where} GROUP BY e.final_asset_id, e.root_fund_id"
+        )
+    else:
+        # Asset type / Thai filters need the staging catalog, so only unfiltered rankings are limited in SQL.
+        limit = "" if asset_types or thai_only else "ORDER BY total_weight DESC LIMIT :top_n"
+        if limit:
+            params["top_n"] = top_n
+        sql = (
+            "SELECT e.final_asset_id, SUM(e.effective_weight) AS total_weight "
+            f"FROM mart_true_exposure e {where} GROUP BY e.final_asset_id {limit}"
+        )
+
+    query = _sql(sql, expanding=("root_fund_ids",) if root_fund_ids else ())
 
     with _mart_engine().connect() as conn:
-        exposures = pd.read_sql(query, conn, params=params if as_of_date != "All" else None)
+        exposures = pd.read_sql(query, conn, params=params, dtype={"total_weight": "float64"})
 
-    if exposures.empty:
-        return pd.DataFrame(columns=["asset_id", "asset_name", "asset_type", "total_weight", "total_value"])
+    if aum_map and not exposures.empty:
+        exposures["total_value"] = exposures["total_weight"].to_numpy() * _aum_values(
+            exposures["root_fund_id"], aum_map
+        )
+        exposures = exposures.groupby("final_asset_id", as_index=False, sort=False)[
+            ["total_weight", "total_value"]
+        ].sum()
 
-    exposures["effective_weight"] = pd.to_numeric(exposures["effective_weight"], errors="coerce").fillna(0.0)
-    if root_fund_ids:
-        exposures = exposures[exposures["root_fund_id"].astype(str).isin(root_fund_ids)].copy()
+    if exposures.empty:
+        return pd.DataFrame(columns=output_columns)
 
     assets = _asset_catalog(as_of_date)
-    merged = exposures.merge(assets, left_on="final_asset_id", right_on="asset_id", how="left")
+    merged = (
+        exposures.merge(assets, left_on="final_asset_id", right_on="asset_id", how="left")
+        .drop(columns=["asset_id"])
+        .rename(columns={"final_asset_id": "asset_id"})
+    )
+    merged["asset_name"] = merged["asset_name"].fillna("")
+    merged["asset_type"] = merged["asset_type"].fillna("")
 
     if asset_types:
         merged = merged[merged["asset_type"].isin(asset_types)]
 
     if thai_only:
-        pattern = re.compile(r"(\\.BK$|\\bBK\\b|\\-BK$)", re.IGNORECASE)
-        merged = merged[
-            merged["final_asset_id"].astype(str).str.contains(pattern)
-            | merged["asset_name"].astype(str).str.contains(pattern)
-        ]
-
-    if contains.strip():
-        merged = merged[merged["final_asset_id"].astype(str).str.contains(contains.strip(), case=False, regex=False)]
+        by_id = merged["asset_id"].astype(str).str.contains(THAI_TICKER_PATTERN, na=False).to_numpy()
+        by_name = merged["asset_name"].astype(str).str.contains(THAI_TICKER_PATTERN, na=False).to_numpy()
+        merged = merged[by_id | by_name]
+
+    if not aum_map:
+        merged = merged.assign(total_value=0.0)
+    return merged.sort_values(by=[metric], ascending=False).head(top_n)[output_columns].reset_index(drop=True)
+
+
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
+def _materialized_top_assets(
+    as_of_date: str, asset_types: list[str], top_n: int, feeder_only: bool
+) -> pd.DataFrame | None:
+    """Unweighted top assets from the ETL-built ``mart_top_assets``; None when the partition is not there."""
+    params: dict[str, Any] = {
+        "as_of_date": as_of_date,
+        "root_scope": "feeders" if feeder_only else "all",
+        "top_n": top_n,
+    }
+    type_filter = ""
+    if asset_types:
+        type_filter = "AND asset_type IN :asset_types"
+        params["asset_types"] = list(asset_types)
+    query = _sql(
+        f"""
+        SELECT asset_id, asset_name, asset_type, total_weight
+        FROM mart_top_assets
+        WHERE as_of_date = :as_of_date AND root_scope = :root_scope {type_filter}
+        ORDER BY total_weight DESC, asset_id
+        LIMIT :top_n
+        """,
+        expanding=("asset_types",) if asset_types else (),
+    )
+    try:
+        with _mart_engine().connect() as conn:
+            top = pd.read_sql(query, conn, params=params, dtype={"total_weight": "float64"})
+    except Exception:
+        return None
+    if top.empty:
+        return None
+    return top.assign(total_value=0.0)[["asset_id", "asset_name", "asset_type", "total_weight", "total_value"]]
 
-    merged["total_value"] = 0.0
-    if aum_map:
-        merged["aum"] = merged["root_fund_id"].map(aum_map).fillna(0.0)
-        merged["total_value"] = merged["effective_weight"] * merged["aum"]
 
-    grouped = (
-        merged.groupby(["final_asset_id", "asset_name", "asset_type"], as_index=False)
-        .agg(total_weight=("effective_weight", "sum"), total_value=("total_value", "sum"))
-        .rename(columns={"final_asset_id": "asset_id"})
-        .sort_values(by=["total_value" if aum_map else "total_weight"], ascending=False)
-        .head(top_n)
-        .reset_index(drop=True)
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
+def _materialized_top_masters(as_of_date: str, top_n: int) -> pd.DataFrame | None:
+    """Score-ranked master funds from the ETL-built ``mart_top_masters``; None when the partition is not there."""
+    query = _sql(
+        """
+        SELECT master_fund_id, master_name, master_source, score, feeder_count
+        FROM mart_top_masters
+        WHERE as_of_date = :as_of_date AND master_rank <= :top_n
+        ORDER BY master_rank
+        """
     )
-
-    return grouped
+    try:
+        with _mart_engine().connect() as conn:
+            top = pd.read_sql(
+                query,
+                conn,
+                params={"as_of_date": as_of_date, "top_n": top_n},
+                dtype={"score": "float64", "feeder_count": "int64"},
+            )
+    except Exception:
+        return None
+    if top.empty:
+        return None
+    return top.assign(total_value=0.0)[
+        ["master_fund_id", "master_name", "master_source", "score", "total_value", "feeder_count"]
+    ]
 
 
-@st.cache_data(ttl=10, show_spinner=False)
+@_cached_with_stats(versioned=True, ttl=3600, max_entries=256, show_spinner=False)
 def _top_master_funds(as_of_date: str, top_n: int, aum_map: dict[str, float] | None) -> pd.DataFrame:
-    params = {"as_of_date": as_of_date}
+    output_columns = ["master_fund_id", "master_name", "master_source", "score", "total_value", "feeder_count"]
+    params = _params(as_of_date=as_of_date)
     where = "" if as_of_date == "All" else "WHERE l.as_of_date = :as_of_date"
+    from_sql = (
+        "FROM stg_fund_links l "
+        "LEFT JOIN stg_funds mf ON l.master_fund_id = mf.fund_id AND l.as_of_date = mf.as_of_date"
+    )
+
+    if not aum_map:
+        # Score-only ranking: aggregate in the database and ship just the top rows.
+        params["top_n"] = top_n
+        query = _sql(
+            f"""
+            SELECT l.master_fund_id,
+                   COALESCE(mf.fund_name, '') AS master_name,
+                   COALESCE(mf.source, '') AS master_source,
+                   SUM(
+                       CASE
+                           WHEN l.confidence IS NULL OR l.confidence < 0 THEN 0
+                           WHEN l.confidence > 1 THEN 1
+                           ELSE l.confidence
+                       END
+                   ) AS score,
+                   COUNT(DISTINCT l.feeder_fund_id) AS feeder_count
+            {from_sql}
+            {where}
+            GROUP BY l.master_fund_id, COALESCE(mf.fund_name, ''), COALESCE(mf.source, '')
+            ORDER BY score DESC, l.master_fund_id
+            LIMIT :top_n
+            """
+        )
+        with _staging_engine().connect() as conn:
+            grouped = pd.read_sql(query, conn, params=params)
 
-    query = text(
+        if grouped.empty:
+            return pd.DataFrame(columns=output_columns)
+
+        grouped["score"] = pd.to_numeric(grouped["score"], errors="coerce").fillna(0.0)
+        grouped["feeder_count"] = pd.to_numeric(grouped["feeder_count"], errors="coerce").fillna(0).astype(int)
+        grouped["total_value"] = 0.0
+        return grouped[output_columns]
+
+    query = _sql(
         f"""
         SELECT l.feeder_fund_id, l.master_fund_id, l.confidence,
                mf.fund_name AS master_name, mf.source AS master_source
-        FROM stg_fund_links l
-        LEFT JOIN stg_funds mf ON l.master_fund_id = mf.fund_id AND l.as_of_date = mf.as_of_date
+        {from_sql}
         {where}
         """
     )
 
     with _staging_engine().connect() as conn:
-        df = pd.read_sql(query, conn, params=params if as_of_date != "All" else None)
+        df = pd.read_sql(query, conn, params=params)
 
     if df.empty:
-        return pd.DataFrame(columns=["master_fund_id", "master_name", "master_source", "score", "total_value", "feeder_count"])
+        return pd.DataFrame(columns=output_columns)
 
+    df["master_name"] = df["master_name"].fillna("")
+    df["master_source"] = df["master_source"].fillna("")
     df["confidence"] = pd.to_numeric(df["confidence"], errors="coerce").fillna(0.0)
     df["score"] = df["confidence"].clip(lower=0.0, upper=1.0)
-
-    df["total_value"] = 0.0
-    if aum_map:
-        df["aum"] = df["feeder_fund_id"].map(aum_map).fillna(0.0)
-        df["total_value"] = df["score"] * df["aum"]
+    df["aum"] = _aum_values(df["feeder_fund_id"], aum_map)
+    df["total_value"] = df["score"].to_numpy() * df["aum"].to_numpy()
 
     grouped = (
         df.groupby(["master_fund_id", "master_name", "master_source"], as_index=False)
         .agg(score=("score", "sum"), total_value=("total_value", "sum"), feeder_count=("feeder_fund_id", "nunique"))
-        .sort_values(by=["total_value" if aum_map else "score"], ascending=False)
+        .sort_values(by=["total_value"], ascending=False)
         .head(top_n)
         .reset_index(drop=True)
     )
 
-    return grouped
+    return grouped[output_columns]
 
 
 def _load_aum_mapping(uploaded: Any) -> dict[str, float] | None:
@@ -665,22 +1191,44 @@ def _load_aum_mapping(uploaded: Any) -> dict[str, float] | None:
     df["fund_id"] = df["fund_id"].astype(str).str.strip()
     df["aum"] = pd.to_numeric(df["aum"], errors="coerce").fillna(0.0)
 
-    mapping = {row.fund_id: float(row.aum) for row in df.itertuples(index=False)}
-    return mapping
+    return dict(zip(df["fund_id"].tolist(), df["aum"].astype("float64").tolist()))
+
+
+def _aum_values(fund_ids: pd.Series, aum_map: dict[str, float]) -> np.ndarray:
+    """Gather AUM per row in one vectorised reindex; unmapped funds get 0."""
+
+    lookup = pd.Series(aum_map, dtype="float64")
+    return lookup.reindex(fund_ids.astype(str).to_numpy()).fillna(0.0).to_numpy()
+
+
+EDGE_KINDS = ("holding", "link")
 
 
-@st.cache_data(ttl=10, show_spinner=False)
-def _graph_edges(as_of_date: str) -> dict[str, list[tuple[str, float, bool, str]]]:
-    """Build adjacency: fund -> [(child_id, weight, child_is_fund, edge_kind)]."""
+@dataclass(frozen=True, eq=False)
+class TraceGraph:
+    """CSR adjacency: edges of node ``i`` sit at positions ``indptr[i]:indptr[i + 1]``."""
 
-    params = {"as_of_date": as_of_date}
+    node_ids: np.ndarray
+    node_index: dict[str, int]
+    indptr: np.ndarray
+    child_codes: np.ndarray
+    weights: np.ndarray
+    child_is_fund: np.ndarray
+    edge_kinds: np.ndarray
+
+
+@_cached_with_stats(resource=True, versioned=True, ttl=3600, max_entries=4, show_spinner=False)
+def _graph_edges(as_of_date: str) -> TraceGraph:
+    """Build adjacency: fund -> children, with weight, child_is_fund and edge kind per edge."""
+
+    params = _params(as_of_date=as_of_date)
 
     h_where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
     l_where = "" if as_of_date == "All" else "WHERE as_of_date = :as_of_date"
 
     with _staging_engine().connect() as conn:
         holdings = pd.read_sql(
-            text(
+            _sql(
                 f"""
                 SELECT fund_id, asset_id, asset_type, weight
                 FROM stg_holdings
@@ -688,10 +1236,10 @@ def _graph_edges(as_of_date: str) -> dict[str, list[tuple[str, float, bool, str]
                 """
             ),
             conn,
-            params=params if as_of_date != "All" else None,
+            params=params,
         )
         links = pd.read_sql(
-            text(
+            _sql(
                 f"""
                 SELECT feeder_fund_id, master_fund_id, confidence
                 FROM stg_fund_links
@@ -699,40 +1247,86 @@ def _graph_edges(as_of_date: str) -> dict[str, list[tuple[str, float, bool, str]
                 """
             ),
             conn,
-            params=params if as_of_date != "All" else None,
+            params=params,
         )
 
-    edges: dict[str, list[tuple[str, float, bool, str]]] = {}
+    parent_parts: list[np.ndarray] = []
+    child_parts: list[np.ndarray] = []
+    weight_parts: list[np.ndarray] = []
+    is_fund_parts: list[np.ndarray] = []
+    kind_parts: list[np.ndarray] = []
 
     if not holdings.empty:
-        holdings["fund_id"] = holdings["fund_id"].fillna("").astype(str).str.strip()
-        holdings["asset_id"] = holdings["asset_id"].fillna("").astype(str).str.strip()
-        holdings["asset_type"] = holdings["asset_type"].fillna("").astype(str).str.strip().str.lower()
-        holdings["weight"] = pd.to_numeric(holdings["weight"], errors="coerce").fillna(0.0)
-
-        for row in holdings.itertuples(index=False):
-            if not row.fund_id or not row.asset_id:
-                continue
-            child_is_fund = row.asset_type in FUND_LIKE_TYPES
-            edges.setdefault(row.fund_id, []).append((row.asset_id, float(row.weight), bool(child_is_fund), "holding"))
+        fund_ids = holdings["fund_id"].fillna("").astype(str).str.strip().to_numpy(dtype=object)
+        asset_ids = holdings["asset_id"].fillna("").astype(str).str.strip().to_numpy(dtype=object)
+        asset_types = holdings["asset_type"].fillna("").astype(str).str.strip().str.lower()
+        weights = pd.to_numeric(holdings["weight"], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+        child_is_fund = asset_types.isin(FUND_LIKE_TYPES).to_numpy()
+
+        keep = (fund_ids != "") & (asset_ids != "")
+        parent_parts.append(fund_ids[keep])
+        child_parts.append(asset_ids[keep])
+        weight_parts.append(weights[keep])
+        is_fund_parts.append(child_is_fund[keep])
+        kind_parts.append(np.zeros(int(keep.sum()), dtype=np.uint8))
 
     if not links.empty:
-        links["feeder_fund_id"] = links["feeder_fund_id"].fillna("").astype(str).str.strip()
-        links["master_fund_id"] = links["master_fund_id"].fillna("").astype(str).str.strip()
-        links["confidence"] = pd.to_numeric(links["confidence"], errors="coerce").fillna(1.0).clip(lower=0.0, upper=1.0)
+        feeder_ids = links["feeder_fund_id"].fillna("").astype(str).str.strip().to_numpy(dtype=object)
+        master_ids = links["master_fund_id"].fillna("").astype(str).str.strip().to_numpy(dtype=object)
+        confidences = (
+            pd.to_numeric(links["confidence"], errors="coerce")
+            .fillna(1.0)
+            .clip(lower=0.0, upper=1.0)
+            .to_numpy(dtype=np.float64)
+        )
 
-        for row in links.itertuples(index=False):
-            if not row.feeder_fund_id or not row.master_fund_id:
-                continue
-            edges.setdefault(row.feeder_fund_id, []).append((row.master_fund_id, float(row.confidence), True, "link"))
+        keep = (feeder_ids != "") & (master_ids != "")
+        parent_parts.append(feeder_ids[keep])
+        child_parts.append(master_ids[keep])
+        weight_parts.append(confidences[keep])
+        is_fund_parts.append(np.ones(int(keep.sum()), dtype=bool))
+        kind_parts.append(np.ones(int(keep.sum()), dtype=np.uint8))
+
+    return _build_trace_graph(
+        np.concatenate(parent_parts) if parent_parts else np.array([], dtype=object),
+        np.concatenate(child_parts) if child_parts else np.array([], dtype=object),
+        np.concatenate(weight_parts) if weight_parts else np.array([], dtype=np.float64),
+        np.concatenate(is_fund_parts) if is_fund_parts else np.array([], dtype=bool),
+        np.concatenate(kind_parts) if kind_parts else np.array([], dtype=np.uint8),
+    )
 
-    return edges
+
+def _build_trace_graph(
+    parent_ids: np.ndarray,
+    child_ids: np.ndarray,
+    weights: np.ndarray,
+    child_is_fund: np.ndarray,
+    edge_kinds: np.ndarray,
+) -> TraceGraph:
+    codes, node_ids = pd.factorize(np.concatenate([parent_ids, child_ids]), sort=False)
+    parent_codes = codes[: len(parent_ids)]
+    child_codes = codes[len(parent_ids) :]
+
+    # Stable sort keeps each fund's edges in load order (holdings, then links).
+    order = np.argsort(parent_codes, kind="stable")
+    indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(parent_codes, minlength=len(node_ids)), out=indptr[1:])
+
+    return TraceGraph(
+        node_ids=np.asarray(node_ids, dtype=object),
+        node_index={node_id: code for code, node_id in enumerate(node_ids.tolist())},
+        indptr=indptr,
+        child_codes=child_codes[order].astype(np.int64),
+        weights=weights[order],
+        child_is_fund=child_is_fund[order],
+        edge_kinds=edge_kinds[order],
+    )
 
 
 def _find_trace_path(
     root_fund_id: str,
     target_asset_id: str,
-    edges: dict[str, list[tuple[str, float, bool, str]]],
+    graph: TraceGraph,
     max_depth: int,
 ) -> tuple[list[dict[str, Any]], float] | None:
     """Return one shortest path to target + cumulative weight product."""
@@ -740,34 +1334,112 @@ def _find_trace_path(
     if root_fund_id == target_asset_id:
         return ([{"from": root_fund_id, "to": target_asset_id, "edge_kind": "self", "edge_weight": 1.0, "cum_weight": 1.0}], 1.0)
 
-    queue: deque[tuple[str, list[dict[str, Any]], float, int]] = deque()
-    queue.append((root_fund_id, [], 1.0, 0))
-    visited: set[str] = {root_fund_id}
-
-    while queue:
-        node, path, cum, depth = queue.popleft()
-        if depth >= max_depth:
-            continue
-
-        for child, w, child_is_fund, edge_kind in edges.get(node, []):
-            next_cum = cum * w
-            step = {
-                "from": node,
-                "to": child,
-                "edge_kind": edge_kind,
-                "edge_weight": w,
-                "cum_weight": next_cum,
+    root = graph.node_index.get(root_fund_id)
+    target = graph.node_index.get(target_asset_id)
+    if root is None or target is None:
+        return None
+
+    n = len(graph.node_ids)
+    parent = np.full(n, -1, dtype=np.int64)
+    parent_edge = np.full(n, -1, dtype=np.int64)
+    cum_weight = np.zeros(n, dtype=np.float64)
+    visited = np.zeros(n, dtype=bool)
+    visited[root] = True
+    cum_weight[root] = 1.0
+
+    # Level-synchronous BFS: each level gathers all frontier edges from the CSR arrays at once.
+    # Frontier order and first-seen dedupe reproduce FIFO queue order, so the same path is found.
+    frontier = np.array([root], dtype=np.int64)
+    for _ in range(max_depth):
+        if frontier.size == 0:
+            break
+        starts = graph.indptr[frontier]
+        counts = graph.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        edge_pos = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        sources = np.repeat(frontier, counts)
+        children = graph.child_codes[edge_pos]
+
+        hits = np.flatnonzero(children == target)
+        if hits.size:
+            node, edge = int(sources[hits[0]]), int(edge_pos[hits[0]])
+            final_weight = float(cum_weight[node] * graph.weights[edge])
+            return _rebuild_trace_path(graph, parent, parent_edge, cum_weight, node, edge, final_weight), final_weight
+
+        expand = graph.child_is_fund[edge_pos] & ~visited[children]
+        candidates = children[expand]
+        _, first_seen = np.unique(candidates, return_index=True)
+        first_seen.sort()
+        frontier = candidates[first_seen]
+        via_edge = edge_pos[expand][first_seen]
+        via_node = sources[expand][first_seen]
+
+        visited[frontier] = True
+        parent[frontier] = via_node
+        parent_edge[frontier] = via_edge
+        cum_weight[frontier] = cum_weight[via_node] * graph.weights[via_edge]
+
+    return None
+
+
+def _rebuild_trace_path(
+    graph: TraceGraph,
+    parent: np.ndarray,
+    parent_edge: np.ndarray,
+    cum_weight: np.ndarray,
+    node: int,
+    edge: int,
+    final_weight: float,
+) -> list[dict[str, Any]]:
+    ids = graph.node_ids
+    steps = [
+        {
+            "from": ids[node],
+            "to": ids[graph.child_codes[edge]],
+            "edge_kind": EDGE_KINDS[graph.edge_kinds[edge]],
+            "edge_weight": float(graph.weights[edge]),
+            "cum_weight": final_weight,
+        }
+    ]
+    child = node
+    while parent[child] >= 0:
+        via = parent_edge[child]
+        steps.append(
+            {
+                "from": ids[parent[child]],
+                "to": ids[child],
+                "edge_kind": EDGE_KINDS[graph.edge_kinds[via]],
+                "edge_weight": float(graph.weights[via]),
+                "cum_weight": float(cum_weight[child]),
             }
-            next_path = path + [step]
+        )
+        child = parent[child]
+    steps.reverse()
+    return steps
 
-            if child == target_asset_id:
-                return next_path, next_cum
 
-            if child_is_fund and child not in visited:
-                visited.add(child)
-                queue.append((child, next_path, next_cum, depth + 1))
+def _direct_row_limit(state_key: str) -> int:
+    return int(st.session_state.get(state_key, DIRECT_ROWS_LIMIT))
 
-    return None
+
+def _show_more_rows(state_key: str, shown: int, row_limit: int) -> None:
+    if shown < row_limit:
+        return
+    st.caption(f"Showing the top {shown:,} rows by weight.")
+    if st.button("Show more", key=f"{state_key}_more"):
+        st.session_state[state_key] = row_limit * 2
+        st.rerun()
+
+
+def _warm_caches(as_of_date: str) -> None:
+    """Fill the hottest caches in the background so the first page view is not a cold miss."""
+    ctx = get_script_run_ctx()
+    pool = ThreadPoolExecutor(max_workers=3, initializer=lambda: add_script_run_ctx(ctx=ctx))
+    for func in (_dashboard_bundle, _sidebar_lists, _fund_catalog, _asset_catalog, _graph_edges):
+        pool.submit(func, as_of_date)
+    pool.shutdown(wait=False)
 
 
 def _render_cards(cards: dict[str, int]) -> None:
@@ -798,7 +1470,7 @@ def _render_cards(cards: dict[str, int]) -> None:
 def _render_dashboard(as_of_date: str) -> None:
     st.subheader("Dashboard")
 
-    cards = _count_cards(as_of_date)
+    cards, freshness, source_hist, top = _dashboard_bundle(as_of_date)
     _render_cards(cards)
 
     st.markdown("<div class='small-note'>Tip: Use the bidirectional search pages to debug real exposure outcomes.</div>", unsafe_allow_html=True)
@@ -807,16 +1479,14 @@ def _render_dashboard(as_of_date: str) -> None:
 
     with left:
         st.markdown("#### Freshness")
-        st.dataframe(_freshness(as_of_date), use_container_width=True, hide_index=True)
+        st.dataframe(freshness, use_container_width=True, hide_index=True)
 
     with right:
         st.markdown("#### Source Distribution")
-        funds = _fund_catalog(as_of_date)
-        if funds.empty or "source" not in funds.columns:
+        if source_hist.empty:
             st.info("No fund metadata available.")
         else:
-            src = funds.groupby("source", as_index=False).agg(funds=("fund_id", "nunique")).sort_values("funds", ascending=False)
-            chart = alt.Chart(src).mark_bar(color="#2563eb").encode(
+            chart = alt.Chart(source_hist).mark_bar(color="#2563eb").encode(
                 x=alt.X("funds:Q", title="# Funds"),
                 y=alt.Y("source:N", sort="-x", title="Source"),
                 tooltip=["source:N", "funds:Q"],
@@ -824,26 +1494,6 @@ def _render_dashboard(as_of_date: str) -> None:
             st.altair_chart(chart, use_container_width=True)
 
     st.markdown("#### Top Funds by Holdings Count")
-    if as_of_date == "All":
-        where = ""
-        params = None
-    else:
-        where = "WHERE as_of_date = :as_of_date"
-        params = {"as_of_date": as_of_date}
-
-    query = text(
-        f"""
-        SELECT fund_id, COUNT(*) AS holdings_count, SUM(weight) AS weight_sum
-        FROM stg_holdings
-        {where}
-        GROUP BY fund_id
-        ORDER BY holdings_count DESC
-        LIMIT 20
-        """
-    )
-    with _staging_engine().connect() as conn:
-        top = pd.read_sql(query, conn, params=params)
-
     if top.empty:
         st.info("No holdings found.")
         return
@@ -851,6 +1501,26 @@ def _render_dashboard(as_of_date: str) -> None:
     st.dataframe(top, use_container_width=True, hide_index=True)
 
 
+def _explorer_next(state_key: str) -> None:
+    state = st.session_state[state_key]
+    state["history"].append(state["after"])
+    state["after"] = state["next_after"]
+    state["page"] += 1
+    st.session_state[f"{state_key}_jump"] = min(state["page"], state["max_jump"])
+
+
+def _explorer_prev(state_key: str) -> None:
+    state = st.session_state[state_key]
+    state["after"] = state["history"].pop() if state["history"] else None
+    state["page"] = max(1, state["page"] - 1)
+    st.session_state[f"{state_key}_jump"] = min(state["page"], state["max_jump"])
+
+
+def _explorer_jump(state_key: str) -> None:
+    state = st.session_state[state_key]
+    state.update(page=int(st.session_state[f"{state_key}_jump"]), after=None, history=[])
+
+
 def _render_explorer(as_of_date: str, source: str) -> None:
     st.subheader("Explorer")
 
@@ -873,30 +1543,69 @@ def _render_explorer(as_of_date: str, source: str) -> None:
     sort_options = [c[0] for c in spec["columns"]]
     sort_by = st.selectbox("Sort By", options=sort_options, index=0)
 
-    page = int(st.number_input("Page", min_value=1, value=1, step=1))
-
-    df, total_rows, total_pages = _run_explorer_query(
+    state_key = f"cur_{dataset}"
+    signature = (as_of_date, source, keyword, sort_by, sort_desc, page_size)
+    state = st.session_state.get(state_key)
+    if state is None or state["signature"] != signature:
+        state = {"signature": signature, "page": 1, "after": None, "history": [], "next_after": None}
+        st.session_state[state_key] = state
+        st.session_state[f"{state_key}_jump"] = 1
+
+    total_rows = _explorer_count(dataset, as_of_date, source, keyword)
+    total_pages = max(1, (total_rows + page_size - 1) // page_size)
+    page = min(state["page"], total_pages)
+    # Seek from the previous page's last row; OFFSET only for jumps and back-steps without a cursor.
+    offset = 0 if state["after"] is not None else (page - 1) * page_size
+    df, next_after = _explorer_page(
         dataset=dataset,
         as_of=as_of_date,
         source=source,
         keyword=keyword,
         sort_by=sort_by,
         sort_desc=sort_desc,
-        page=page,
         page_size=page_size,
+        after=state["after"],
+        offset=offset,
     )
+    state["next_after"] = next_after
+
+    max_jump = max(1, min(total_pages, EXPLORER_MAX_OFFSET // page_size))
+    state["max_jump"] = max_jump
+    if st.session_state[f"{state_key}_jump"] > max_jump:
+        st.session_state[f"{state_key}_jump"] = max_jump
+    nav = st.columns([1, 1, 2])
+    with nav[0]:
+        st.button("Prev", on_click=_explorer_prev, args=(state_key,), disabled=page <= 1, use_container_width=True)
+    with nav[1]:
+        st.button(
+            "Next",
+            on_click=_explorer_next,
+            args=(state_key,),
+            disabled=next_after is None or page >= total_pages,
+            use_container_width=True,
+        )
+    with nav[2]:
+        st.number_input(
+            "Jump to page",
+            min_value=1,
+            max_value=max_jump,
+            step=1,
+            key=f"{state_key}_jump",
+            on_change=_explorer_jump,
+            args=(state_key,),
+        )
 
-    st.caption(
-        f"Dataset: {spec['label']} | Total rows: {total_rows:,} | Page: {min(max(page, 1), total_pages)}/{total_pages}"
-    )
+    st.caption(f"Dataset: {spec['label']} | Total rows: {total_rows:,} | Page: {page}/{total_pages}")
 
     st.dataframe(df, use_container_width=True, height=440)
 
     if not df.empty:
         st.download_button(
             label="Download current page CSV",
-            data=df.to_csv(index=False).encode("utf-8"),
-            file_name=f"explorer_{dataset}_page_{min(max(page, 1), total_pages)}.csv",
+            data=_explorer_page_csv(
+                dataset, as_of_date, source, keyword, sort_by, sort_desc, page_size, state["after"], offset
+            ),
+            file_name=f"explorer_{dataset}_page_{page}.csv",
             mime="text/csv",
         )
 
@@ -905,14 +1614,15 @@ def _render_fund_search(as_of_date: str, aum_map: dict[str, float] | None) -> No
     st.subheader("Fund -> Assets")
 
     feeder_only = st.toggle("Feeder funds only (from stg_fund_links)", value=True)
-    roots = _feeder_funds(as_of_date) if feeder_only else _root_funds(as_of_date)
+    roots = _sidebar_lists(as_of_date)["feeders" if feeder_only else "roots"]
     funds = _fund_catalog(as_of_date)
 
     search = st.text_input("Search fund (root fund id)", placeholder="TH_..., feeder id, ...")
     candidates = roots
     if search.strip():
-        s = search.strip().lower()
-        candidates = [f for f in roots if s in f.lower()][:200]
+        index = _root_search_index(as_of_date, feeder_only)
+        hits = index["_search_blob"].str.contains(search.strip().lower(), regex=False).to_numpy(dtype=bool, na_value=False)
+        candidates = index["fund_id"][hits].head(200).tolist()
 
     if not candidates:
         st.info("No matching root funds for this as-of date.")
@@ -938,99 +1648,96 @@ def _render_fund_search(as_of_date: str, aum_map: dict[str, float] | None) -> No
     tabs = st.tabs(["True Exposure (Indirect)", "Direct Holdings", "Trace Path"])
 
     with tabs[0]:
-        try:
-            exposure = _true_exposure_for_fund(selected, as_of_date, min_weight)
-        except Exception as exc:
-            st.error(f"Failed to load mart_true_exposure: {exc}")
-            st.stop()
+        _fund_exposure_tab(selected, as_of_date, min_weight, aum_map)
 
-        if exposure.empty:
-            st.info("No exposure rows found. Run `pipelines/run_build_mart.py` for this as-of date.")
-            return
+    with tabs[1]:
+        _fund_direct_tab(selected, as_of_date)
 
-        assets = _asset_catalog(as_of_date)
-        enriched = exposure.merge(assets, left_on="final_asset_id", right_on="asset_id", how="left")
-        enriched = enriched.drop(columns=["asset_id"], errors="ignore")
+    with tabs[2]:
+        _fund_trace_tab(selected, as_of_date)
 
-        show_types = sorted([t for t in assets["asset_type"].unique().tolist() if t])
-        types = st.multiselect("Asset type filter", options=show_types, default=[])
-        if types:
-            enriched = enriched[enriched["asset_type"].isin(types)]
 
-        enriched = enriched.sort_values(by=["effective_weight"], ascending=False).reset_index(drop=True)
+# Each tab is a fragment: its own widgets rerun only that tab, not the whole page.
+@st.fragment
+def _fund_exposure_tab(selected: str, as_of_date: str, min_weight: float, aum_map: dict[str, float] | None) -> None:
+    try:
+        exposure = _true_exposure_for_fund(selected, as_of_date, min_weight)
+    except Exception as exc:
+        st.error(f"Failed to load mart_true_exposure: {exc}")
+        st.stop()
 
-        if aum_map:
-            aum = float(aum_map.get(selected, 0.0))
-            enriched["notional_value"] = enriched["effective_weight"] * aum
-            st.caption(f"AUM mapping found for this fund: {aum:,.2f} (notional_value = effective_weight * AUM)")
+    if exposure.empty:
+        st.info("No exposure rows found. Run `pipelines/run_build_mart.py` for this as-of date.")
+        return
 
-        st.dataframe(enriched, use_container_width=True, height=420)
+    assets = _asset_lookup(as_of_date)
+    show_types = _asset_type_options(assets)
+    types = tuple(st.multiselect("Asset type filter", options=show_types, default=[]))
 
-        top_n = min(20, len(enriched))
-        chart_df = enriched.head(top_n).copy()
-        chart_df["label"] = chart_df["final_asset_id"].astype(str)
-        if "asset_name" in chart_df.columns:
-            chart_df["label"] = chart_df["label"] + " | " + chart_df["asset_name"].fillna("").astype(str)
+    aum = float(aum_map.get(selected, 0.0)) if aum_map else None
+    enriched = _enrich_exposure(exposure, assets, types, aum)
+    if aum is not None:
+        st.caption(f"AUM mapping found for this fund: {aum:,.2f} (notional_value = effective_weight * AUM)")
 
-        chart = alt.Chart(chart_df).mark_bar(color="#10b981").encode(
-            x=alt.X("effective_weight:Q", title="Effective Weight"),
-            y=alt.Y("label:N", sort="-x", title="Top Assets"),
-            tooltip=["final_asset_id:N", "asset_name:N", "asset_type:N", "effective_weight:Q", "path_depth:Q"],
-        )
-        st.altair_chart(chart, use_container_width=True)
+    st.dataframe(enriched, use_container_width=True, height=420)
+    st.vega_lite_chart(_fund_exposure_chart(selected, as_of_date, min_weight, types), use_container_width=True)
 
-        st.download_button(
-            "Download exposure CSV",
-            data=enriched.to_csv(index=False).encode("utf-8"),
-            file_name=f"true_exposure_{selected}_{as_of_date}.csv",
-            mime="text/csv",
-        )
+    st.download_button(
+        "Download exposure CSV",
+        data=_fund_exposure_csv(selected, as_of_date, min_weight, types, aum),
+        file_name=f"true_exposure_{selected}_{as_of_date}.csv",
+        mime="text/csv",
+    )
 
-    with tabs[1]:
-        direct = _direct_holdings(selected, as_of_date)
-        if direct.empty:
-            st.info("No direct holdings for this fund in staging (maybe feeder-only fund).")
-        else:
-            st.dataframe(direct, use_container_width=True, height=420)
 
-    with tabs[2]:
-        st.markdown("Find one trace path from root fund to a target asset using staging graph edges.")
-        max_depth = int(st.slider("Max depth", min_value=1, max_value=10, value=6, step=1))
+@st.fragment
+def _fund_direct_tab(selected: str, as_of_date: str) -> None:
+    row_limit = _direct_row_limit("direct_holdings_limit")
+    direct = _direct_holdings(selected, as_of_date, top_n=row_limit)
+    if direct.empty:
+        st.info("No direct holdings for this fund in staging (maybe feeder-only fund).")
+    else:
+        st.dataframe(direct, use_container_width=True, height=420)
+        _show_more_rows("direct_holdings_limit", len(direct), row_limit)
+
 
-        target = st.text_input("Target asset_id", placeholder="EQ_..., ticker, ...")
-        if st.button("Find Path"):
-            if not target.strip():
-                st.warning("Provide a target asset_id first.")
+@st.fragment
+def _fund_trace_tab(selected: str, as_of_date: str) -> None:
+    st.markdown("Find one trace path from root fund to a target asset using staging graph edges.")
+    max_depth = int(st.slider("Max depth", min_value=1, max_value=10, value=6, step=1))
+
+    target = st.text_input("Target asset_id", placeholder="EQ_..., ticker, ...")
+    if st.button("Find Path"):
+        if not target.strip():
+            st.warning("Provide a target asset_id first.")
+        else:
+            edges = _graph_edges(as_of_date)
+            found = _find_trace_path(selected, target.strip(), edges, max_depth=max_depth)
+            if not found:
+                st.info("No path found (within max depth).")
             else:
-                edges = _graph_edges(as_of_date)
-                found = _find_trace_path(selected, target.strip(), edges, max_depth=max_depth)
-                if not found:
-                    st.info("No path found (within max depth).")
-                else:
-                    path_rows, final_weight = found
-                    st.success(f"Found path. cumulative_weight={final_weight:.10f}")
-                    st.dataframe(pd.DataFrame(path_rows), use_container_width=True, hide_index=True)
+                path_rows, final_weight = found
+                st.success(f"Found path. cumulative_weight={final_weight:.10f}")
+                st.dataframe(pd.DataFrame(path_rows), use_container_width=True, hide_index=True)
 
 
 def _render_asset_search(as_of_date: str, aum_map: dict[str, float] | None) -> None:
     st.subheader("Asset -> Funds")
 
-    assets = _asset_catalog(as_of_date)
+    assets = _asset_search_index(as_of_date)
     if assets.empty:
         st.info("No assets in staging holdings.")
         return
 
     feeder_only = st.toggle("Only feeder funds (from stg_fund_links)", value=True)
-    feeder_set = set(_feeder_funds(as_of_date)) if feeder_only else set()
+    feeder_set = set(_sidebar_lists(as_of_date)["feeders"]) if feeder_only else set()
 
     keyword = st.text_input("Search asset", placeholder="ticker, asset name, ...")
     filtered = assets
     if keyword.strip():
         s = keyword.strip().lower()
-        filtered = assets[
-            assets["asset_id"].astype(str).str.lower().str.contains(s)
-            | assets["asset_name"].astype(str).str.lower().str.contains(s)
-        ].head(300)
+        # One Arrow substring kernel pass over the fused id/name column.
+        filtered = assets[assets["_search_blob"].str.contains(s, regex=False).to_numpy(dtype=bool, na_value=False)].head(300)
 
     options = filtered["asset_id"].tolist() if not filtered.empty else []
     if not options:
@@ -1078,8 +1785,8 @@ def _render_asset_search(as_of_date: str, aum_map: dict[str, float] | None) -> N
             )
 
         if aum_map:
-            funds["aum"] = funds["root_fund_id"].map(aum_map).fillna(0.0)
-            funds["notional_value"] = funds["effective_weight"] * funds["aum"]
+            funds["aum"] = _aum_values(funds["root_fund_id"], aum_map)
+            funds["notional_value"] = funds["effective_weight"].to_numpy() * funds["aum"].to_numpy()
 
         st.dataframe(funds, use_container_width=True, height=420)
 
@@ -1097,11 +1804,13 @@ def _render_asset_search(as_of_date: str, aum_map: dict[str, float] | None) -> N
         st.altair_chart(chart, use_container_width=True)
 
     with tabs[1]:
-        direct = _direct_holders_of_asset(selected, as_of_date)
+        row_limit = _direct_row_limit("direct_holders_limit")
+        direct = _direct_holders_of_asset(selected, as_of_date, top_n=row_limit)
         if direct.empty:
             st.info("No direct holders found in staging holdings.")
         else:
             st.dataframe(direct, use_container_width=True, height=420)
+            _show_more_rows("direct_holders_limit", len(direct), row_limit)
 
 
 def _render_top10(as_of_date: str, aum_map: dict[str, float] | None) -> None:
@@ -1111,23 +1820,27 @@ def _render_top10(as_of_date: str, aum_map: dict[str, float] | None) -> None:
 
     with tab1:
         assets = _asset_catalog(as_of_date)
-        types = sorted([t for t in assets["asset_type"].unique().tolist() if t])
+        types = _asset_type_options(assets)
         asset_types = st.multiselect("Asset types", options=types, default=["equity"] if "equity" in types else [])
         top_n = int(st.slider("Top N", min_value=5, max_value=50, value=10, step=1))
         feeder_only = st.toggle("Only feeder funds (from stg_fund_links)", value=True)
         thai_only = st.toggle("Thai-only heuristic (.BK)", value=False)
         contains = st.text_input("asset_id contains", value="")
 
-        root_filter = set(_feeder_funds(as_of_date)) if feeder_only else None
-        top = _top_assets(
-            as_of_date,
-            asset_types=asset_types,
-            top_n=top_n,
-            thai_only=thai_only,
-            contains=contains,
-            aum_map=aum_map,
-            root_fund_ids=root_filter,
-        )
+        top = None
+        if as_of_date != "All" and not (aum_map or thai_only or contains.strip()):
+            top = _materialized_top_assets(as_of_date, asset_types, top_n, feeder_only)
+        if top is None:
+            root_filter = set(_sidebar_lists(as_of_date)["feeders"]) if feeder_only else None
+            top = _top_assets(
+                as_of_date,
+                asset_types=asset_types,
+                top_n=top_n,
+                thai_only=thai_only,
+                contains=contains,
+                aum_map=aum_map,
+                root_fund_ids=root_filter,
+            )
 
         if top.empty:
             st.info("No results.")
@@ -1143,7 +1856,11 @@ def _render_top10(as_of_date: str, aum_map: dict[str, float] | None) -> None:
 
     with tab2:
         top_n = int(st.slider("Top N (masters)", min_value=5, max_value=50, value=10, step=1))
-        masters = _top_master_funds(as_of_date, top_n=top_n, aum_map=aum_map)
+        masters = None
+        if as_of_date != "All" and not aum_map:
+            masters = _materialized_top_masters(as_of_date, top_n)
+        if masters is None:
+            masters = _top_master_funds(as_of_date, top_n=top_n, aum_map=aum_map)
 
         st.markdown(
             "<div class='small-note'>Note: `confidence` in stg_fund_links is a match score, not allocation. "
@@ -1190,6 +1907,10 @@ def main() -> None:
     if "as_of_date" not in st.session_state:
         st.session_state["as_of_date"] = _default_as_of(as_of_dates)
 
+    if "warmed" not in st.session_state:
+        st.session_state["warmed"] = True
+        _warm_caches(st.session_state["as_of_date"])
+
     with st.sidebar:
         st.subheader("Navigation")
         page = st.radio(
@@ -1211,7 +1932,7 @@ def main() -> None:
         as_of_date = st.selectbox("As Of Date", options=as_of_options, index=as_of_options.index(default_as_of))
         st.session_state["as_of_date"] = as_of_date
 
-        sources = _list_sources(as_of_date)
+        sources = _sidebar_lists(as_of_date)["sources"]
         source = st.selectbox("Source", options=sources, index=0)
 
         st.divider()
@@ -1223,6 +1944,11 @@ def main() -> None:
             st.cache_data.clear()
             st.rerun()
 
+        if st.query_params.get("debug") == "1":
+            st.divider()
+            st.subheader("Cache Stats")
+            st.dataframe(_cache_stats_frame(), use_container_width=True, hide_index=True)
+
     if page == "Dashboard":
         _render_dashboard(as_of_date)
     elif page == "Explorer":
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 import argparse
 from datetime import date
-import os
 from pathlib import Path
-import subprocess
 import sys
-from typing import Sequence
+from typing import Callable, Sequence
 
 from prefect import flow, get_run_logger, task
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from pipelines import run_build_mart, run_build_staging, run_db_smoke_test  # noqa: E402
 
 
 def _parse_args() -> argparse.Namespace:
@@ -31,55 +32,27 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _run_subprocess(command: Sequence[str]) -> tuple[int, str, str]:
-    env = os.environ.copy()
-    env.setdefault("PYTHONUNBUFFERED", "1")
-    result = subprocess.run(
-        command,
-        cwd=REPO_ROOT,
-        env=env,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    return result.returncode, result.stdout, result.stderr
-
-
-@task(name="run-shell-step", retries=2, retry_delay_seconds=30)
-def run_shell_step(name: str, command: list[str]) -> None:
+@task(name="run-pipeline-step", retries=2, retry_delay_seconds=30)
+def run_pipeline_step(name: str, entrypoint: Callable[..., int], argv: Sequence[str] | None = None) -> None:
+    # In-process steps share imports and the cached, pooled engines across the flow run.
     logger = get_run_logger()
-    logger.info("Running step=%s command=%s", name, " ".join(command))
-    return_code, stdout, stderr = _run_subprocess(command)
-    if stdout.strip():
-        logger.info(stdout.strip())
+    logger.info("Running step=%s args=%s", name, " ".join(argv or []))
+    return_code = entrypoint(list(argv)) if argv is not None else entrypoint()
     if return_code != 0:
-        if stderr.strip():
-            logger.error(stderr.strip())
         raise RuntimeError(f"Step {name} failed with exit code {return_code}")
 
 
 @flow(name="fund-traceability-refresh-all", log_prints=True)
 def refresh_all_flow(as_of_date: str, max_depth: int = 6, run_smoke_test: bool = True) -> None:
-    python_bin = sys.executable
-
     if run_smoke_test:
-        run_shell_step("db_smoke_test", [python_bin, "pipelines/run_db_smoke_test.py"])
+        run_pipeline_step("db_smoke_test", run_db_smoke_test.main)
 
-    run_shell_step(
-        "build_staging",
-        [python_bin, "pipelines/run_build_staging.py", "--as-of-date", as_of_date],
-    )
+    run_pipeline_step("build_staging", run_build_staging.main, ["--as-of-date", as_of_date])
 
-    run_shell_step(
+    run_pipeline_step(
         "build_mart",
-        [
-            python_bin,
-            "pipelines/run_build_mart.py",
-            "--as-of-date",
-            as_of_date,
-            "--max-depth",
-            str(max_depth),
-        ],
+        run_build_mart.main,
+        ["--as-of-date", as_of_date, "--max-depth", str(max_depth)],
     )
 
 
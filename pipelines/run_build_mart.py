@@ -7,22 +7,37 @@ from collections import defaultdict
 from datetime import date
 from pathlib import Path
 import sys
+from typing import Sequence
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import inspect, text
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 # Allow running directly from repo root without package installation.
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from db.connections import create_traceability_mart_engine, create_traceability_staging_engine  # noqa: E402
+from db.partitions import delete_partition, insert_frame, inspector, read_streamed  # noqa: E402
+from db.sql_files import run_sql_file  # noqa: E402
 from utils.validation import require_columns  # noqa: E402
 
+try:
+    import pyarrow  # noqa: F401
+
+    TEXT_DTYPE: object = "string[pyarrow]"
+except ImportError:  # Optional: the "arrow" extra moves id cleanup into Arrow string kernels.
+    TEXT_DTYPE = object
+
 SQL_MART_TABLES = Path(__file__).resolve().parents[1] / "sql" / "20_mart_tables.sql"
 FUND_LIKE_TYPES = {"fund", "etf"}
+TOP_MART_ROWS = 100
+HOLDINGS_COLUMNS = ("fund_id", "asset_id", "asset_name", "asset_type", "weight")
+LINKS_COLUMNS = ("feeder_fund_id", "master_fund_id", "confidence")
+FUNDS_COLUMNS = ("fund_id", "fund_name", "source")
 
 
-def _parse_args() -> argparse.Namespace:
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build true exposure mart table from staging tables.")
     parser.add_argument(
         "--as-of-date",
@@ -35,65 +50,79 @@ def _parse_args() -> argparse.Namespace:
         default=6,
         help="Maximum recursive depth for feeder/master traversal.",
     )
-    return parser.parse_args()
-
+    return parser.parse_args(argv)
 
-def _split_sql_statements(sql_text: str) -> list[str]:
-    statements: list[str] = []
-    buffer: list[str] = []
-    for line in sql_text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("--"):
-            continue
-        buffer.append(line)
-        if stripped.endswith(";"):
-            statement = "\n".join(buffer).strip()
-            if statement:
-                statements.append(statement)
-            buffer = []
-    tail = "\n".join(buffer).strip()
-    if tail:
-        statements.append(tail)
-    return statements
-
-
-def _run_sql_file(engine: Engine, path: Path) -> None:
-    sql_text = path.read_text(encoding="utf-8")
-    statements = _split_sql_statements(sql_text)
-    with engine.begin() as conn:
-        for statement in statements:
-            conn.execute(text(statement))
 
-
-def _load_partition(engine: Engine, table_name: str, as_of_date: str) -> pd.DataFrame:
-    existing = set(inspect(engine).get_table_names())
-    if table_name not in existing:
+def _load_partition(
+    engine: Engine, table_name: str, as_of_date: str, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
+    table_inspector = inspector(engine)
+    if table_name not in table_inspector.get_table_names():
         return pd.DataFrame()
-    query = text(f"SELECT * FROM {table_name} WHERE as_of_date = :as_of_date")
-    with engine.connect() as conn:
-        return pd.read_sql(query, conn, params={"as_of_date": as_of_date})
+    select_list = "*"
+    if columns is not None:
+        # Only ship what the build reads; missing columns are left for require_columns to report.
+        present = {column_info["name"] for column_info in table_inspector.get_columns(table_name)}
+        select_list = ", ".join(name for name in columns if name in present) or "*"
+    query = text(f"SELECT {select_list} FROM {table_name} WHERE as_of_date = :as_of_date")
+    return read_streamed(engine, query, {"as_of_date": as_of_date})
+
+
+def _clean_text(values: pd.Series) -> pd.Series:
+    return values.astype(str).astype(TEXT_DTYPE).str.strip()
+
+
+def _holding_edges(holdings_df: pd.DataFrame) -> pd.DataFrame:
+    holdings = pd.DataFrame(
+        {
+            "fund_id": _clean_text(holdings_df["fund_id"]),
+            "asset_id": _clean_text(holdings_df["asset_id"]),
+            "weight": pd.to_numeric(holdings_df["weight"], errors="coerce"),
+            "asset_type": _clean_text(holdings_df["asset_type"]).str.lower(),
+        }
+    )
+    return holdings[(holdings["fund_id"] != "") & (holdings["asset_id"] != "") & (holdings["weight"] > 0)]
+
+
+def _link_edges(links_df: pd.DataFrame) -> pd.DataFrame:
+    confidence = pd.to_numeric(links_df["confidence"], errors="coerce")
+    links = pd.DataFrame(
+        {
+            "fund_id": _clean_text(links_df["feeder_fund_id"]),
+            "asset_id": _clean_text(links_df["master_fund_id"]),
+            "weight": confidence.where((confidence > 0) & (confidence <= 1), 1.0),
+            "asset_type": "fund",
+        }
+    )
+    return links[(links["fund_id"] != "") & (links["asset_id"] != "")]
 
 
 def _build_edge_map(holdings_df: pd.DataFrame, links_df: pd.DataFrame) -> dict[str, list[tuple[str, float, str]]]:
+    # A missing staging table loads as a frame with no columns, so only build a side that has rows.
+    parts: list[pd.DataFrame] = []
+    if not holdings_df.empty:
+        parts.append(_holding_edges(holdings_df))
+    if not links_df.empty:
+        parts.append(_link_edges(links_df))
+    parts = [part for part in parts if not part.empty]
     edges: dict[str, list[tuple[str, float, str]]] = defaultdict(list)
-
-    for row in holdings_df.itertuples(index=False):
-        fund_id = str(row.fund_id).strip()
-        asset_id = str(row.asset_id).strip()
-        asset_type = str(row.asset_type).strip().lower()
-        weight = float(row.weight)
-        if not fund_id or not asset_id or weight <= 0:
-            continue
-        edges[fund_id].append((asset_id, weight, asset_type))
-
-    for row in links_df.itertuples(index=False):
-        feeder = str(row.feeder_fund_id).strip()
-        master = str(row.master_fund_id).strip()
-        confidence = float(row.confidence) if row.confidence is not None else 1.0
-        link_weight = confidence if 0 < confidence <= 1 else 1.0
-        if feeder and master:
-            edges[feeder].append((master, link_weight, "fund"))
-
+    if not parts:
+        return edges
+    combined = pd.concat(parts, ignore_index=True)
+    codes, fund_ids = pd.factorize(combined["fund_id"])
+    order = np.argsort(codes, kind="stable")
+    records = list(
+        zip(
+            combined["asset_id"].to_numpy(dtype=object)[order].tolist(),
+            combined["weight"].to_numpy(dtype=float)[order].tolist(),
+            combined["asset_type"].to_numpy(dtype=object)[order].tolist(),
+        )
+    )
+    bounds = np.cumsum(np.bincount(codes, minlength=len(fund_ids))).tolist()
+    start = 0
+    for fund_id, end in zip(fund_ids.tolist(), bounds):
+        edges[fund_id] = records[start:end]
+        start = end
     return edges
 
 
@@ -105,41 +134,294 @@ def _traverse_paths(
     current_weight: float,
     depth: int,
     visiting: set[str],
-    outputs: list[dict[str, object]],
+    outputs: dict[tuple[str, str], list[float]],
+    cyclic: set[str] | None = None,
+    subtree_memo: dict[tuple[str, int], dict[tuple[str, int], float]] | None = None,
+    reach: dict[str, frozenset[str]] | None = None,
+    path_memo: dict[tuple[str, int], dict[str, list[float]]] | None = None,
 ) -> None:
     if depth >= max_depth:
         return
 
-    for asset_id, edge_weight, asset_type in edges.get(current_fund_id, []):
-        effective_weight = current_weight * edge_weight
+    # Explicit stack instead of recursion; ``on_path`` holds the open ancestors and is mutated on push/pop.
+    on_path = set(visiting)
+    stack = [(current_fund_id, iter(edges.get(current_fund_id, ())), current_weight, depth)]
+    while stack:
+        fund_id, fund_edges, fund_weight, fund_depth = stack[-1]
+        edge = next(fund_edges, None)
+        if edge is None:
+            stack.pop()
+            if stack:
+                on_path.discard(fund_id)
+            continue
+
+        asset_id, edge_weight, asset_type = edge
+        effective_weight = fund_weight * edge_weight
         if effective_weight <= 0:
             continue
 
-        next_depth = depth + 1
+        next_depth = fund_depth + 1
         expands = asset_type in FUND_LIKE_TYPES or asset_id in edges
-        in_cycle = asset_id in visiting
+        in_cycle = asset_id in on_path
 
-        if expands and not in_cycle:
-            _traverse_paths(
-                root_fund_id=root_fund_id,
-                current_fund_id=asset_id,
-                edges=edges,
-                max_depth=max_depth,
-                current_weight=effective_weight,
-                depth=next_depth,
-                visiting=visiting | {asset_id},
-                outputs=outputs,
+        if expands and not in_cycle and cyclic is not None and subtree_memo is not None and asset_id not in cyclic:
+            # No ancestor can reappear below an acyclic fund, so its subtree is reused across paths and roots.
+            subtree = _subtree_exposure(asset_id, max_depth - next_depth, edges, subtree_memo)
+            for (final_asset_id, sub_depth), sub_weight in subtree.items():
+                _accumulate(outputs, root_fund_id, final_asset_id, effective_weight * sub_weight, next_depth + sub_depth)
+            continue
+
+        if (
+            expands
+            and not in_cycle
+            and reach is not None
+            and path_memo is not None
+            and asset_id in reach
+            and reach[asset_id].isdisjoint(on_path)
+        ):
+            # None of the open ancestors is reachable from here, so the walk below cannot depend on the path.
+            subtree = _cyclic_subtree_exposure(
+                asset_id, max_depth - next_depth, edges, cyclic, subtree_memo, reach, path_memo
             )
+            for final_asset_id, (sub_weight, sub_depth) in subtree.items():
+                _accumulate(outputs, root_fund_id, final_asset_id, effective_weight * sub_weight, next_depth + sub_depth)
             continue
 
-        outputs.append(
-            {
-                "root_fund_id": root_fund_id,
-                "final_asset_id": asset_id,
-                "effective_weight": effective_weight,
-                "path_depth": next_depth,
-            }
+        if expands and not in_cycle:
+            # A fund reached at the depth limit contributes nothing, exactly as before.
+            if next_depth < max_depth:
+                on_path.add(asset_id)
+                stack.append((asset_id, iter(edges.get(asset_id, ())), effective_weight, next_depth))
+            continue
+
+        _accumulate(outputs, root_fund_id, asset_id, effective_weight, next_depth)
+
+
+def _accumulate(
+    outputs: dict[tuple[str, str], list[float]], root_fund_id: str, asset_id: str, weight: float, depth: int
+) -> None:
+    # Collapse paths as they are found: [summed weight, deepest path] per (root, asset).
+    totals = outputs.get((root_fund_id, asset_id))
+    if totals is None:
+        outputs[(root_fund_id, asset_id)] = [weight, depth]
+        return
+    totals[0] += weight
+    if depth > totals[1]:
+        totals[1] = depth
+
+
+def _subtree_exposure(
+    fund_id: str,
+    remaining_depth: int,
+    edges: dict[str, list[tuple[str, float, str]]],
+    memo: dict[tuple[str, int], dict[tuple[str, int], float]],
+) -> dict[tuple[str, int], float]:
+    """Summed weight per (terminal asset, relative depth) below an acyclic fund, memoized per remaining depth."""
+    key = (fund_id, remaining_depth)
+    cached = memo.get(key)
+    if cached is not None:
+        return cached
+
+    totals: dict[tuple[str, int], float] = defaultdict(float)
+    if remaining_depth > 0:
+        for asset_id, edge_weight, asset_type in edges.get(fund_id, []):
+            if edge_weight <= 0:
+                continue
+            if asset_type in FUND_LIKE_TYPES or asset_id in edges:
+                for (final_asset_id, sub_depth), sub_weight in _subtree_exposure(
+                    asset_id, remaining_depth - 1, edges, memo
+                ).items():
+                    totals[(final_asset_id, sub_depth + 1)] += edge_weight * sub_weight
+            else:
+                totals[(asset_id, 1)] += edge_weight
+
+    memo[key] = totals
+    return totals
+
+
+def _cyclic_subtree_exposure(
+    fund_id: str,
+    remaining_depth: int,
+    edges: dict[str, list[tuple[str, float, str]]],
+    cyclic: set[str] | None,
+    subtree_memo: dict[tuple[str, int], dict[tuple[str, int], float]] | None,
+    reach: dict[str, frozenset[str]],
+    path_memo: dict[tuple[str, int], dict[str, list[float]]],
+) -> dict[str, list[float]]:
+    """[summed weight, deepest relative depth] per asset below a cycle-reaching fund walked on its own."""
+    key = (fund_id, remaining_depth)
+    cached = path_memo.get(key)
+    if cached is None:
+        totals: dict[tuple[str, str], list[float]] = {}
+        _traverse_paths(
+            root_fund_id=fund_id,
+            current_fund_id=fund_id,
+            edges=edges,
+            max_depth=remaining_depth,
+            current_weight=1.0,
+            depth=0,
+            visiting={fund_id},
+            outputs=totals,
+            cyclic=cyclic,
+            subtree_memo=subtree_memo,
+            reach=reach,
+            path_memo=path_memo,
         )
+        cached = path_memo[key] = {asset_id: sums for (_, asset_id), sums in totals.items()}
+    return cached
+
+
+def _cyclic_reach(edges: dict[str, list[tuple[str, float, str]]], cyclic: set[str]) -> dict[str, frozenset[str]]:
+    """Cycle-reaching funds reachable from each cycle-reaching fund (itself included), via Tarjan's SCCs."""
+    children = {node: [asset_id for asset_id, _, _ in edges.get(node, ()) if asset_id in cyclic] for node in cyclic}
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    open_nodes: list[str] = []
+    on_stack: set[str] = set()
+    reach: dict[str, frozenset[str]] = {}
+
+    for start in sorted(cyclic):
+        if start in index:
+            continue
+        index[start] = low[start] = len(index)
+        open_nodes.append(start)
+        on_stack.add(start)
+        work = [(start, iter(children[start]))]
+        while work:
+            node, pending = work[-1]
+            child = next(pending, None)
+            if child is not None:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    open_nodes.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(children[child])))
+                elif child in on_stack:
+                    low[node] = min(low[node], index[child])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] != index[node]:
+                continue
+            component: list[str] = []
+            while True:
+                member = open_nodes.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == node:
+                    break
+            # Components close sinks-first, so every downstream component's reach is already final.
+            reachable = set(component)
+            for member in component:
+                for child in children[member]:
+                    if child not in reachable:
+                        reachable |= reach[child]
+            frozen = frozenset(reachable)
+            for member in component:
+                reach[member] = frozen
+    return reach
+
+
+def _cycle_reaching_nodes(edges: dict[str, list[tuple[str, float, str]]]) -> set[str]:
+    """Nodes with an expanding path into a cycle; every other node has an acyclic expansion subtree."""
+    out_degree: dict[str, int] = defaultdict(int)
+    parents: dict[str, list[str]] = defaultdict(list)
+    for fund_id, children in edges.items():
+        for asset_id, _, asset_type in children:
+            if asset_type in FUND_LIKE_TYPES or asset_id in edges:
+                out_degree[fund_id] += 1
+                parents[asset_id].append(fund_id)
+
+    # Peel nodes whose expanding children are all settled; whatever is left reaches a cycle.
+    settled = [node for node in parents if out_degree[node] == 0]
+    while settled:
+        node = settled.pop()
+        for parent in parents[node]:
+            out_degree[parent] -= 1
+            if out_degree[parent] == 0:
+                settled.append(parent)
+    return {node for node, degree in out_degree.items() if degree > 0}
+
+
+def _propagate_exposure(
+    edges: dict[str, list[tuple[str, float, str]]], root_funds: list[str], max_depth: int
+) -> pd.DataFrame:
+    """Level-by-level exposure for roots with acyclic expansion, as integer-coded CSR array passes.
+
+    Paths reaching the same (root, fund) at the same depth are summed before expanding further, so shared
+    subtrees are walked once per depth instead of once per path.
+    """
+    output_columns = ["root_fund_id", "final_asset_id", "effective_weight", "path_depth"]
+    parents = [fund_id for fund_id, children in edges.items() for _ in children]
+    children = [asset_id for fund_children in edges.values() for asset_id, _, _ in fund_children]
+    edge_weights = np.fromiter(
+        (weight for fund_children in edges.values() for _, weight, _ in fund_children), float, len(parents)
+    )
+    edge_expands = np.fromiter(
+        (
+            asset_type in FUND_LIKE_TYPES or asset_id in edges
+            for fund_children in edges.values()
+            for asset_id, _, asset_type in fund_children
+        ),
+        bool,
+        len(parents),
+    )
+    codes, labels = pd.factorize(np.array(parents + children + list(root_funds), dtype=object))
+    node_count = len(labels)
+    edge_parent = codes[: len(parents)]
+    edge_child = codes[len(parents) : 2 * len(parents)]
+
+    # CSR adjacency: the edges of node n are the slice indptr[n]:indptr[n + 1] of the parent-sorted arrays.
+    order = np.argsort(edge_parent, kind="stable")
+    edge_child, edge_weights, edge_expands = edge_child[order], edge_weights[order], edge_expands[order]
+    indptr = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edge_parent, minlength=node_count), out=indptr[1:])
+
+    frontier_root = codes[2 * len(parents) :]
+    frontier_node = frontier_root
+    frontier_weight = np.ones(len(frontier_root))
+    terminal_keys: list[np.ndarray] = []
+    terminal_weights: list[np.ndarray] = []
+    terminal_depths: list[np.ndarray] = []
+    for depth in range(1, max_depth + 1):
+        starts = indptr[frontier_node]
+        counts = indptr[frontier_node + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        source = np.repeat(np.arange(len(frontier_node)), counts)
+        edge_index = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        weight = frontier_weight[source] * edge_weights[edge_index]
+        live = weight > 0
+        keys = frontier_root[source[live]].astype(np.int64) * node_count + edge_child[edge_index[live]]
+        weight = weight[live]
+        expands = edge_expands[edge_index[live]]
+
+        terminal_keys.append(keys[~expands])
+        terminal_weights.append(weight[~expands])
+        terminal_depths.append(np.full(int((~expands).sum()), depth, dtype=np.int64))
+
+        frontier_keys, inverse = np.unique(keys[expands], return_inverse=True)
+        frontier_weight = np.bincount(inverse, weights=weight[expands], minlength=len(frontier_keys))
+        frontier_root = frontier_keys // node_count
+        frontier_node = frontier_keys % node_count
+
+    if not terminal_keys or not sum(len(keys) for keys in terminal_keys):
+        return pd.DataFrame(columns=output_columns)
+    pair_keys, inverse = np.unique(np.concatenate(terminal_keys), return_inverse=True)
+    pair_depths = np.zeros(len(pair_keys), dtype=np.int64)
+    np.maximum.at(pair_depths, inverse, np.concatenate(terminal_depths))
+    return pd.DataFrame(
+        {
+            "root_fund_id": labels.take(pair_keys // node_count),
+            "final_asset_id": labels.take(pair_keys % node_count),
+            "effective_weight": np.bincount(inverse, weights=np.concatenate(terminal_weights)),
+            "path_depth": pair_depths,
+        }
+    )[output_columns]
 
 
 def _compute_true_exposure(holdings_df: pd.DataFrame, links_df: pd.DataFrame, max_depth: int) -> pd.DataFrame:
@@ -152,8 +434,13 @@ def _compute_true_exposure(holdings_df: pd.DataFrame, links_df: pd.DataFrame, ma
     root_funds |= set(holdings_df["fund_id"].astype(str)) if not holdings_df.empty else set()
     root_funds = {fund_id.strip() for fund_id in root_funds if fund_id and fund_id.strip()}
 
-    rows: list[dict[str, object]] = []
-    for root_fund in sorted(root_funds):
+    # Cycle handling depends on the visited path, so only roots that can reach a cycle walk paths one by one.
+    cyclic = _cycle_reaching_nodes(edges)
+    subtree_memo: dict[tuple[str, int], dict[tuple[str, int], float]] = {}
+    reach = _cyclic_reach(edges, cyclic)
+    path_memo: dict[tuple[str, int], dict[str, list[float]]] = {}
+    path_totals: dict[tuple[str, str], list[float]] = {}
+    for root_fund in sorted(root_funds & cyclic):
         _traverse_paths(
             root_fund_id=root_fund,
             current_fund_id=root_fund,
@@ -162,53 +449,164 @@ def _compute_true_exposure(holdings_df: pd.DataFrame, links_df: pd.DataFrame, ma
             current_weight=1.0,
             depth=0,
             visiting={root_fund},
-            outputs=rows,
+            outputs=path_totals,
+            cyclic=cyclic,
+            subtree_memo=subtree_memo,
+            reach=reach,
+            path_memo=path_memo,
+        )
+
+    frames: list[pd.DataFrame] = []
+    if path_totals:
+        frames.append(
+            pd.DataFrame(
+                [(root, asset, weight, depth) for (root, asset), (weight, depth) in path_totals.items()],
+                columns=output_columns,
+            )
         )
+    acyclic_roots = sorted(root_funds - cyclic)
+    if acyclic_roots:
+        propagated = _propagate_exposure(edges, acyclic_roots, max_depth)
+        if not propagated.empty:
+            frames.append(propagated)
 
-    if not rows:
+    if not frames:
         return pd.DataFrame(columns=output_columns)
 
-    exposure_df = pd.DataFrame(rows)
+    # Both sources are already one row per (root, asset) and cover disjoint roots, so only ordering remains.
     exposure_df = (
-        exposure_df.groupby(["root_fund_id", "final_asset_id"], as_index=False)
-        .agg(effective_weight=("effective_weight", "sum"), path_depth=("path_depth", "max"))
-        .sort_values(by=["root_fund_id", "effective_weight"], ascending=[True, False])
+        pd.concat(frames, ignore_index=True)
+        .sort_values(by=["root_fund_id", "effective_weight", "final_asset_id"], ascending=[True, False, True])
         .reset_index(drop=True)
     )
     return exposure_df[output_columns]
 
 
-def _delete_partition(engine: Engine, table_name: str, as_of_date: str) -> None:
-    with engine.begin() as conn:
-        conn.execute(
-            text(f"DELETE FROM {table_name} WHERE as_of_date = :as_of_date"),
-            {"as_of_date": as_of_date},
-        )
+def _asset_labels(holdings_df: pd.DataFrame) -> pd.DataFrame:
+    """First non-empty name and most common type per asset (same rules as the UI asset catalog)."""
+    output_columns = ["asset_id", "asset_name", "asset_type"]
+    if holdings_df.empty:
+        return pd.DataFrame(columns=output_columns)
+
+    df = pd.DataFrame(
+        {
+            "asset_id": holdings_df["asset_id"].fillna("").astype(str).str.strip(),
+            "asset_name": (
+                holdings_df["asset_name"].fillna("").astype(str).str.strip()
+                if "asset_name" in holdings_df.columns
+                else ""
+            ),
+            "asset_type": holdings_df["asset_type"].fillna("").astype(str).str.strip().str.lower(),
+        }
+    )
+    names = df.loc[df["asset_name"].ne(""), ["asset_id", "asset_name"]].drop_duplicates("asset_id")
+    typed = df.loc[df["asset_type"].ne(""), ["asset_id", "asset_type"]]
+    types = (
+        typed.assign(row_order=np.arange(len(typed)))
+        .groupby(["asset_id", "asset_type"], as_index=False, sort=False)
+        .agg(type_count=("row_order", "size"), first_seen=("row_order", "min"))
+        .sort_values(by=["asset_id", "type_count", "first_seen"], ascending=[True, False, True])
+        .drop_duplicates("asset_id")[["asset_id", "asset_type"]]
+    )
+    return (
+        pd.DataFrame({"asset_id": df["asset_id"].unique()})
+        .merge(names, on="asset_id", how="left")
+        .merge(types, on="asset_id", how="left")
+        .fillna({"asset_name": "", "asset_type": ""})[output_columns]
+    )
 
 
-def _write_partition(engine: Engine, as_of_date: str, exposure_df: pd.DataFrame) -> int:
-    table_name = "mart_true_exposure"
-    _delete_partition(engine, table_name, as_of_date)
+def _build_top_assets(
+    exposure_df: pd.DataFrame,
+    holdings_df: pd.DataFrame,
+    links_df: pd.DataFrame,
+    top_n: int = TOP_MART_ROWS,
+) -> pd.DataFrame:
+    """Top assets by summed effective weight, per root scope ("all" / "feeders") and asset type."""
+    output_columns = ["root_scope", "asset_type", "asset_rank", "asset_id", "asset_name", "total_weight"]
     if exposure_df.empty:
-        return 0
-    to_write = exposure_df.copy()
-    to_write["as_of_date"] = as_of_date
-    to_write.to_sql(table_name, engine, if_exists="append", index=False, method="multi")
-    return len(to_write)
+        return pd.DataFrame(columns=output_columns)
 
+    feeders = set(links_df["feeder_fund_id"].astype(str).str.strip()) if not links_df.empty else set()
+    labels = _asset_labels(holdings_df)
+    scopes = {"all": exposure_df}
+    if feeders:
+        scopes["feeders"] = exposure_df[exposure_df["root_fund_id"].isin(feeders)]
+
+    frames: list[pd.DataFrame] = []
+    for scope, rows in scopes.items():
+        totals = (
+            rows.groupby("final_asset_id", as_index=False)
+            .agg(total_weight=("effective_weight", "sum"))
+            .rename(columns={"final_asset_id": "asset_id"})
+            .merge(labels, on="asset_id", how="left")
+            .fillna({"asset_name": "", "asset_type": ""})
+            .sort_values(by=["asset_type", "total_weight", "asset_id"], ascending=[True, False, True])
+        )
+        totals["asset_rank"] = totals.groupby("asset_type").cumcount() + 1
+        frames.append(totals[totals["asset_rank"] <= top_n].assign(root_scope=scope))
+
+    return pd.concat(frames, ignore_index=True)[output_columns]
+
+
+def _build_top_masters(
+    links_df: pd.DataFrame, funds_df: pd.DataFrame, top_n: int = TOP_MART_ROWS
+) -> pd.DataFrame:
+    """Top master funds by summed (clipped) link confidence, with distinct feeder counts."""
+    output_columns = ["master_rank", "master_fund_id", "master_name", "master_source", "score", "feeder_count"]
+    if links_df.empty:
+        return pd.DataFrame(columns=output_columns)
 
-def main() -> int:
-    args = _parse_args()
+    links = pd.DataFrame(
+        {
+            "feeder_fund_id": links_df["feeder_fund_id"].astype(str),
+            "master_fund_id": links_df["master_fund_id"].astype(str),
+            "score": pd.to_numeric(links_df["confidence"], errors="coerce").fillna(0.0).clip(lower=0.0, upper=1.0),
+        }
+    )
+    grouped = (
+        links.groupby("master_fund_id", as_index=False)
+        .agg(score=("score", "sum"), feeder_count=("feeder_fund_id", "nunique"))
+        .sort_values(by=["score", "master_fund_id"], ascending=[False, True])
+        .head(top_n)
+        .reset_index(drop=True)
+    )
+    if not funds_df.empty:
+        meta = funds_df[["fund_id", "fund_name", "source"]].drop_duplicates("fund_id")
+        meta = meta.rename(columns={"fund_id": "master_fund_id", "fund_name": "master_name", "source": "master_source"})
+        grouped = grouped.merge(meta, on="master_fund_id", how="left")
+    else:
+        grouped = grouped.assign(master_name="", master_source="")
+    grouped = grouped.fillna({"master_name": "", "master_source": ""})
+    grouped["master_rank"] = np.arange(1, len(grouped) + 1)
+    return grouped[output_columns]
+
+
+def _write_partition(
+    engine: Engine, as_of_date: str, exposure_df: pd.DataFrame, table_name: str = "mart_true_exposure"
+) -> int:
+    # Replace the partition in one transaction: one commit, and readers never see it half-written.
+    with engine.begin() as conn:
+        delete_partition(conn, table_name, as_of_date)
+        if not exposure_df.empty:
+            # The partition date rides along as a bound constant rather than a column on a full copy of the frame.
+            insert_frame(conn, table_name, exposure_df, {"as_of_date": as_of_date})
+    return len(exposure_df)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
     as_of_date = args.as_of_date
     max_depth = max(1, args.max_depth)
 
     staging_engine = create_traceability_staging_engine()
     mart_engine = create_traceability_mart_engine()
 
-    _run_sql_file(mart_engine, SQL_MART_TABLES)
+    run_sql_file(mart_engine, SQL_MART_TABLES)
 
-    holdings_df = _load_partition(staging_engine, "stg_holdings", as_of_date)
-    links_df = _load_partition(staging_engine, "stg_fund_links", as_of_date)
+    holdings_df = _load_partition(staging_engine, "stg_holdings", as_of_date, HOLDINGS_COLUMNS)
+    links_df = _load_partition(staging_engine, "stg_fund_links", as_of_date, LINKS_COLUMNS)
+    funds_df = _load_partition(staging_engine, "stg_funds", as_of_date, FUNDS_COLUMNS)
 
     if not holdings_df.empty:
         require_columns(holdings_df, {"fund_id", "asset_id", "asset_type", "weight"})
@@ -217,6 +615,12 @@ def main() -> int:
 
     exposure_df = _compute_true_exposure(holdings_df, links_df, max_depth=max_depth)
     written_rows = _write_partition(mart_engine, as_of_date, exposure_df)
+    top_assets_rows = _write_partition(
+        mart_engine, as_of_date, _build_top_assets(exposure_df, holdings_df, links_df), "mart_top_assets"
+    )
+    top_masters_rows = _write_partition(
+        mart_engine, as_of_date, _build_top_masters(links_df, funds_df), "mart_top_masters"
+    )
 
     print(
         "run_build_mart completed",
@@ -225,6 +629,8 @@ def main() -> int:
         f"rows(stg_holdings)={len(holdings_df)}",
         f"rows(stg_fund_links)={len(links_df)}",
         f"rows(mart_true_exposure)={written_rows}",
+        f"rows(mart_top_assets)={top_assets_rows}",
+        f"rows(mart_top_masters)={top_masters_rows}",
     )
     return 0
 
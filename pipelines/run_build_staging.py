@@ -6,18 +6,31 @@ import argparse
 from datetime import date
 from pathlib import Path
 import sys
+from typing import Collection, Sequence
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import inspect, text
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 # Allow running directly from repo root without package installation.
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from db.connections import create_global_raw_engine, create_traceability_staging_engine  # noqa: E402
-from transform.normalize.currency_normalizer import normalize_currency  # noqa: E402
+from db.partitions import delete_partition, insert_frame, inspector, read_streamed  # noqa: E402
+from db.sql_files import run_sql_file  # noqa: E402
+from transform.normalize.currency_normalizer import normalize_currency_series  # noqa: E402
 from utils.validation import require_columns  # noqa: E402
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    TEXT_DTYPE: object = "string[pyarrow]"
+except ImportError:  # Optional: the "arrow" extra keeps id/name columns as Arrow strings.
+    pa = pc = None
+    TEXT_DTYPE = object
+
 SQL_STAGING_TABLES = Path(__file__).resolve().parents[1] / "sql" / "10_staging_tables.sql"
 
 FUND_TABLE_CANDIDATES = ["raw_funds", "funds", "global_funds", "master_funds", "fund_master"]
@@ -25,48 +38,21 @@ HOLDINGS_TABLE_CANDIDATES = ["raw_holdings", "holdings", "global_holdings", "fun
 LINK_TABLE_CANDIDATES = ["raw_fund_links", "fund_links", "feeder_master_links", "feeder_master_map"]
 
 
-def _parse_args() -> argparse.Namespace:
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build traceability staging tables from global raw data.")
     parser.add_argument(
         "--as-of-date",
         default=date.today().isoformat(),
         help="Partition date in YYYY-MM-DD format (default: today).",
     )
-    return parser.parse_args()
-
-
-def _split_sql_statements(sql_text: str) -> list[str]:
-    statements: list[str] = []
-    buffer: list[str] = []
-    for line in sql_text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("--"):
-            continue
-        buffer.append(line)
-        if stripped.endswith(";"):
-            statement = "\n".join(buffer).strip()
-            if statement:
-                statements.append(statement)
-            buffer = []
-    tail = "\n".join(buffer).strip()
-    if tail:
-        statements.append(tail)
-    return statements
-
-
-def _run_sql_file(engine: Engine, path: Path) -> None:
-    sql_text = path.read_text(encoding="utf-8")
-    statements = _split_sql_statements(sql_text)
-    with engine.begin() as conn:
-        for statement in statements:
-            conn.execute(text(statement))
+    return parser.parse_args(argv)
 
 
 def _load_first_existing_table(engine: Engine, candidates: list[str]) -> tuple[pd.DataFrame, str | None]:
-    existing = set(inspect(engine).get_table_names())
+    existing = set(inspector(engine).get_table_names())
     for table_name in candidates:
         if table_name in existing:
-            return pd.read_sql_table(table_name, engine), table_name
+            return read_streamed(engine, text(f"SELECT * FROM {table_name}")), table_name
     return pd.DataFrame(), None
 
 
@@ -78,6 +64,21 @@ def _pick_column(df: pd.DataFrame, candidates: list[str]) -> str | None:
     return None
 
 
+def _clean_text(values: pd.Series) -> pd.Series:
+    if TEXT_DTYPE is object:
+        return values.fillna("").astype(str).str.strip()
+    # Straight to Arrow: no intermediate object Series of str() copies before the C strip kernel.
+    return values.astype(TEXT_DTYPE).fillna("").str.strip()
+
+
+def _is_in(values: pd.Series, members: Collection[str]) -> np.ndarray:
+    if pc is not None and isinstance(values.dtype, pd.StringDtype):
+        # Series.isin boxes every member into an Arrow scalar; one is_in call hashes the whole set in C.
+        mask = pc.is_in(pa.array(values.array), value_set=pa.array(list(members), type=pa.string()))
+        return mask.to_numpy(zero_copy_only=False)
+    return values.isin(list(members)).to_numpy()
+
+
 def _normalize_funds(raw_df: pd.DataFrame, as_of_date: str) -> pd.DataFrame:
     output_columns = ["fund_id", "fund_name", "source", "currency", "as_of_date"]
     if raw_df.empty:
@@ -91,19 +92,15 @@ def _normalize_funds(raw_df: pd.DataFrame, as_of_date: str) -> pd.DataFrame:
     source_col = _pick_column(raw_df, ["source", "source_system", "provider"])
     currency_col = _pick_column(raw_df, ["currency", "currency_code", "ccy"])
 
-    fund_ids = raw_df[fund_id_col].fillna("").astype(str).str.strip()
-    fund_names = (
-        raw_df[name_col].fillna("").astype(str).str.strip()
-        if name_col is not None
-        else raw_df[fund_id_col].fillna("").astype(str).str.strip()
-    )
+    fund_ids = _clean_text(raw_df[fund_id_col])
+    fund_names = _clean_text(raw_df[name_col]) if name_col is not None else fund_ids
     sources = (
-        raw_df[source_col].fillna("global").astype(str).str.strip().str.lower()
+        _clean_text(raw_df[source_col]).str.lower()
         if source_col is not None
         else pd.Series("global", index=raw_df.index)
     )
     currencies = (
-        raw_df[currency_col].fillna("").astype(str).map(normalize_currency)
+        normalize_currency_series(raw_df[currency_col].fillna("").astype(str))
         if currency_col is not None
         else pd.Series("", index=raw_df.index)
     )
@@ -122,7 +119,7 @@ def _normalize_funds(raw_df: pd.DataFrame, as_of_date: str) -> pd.DataFrame:
     return normalized[output_columns]
 
 
-def _normalize_holdings(raw_df: pd.DataFrame, as_of_date: str, known_fund_ids: set[str]) -> pd.DataFrame:
+def _normalize_holdings(raw_df: pd.DataFrame, as_of_date: str, known_fund_ids: Collection[str]) -> pd.DataFrame:
     output_columns = ["fund_id", "asset_id", "asset_name", "asset_type", "weight", "as_of_date"]
     if raw_df.empty:
         return pd.DataFrame(columns=output_columns)
@@ -140,20 +137,22 @@ def _normalize_holdings(raw_df: pd.DataFrame, as_of_date: str, known_fund_ids: s
     if not weights.empty and weights.max() > 1.0:
         weights = weights / 100.0
 
-    asset_ids = raw_df[asset_id_col].fillna("").astype(str).str.strip()
-    inferred_types = asset_ids.map(lambda asset_id: "fund" if asset_id in known_fund_ids else "other")
+    asset_ids = _clean_text(raw_df[asset_id_col])
+    inferred_types = pd.Series(
+        np.where(_is_in(asset_ids, known_fund_ids), "fund", "other"), index=asset_ids.index, dtype=object
+    )
 
     normalized = pd.DataFrame(
         {
-            "fund_id": raw_df[fund_id_col].fillna("").astype(str).str.strip(),
+            "fund_id": _clean_text(raw_df[fund_id_col]),
             "asset_id": asset_ids,
             "asset_name": (
-                raw_df[asset_name_col].fillna("").astype(str).str.strip()
+                _clean_text(raw_df[asset_name_col])
                 if asset_name_col is not None
                 else asset_ids
             ),
             "asset_type": (
-                raw_df[asset_type_col].fillna("").astype(str).str.strip().str.lower()
+                _clean_text(raw_df[asset_type_col]).str.lower()
                 if asset_type_col is not None
                 else inferred_types
             ),
@@ -187,8 +186,8 @@ def _normalize_links(raw_df: pd.DataFrame, as_of_date: str) -> pd.DataFrame:
 
     normalized = pd.DataFrame(
         {
-            "feeder_fund_id": raw_df[feeder_col].fillna("").astype(str).str.strip(),
-            "master_fund_id": raw_df[master_col].fillna("").astype(str).str.strip(),
+            "feeder_fund_id": _clean_text(raw_df[feeder_col]),
+            "master_fund_id": _clean_text(raw_df[master_col]),
             "confidence": confidence.clip(lower=0.0, upper=1.0),
             "as_of_date": as_of_date,
         }
@@ -200,30 +199,37 @@ def _normalize_links(raw_df: pd.DataFrame, as_of_date: str) -> pd.DataFrame:
     return normalized[output_columns]
 
 
-def _delete_partition(engine: Engine, table_name: str, as_of_date: str) -> None:
-    with engine.begin() as conn:
-        conn.execute(
-            text(f"DELETE FROM {table_name} WHERE as_of_date = :as_of_date"),
-            {"as_of_date": as_of_date},
-        )
+def _build_filter_values(funds_df: pd.DataFrame, links_df: pd.DataFrame, as_of_date: str) -> pd.DataFrame:
+    output_columns = ["kind", "value", "as_of_date"]
+    sources = sorted({s for s in funds_df["source"].astype(str) if s.strip()}) if not funds_df.empty else []
+    feeders = sorted(set(links_df["feeder_fund_id"].astype(str))) if not links_df.empty else []
+
+    # The partition marker tells readers this snapshot's values are complete, even when empty.
+    rows = [("partition", as_of_date)]
+    rows += [("source", value) for value in sources]
+    rows += [("feeder", value) for value in feeders]
+    filter_values = pd.DataFrame(rows, columns=["kind", "value"])
+    filter_values["as_of_date"] = as_of_date
+    return filter_values[output_columns]
 
 
 def _write_partition(engine: Engine, table_name: str, as_of_date: str, df: pd.DataFrame) -> int:
-    _delete_partition(engine, table_name, as_of_date)
-    if df.empty:
-        return 0
-    df.to_sql(table_name, engine, if_exists="append", index=False, method="multi")
+    # Replace the partition in one transaction: one commit, and readers never see it half-written.
+    with engine.begin() as conn:
+        delete_partition(conn, table_name, as_of_date)
+        if not df.empty:
+            insert_frame(conn, table_name, df)
     return len(df)
 
 
-def main() -> int:
-    args = _parse_args()
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
     as_of_date = args.as_of_date
 
     source_engine = create_global_raw_engine()
     staging_engine = create_traceability_staging_engine()
 
-    _run_sql_file(staging_engine, SQL_STAGING_TABLES)
+    run_sql_file(staging_engine, SQL_STAGING_TABLES)
 
     raw_funds_df, funds_source = _load_first_existing_table(source_engine, FUND_TABLE_CANDIDATES)
     raw_holdings_df, holdings_source = _load_first_existing_table(source_engine, HOLDINGS_TABLE_CANDIDATES)
@@ -241,6 +247,9 @@ def main() -> int:
     funds_rows = _write_partition(staging_engine, "stg_funds", as_of_date, funds_df)
     holdings_rows = _write_partition(staging_engine, "stg_holdings", as_of_date, holdings_df)
     links_rows = _write_partition(staging_engine, "stg_fund_links", as_of_date, links_df)
+    filter_rows = _write_partition(
+        staging_engine, "stg_filter_values", as_of_date, _build_filter_values(funds_df, links_df, as_of_date)
+    )
 
     print(
         "run_build_staging completed",
@@ -251,6 +260,7 @@ def main() -> int:
         f"rows(stg_funds)={funds_rows}",
         f"rows(stg_holdings)={holdings_rows}",
         f"rows(stg_fund_links)={links_rows}",
+        f"rows(stg_filter_values)={filter_rows}",
     )
     return 0
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -38,9 +39,12 @@ def main() -> int:
         ("traceability_mart", create_traceability_mart_engine),
     ]
 
+    # Each check is one network round-trip; run them side by side and report in the original order.
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        results = list(pool.map(lambda check: _check(*check), checks))
+
     failed = False
-    for name, factory in checks:
-        db_name, ok, detail = _check(name, factory)
+    for db_name, ok, detail in results:
         status = "PASS" if ok else "FAIL"
         print(f"[{status}] {db_name}: {detail}")
         if not ok:
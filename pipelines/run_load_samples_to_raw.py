@@ -14,7 +14,15 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from db.connections import create_global_raw_engine  # noqa: E402
 
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:  # Optional: the "arrow" extra parses CSVs with Arrow's multithreaded reader.
+    CSV_ENGINE = "c"
+
 DEFAULT_SAMPLES_DIR = Path(__file__).resolve().parents[1] / "data" / "samples"
+WRITE_BATCH_ROWS = 10_000
 
 
 def _parse_args() -> argparse.Namespace:
@@ -41,13 +49,13 @@ def _parse_args() -> argparse.Namespace:
 def _read_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Sample file not found: {path}")
-    return pd.read_csv(path)
+    return pd.read_csv(path, engine=CSV_ENGINE)
 
 
 def _attach_as_of_date(df: pd.DataFrame, as_of_date: str) -> pd.DataFrame:
-    out = df.copy()
-    out["as_of_date"] = as_of_date
-    return out
+    # Frames come straight from _read_csv, so the column is added in place instead of on a copy.
+    df["as_of_date"] = as_of_date
+    return df
 
 
 def main() -> int:
@@ -63,9 +71,9 @@ def main() -> int:
     links_df = _attach_as_of_date(_read_csv(raw_links_path), args.as_of_date)
 
     engine = create_global_raw_engine()
-    funds_df.to_sql("raw_funds", engine, if_exists=args.if_exists, index=False, method="multi")
-    holdings_df.to_sql("raw_holdings", engine, if_exists=args.if_exists, index=False, method="multi")
-    links_df.to_sql("raw_fund_links", engine, if_exists=args.if_exists, index=False, method="multi")
+    funds_df.to_sql("raw_funds", engine, if_exists=args.if_exists, index=False, chunksize=WRITE_BATCH_ROWS)
+    holdings_df.to_sql("raw_holdings", engine, if_exists=args.if_exists, index=False, chunksize=WRITE_BATCH_ROWS)
+    links_df.to_sql("raw_fund_links", engine, if_exists=args.if_exists, index=False, chunksize=WRITE_BATCH_ROWS)
 
     print(
         "run_load_samples_to_raw completed",
@@ -2,31 +2,76 @@
 
 from __future__ import annotations
 
-import math
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import csv
+import importlib.util
 from pathlib import Path
+import queue
+import re
 import sys
+import threading
 import time
-from typing import Any
-
-from sqlalchemy import text
-
-try:
-    import tkinter as tk
-    from tkinter import filedialog, messagebox, ttk
-except Exception as exc:  # pragma: no cover - depends on local Python build
-    tk = None  # type: ignore[assignment]
-    filedialog = None  # type: ignore[assignment]
-    messagebox = None  # type: ignore[assignment]
-    ttk = None  # type: ignore[assignment]
-    TK_IMPORT_ERROR: Exception | None = exc
-else:
-    TK_IMPORT_ERROR = None
+from typing import Any, Callable
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql.elements import TextClause
+
+# Tk is imported when the window is created, so importing this module stays cheap.
+TK_AVAILABLE = importlib.util.find_spec("tkinter") is not None
+tk: Any = None
+filedialog: Any = None
+messagebox: Any = None
+ttk: Any = None
 
 # Allow running directly from repo root without package installation.
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from db.connections import create_traceability_staging_engine  # noqa: E402
 
+UI_POOL_SIZE = 2
+SEARCH_DEBOUNCE_MS = 400
+UI_QUEUE_POLL_MS = 50
+MIN_KEYWORD_LENGTH = 2
+PAGE_CACHE_MAX = 32
+TOTAL_ROWS_KEY = "_total_rows"
+_UNSET = object()
+FULLTEXT_INDEXES = {"ft_stg_funds", "ft_stg_funds_name_source", "ft_stg_holdings", "ft_stg_links"}
+# InnoDB skips words shorter than innodb_ft_min_token_size (3) and its default stopwords.
+FULLTEXT_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z]{3,}")
+FULLTEXT_STOPWORDS = {
+    "about", "are", "com", "for", "from", "how", "that", "the", "this", "und", "was", "what", "when", "where",
+    "who", "will", "with", "www",
+}
+
+
+def _ensure_tk() -> None:
+    global tk, filedialog, messagebox, ttk
+    if tk is not None:
+        return
+    try:
+        import tkinter
+        from tkinter import filedialog as tk_filedialog, messagebox as tk_messagebox, ttk as tk_ttk
+    except Exception as exc:  # pragma: no cover - depends on local Python build
+        raise RuntimeError(
+            "Tkinter is not available in this Python environment. "
+            "Install a Python build with Tk support, then run this UI again."
+        ) from exc
+    tk, filedialog, messagebox, ttk = tkinter, tk_filedialog, tk_messagebox, tk_ttk
+
+
+def _create_ui_engine() -> Engine:
+    # A single-user window needs only a small warm pool: one connection per query worker.
+    return create_engine(
+        create_traceability_staging_engine().url,
+        pool_size=UI_POOL_SIZE,
+        max_overflow=UI_POOL_SIZE,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
 
 def _format_value(value: Any) -> str:
     if value is None:
@@ -36,22 +81,36 @@ def _format_value(value: Any) -> str:
     return str(value)
 
 
+def _page_count(total_rows: int, page_size: int) -> int:
+    return max(1, -(-total_rows // page_size))
+
+
+def _format_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+# Chosen per grid column once, so rendering skips the float check on text cells.
+COLUMN_FORMATTERS = {"text": _format_text, "number": _format_value}
+
+
 DATASET_SPECS: dict[str, dict[str, Any]] = {
     "funds": {
         "label": "Funds",
         "from_sql": "FROM stg_funds t",
         "columns": [
-            ("fund_id", "t.fund_id", "Fund ID", 180, "w"),
-            ("fund_name", "t.fund_name", "Fund Name", 320, "w"),
-            ("source", "t.source", "Source", 120, "center"),
-            ("currency", "t.currency", "Currency", 90, "center"),
-            ("as_of_date", "t.as_of_date", "As Of", 110, "center"),
-            ("loaded_at", "t.loaded_at", "Loaded At", 180, "center"),
+            ("fund_id", "t.fund_id", "Fund ID", 180, "w", "text"),
+            ("fund_name", "t.fund_name", "Fund Name", 320, "w", "text"),
+            ("source", "t.source", "Source", 120, "center", "text"),
+            ("currency", "t.currency", "Currency", 90, "center", "text"),
+            ("as_of_date", "t.as_of_date", "As Of", 110, "center", "text"),
+            ("loaded_at", "t.loaded_at", "Loaded At", 180, "center", "text"),
         ],
         "search_exprs": ["t.fund_id", "t.fund_name", "t.source", "t.currency"],
+        "fulltext_groups": [("t.fund_id", "t.fund_name", "t.source", "t.currency")],
         "as_of_expr": "t.as_of_date",
         "source_expr": "t.source",
         "default_sort": "fund_id",
+        "key_columns": ["fund_id", "as_of_date"],
     },
     "holdings": {
         "label": "Holdings",
@@ -60,19 +119,21 @@ DATASET_SPECS: dict[str, dict[str, Any]] = {
             "LEFT JOIN stg_funds f ON h.fund_id = f.fund_id AND h.as_of_date = f.as_of_date"
         ),
         "columns": [
-            ("fund_id", "h.fund_id", "Fund ID", 170, "w"),
-            ("fund_name", "f.fund_name", "Fund Name", 260, "w"),
-            ("source", "f.source", "Source", 120, "center"),
-            ("asset_id", "h.asset_id", "Asset ID", 170, "w"),
-            ("asset_name", "h.asset_name", "Asset Name", 260, "w"),
-            ("asset_type", "h.asset_type", "Asset Type", 110, "center"),
-            ("weight", "h.weight", "Weight", 100, "e"),
-            ("as_of_date", "h.as_of_date", "As Of", 110, "center"),
+            ("fund_id", "h.fund_id", "Fund ID", 170, "w", "text"),
+            ("fund_name", "f.fund_name", "Fund Name", 260, "w", "text"),
+            ("source", "f.source", "Source", 120, "center", "text"),
+            ("asset_id", "h.asset_id", "Asset ID", 170, "w", "text"),
+            ("asset_name", "h.asset_name", "Asset Name", 260, "w", "text"),
+            ("asset_type", "h.asset_type", "Asset Type", 110, "center", "text"),
+            ("weight", "h.weight", "Weight", 100, "e", "number"),
+            ("as_of_date", "h.as_of_date", "As Of", 110, "center", "text"),
         ],
         "search_exprs": ["h.fund_id", "f.fund_name", "f.source", "h.asset_id", "h.asset_name", "h.asset_type"],
+        "fulltext_groups": [("h.fund_id", "h.asset_id", "h.asset_name", "h.asset_type"), ("f.fund_name", "f.source")],
         "as_of_expr": "h.as_of_date",
         "source_expr": "f.source",
         "default_sort": "fund_id",
+        "key_columns": ["fund_id", "asset_id", "as_of_date"],
     },
     "links": {
         "label": "Links",
@@ -82,14 +143,14 @@ DATASET_SPECS: dict[str, dict[str, Any]] = {
             "LEFT JOIN stg_funds mf ON l.master_fund_id = mf.fund_id AND l.as_of_date = mf.as_of_date"
         ),
         "columns": [
-            ("feeder_fund_id", "l.feeder_fund_id", "Feeder Fund ID", 170, "w"),
-            ("feeder_name", "ff.fund_name", "Feeder Name", 240, "w"),
-            ("feeder_source", "ff.source", "Feeder Source", 120, "center"),
-            ("master_fund_id", "l.master_fund_id", "Master Fund ID", 170, "w"),
-            ("master_name", "mf.fund_name", "Master Name", 240, "w"),
-            ("master_source", "mf.source", "Master Source", 120, "center"),
-            ("confidence", "l.confidence", "Confidence", 100, "e"),
-            ("as_of_date", "l.as_of_date", "As Of", 110, "center"),
+            ("feeder_fund_id", "l.feeder_fund_id", "Feeder Fund ID", 170, "w", "text"),
+            ("feeder_name", "ff.fund_name", "Feeder Name", 240, "w", "text"),
+            ("feeder_source", "ff.source", "Feeder Source", 120, "center", "text"),
+            ("master_fund_id", "l.master_fund_id", "Master Fund ID", 170, "w", "text"),
+            ("master_name", "mf.fund_name", "Master Name", 240, "w", "text"),
+            ("master_source", "mf.source", "Master Source", 120, "center", "text"),
+            ("confidence", "l.confidence", "Confidence", 100, "e", "number"),
+            ("as_of_date", "l.as_of_date", "As Of", 110, "center", "text"),
         ],
         "search_exprs": [
             "l.feeder_fund_id",
@@ -99,22 +160,24 @@ DATASET_SPECS: dict[str, dict[str, Any]] = {
             "mf.fund_name",
             "mf.source",
         ],
+        "fulltext_groups": [
+            ("l.feeder_fund_id", "l.master_fund_id"),
+            ("ff.fund_name", "ff.source"),
+            ("mf.fund_name", "mf.source"),
+        ],
         "as_of_expr": "l.as_of_date",
         "source_expr": "COALESCE(ff.source, mf.source)",
         "default_sort": "feeder_fund_id",
+        "key_columns": ["feeder_fund_id", "master_fund_id", "as_of_date"],
     },
 }
 
 
 class LocalSearchUI:
     def __init__(self) -> None:
-        if TK_IMPORT_ERROR is not None:
-            raise RuntimeError(
-                "Tkinter is not available in this Python environment. "
-                "Install a Python build with Tk support, then run this UI again."
-            ) from TK_IMPORT_ERROR
+        _ensure_tk()
 
-        self.engine = create_traceability_staging_engine()
+        self.engine = _create_ui_engine()
 
         self.root = tk.Tk()
         self.root.title("Fund Traceability - Local Search UI")
@@ -134,15 +197,42 @@ class LocalSearchUI:
         self.sort_desc = False
 
         self._search_after_id: str | None = None
+        self._last_submitted_keyword = ""
+        self._filter_signature: tuple[Any, ...] | None = None
+        self._page_cache: OrderedDict[tuple[Any, ...], tuple[list[dict[str, Any]], int]] = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=UI_POOL_SIZE, thread_name_prefix="local-search")
+        # Worker threads never call Tk (not even root.after); they queue callbacks for the main loop to run.
+        self._ui_queue: queue.Queue[tuple[Callable[..., Any], tuple[Any, ...]]] = queue.Queue()
+        self._query_gen = 0
+        self._filter_options_cache: tuple[list[str], list[str]] | None = None
+        self._fulltext_ready: bool | None = None
+        self._stmt_cache: dict[tuple[Any, ...], tuple[TextClause, ...]] = {}
+        self._window_count_ok = True
         self._item_rows: dict[str, dict[str, Any]] = {}
+        self._page_controls_state: tuple[str | None, bool | None, bool | None] = (None, None, None)
+        self._details_row: Any = _UNSET
+        self._col_formatters: list[tuple[str, Callable[[Any], str]]] = []
         self._last_rows: list[dict[str, Any]] = []
 
         self._build_style()
         self._build_layout()
         self._reload_filter_options()
         self._configure_tree_for_dataset()
+        self._drain_ui_queue()
         self._run_query(reset_page=True)
 
+    def _drain_ui_queue(self) -> None:
+        try:
+            while True:
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                callback(*args)
+        finally:
+            self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
     def _build_style(self) -> None:
         self.root.configure(bg="#f3f6fb")
         style = ttk.Style(self.root)
@@ -246,7 +336,7 @@ class LocalSearchUI:
         ttk.Label(parent, text="As Of Date", style="FieldLabel.TLabel").grid(row=0, column=1, sticky="w", padx=(0, 6))
         self.as_of_combo = ttk.Combobox(parent, textvariable=self.as_of_var, values=["All"], state="readonly", width=14)
         self.as_of_combo.grid(row=1, column=1, sticky="w", padx=(0, 12), pady=(2, 0))
-        self.as_of_combo.bind("<<ComboboxSelected>>", lambda _e: self._run_query(reset_page=True))
+        self.as_of_combo.bind("<<ComboboxSelected>>", self._on_filter_changed)
 
         ttk.Label(parent, text="Source", style="FieldLabel.TLabel").grid(row=0, column=2, sticky="w", padx=(0, 6))
         self.source_combo = ttk.Combobox(
@@ -257,7 +347,7 @@ class LocalSearchUI:
             width=18,
         )
         self.source_combo.grid(row=1, column=2, sticky="w", padx=(0, 12), pady=(2, 0))
-        self.source_combo.bind("<<ComboboxSelected>>", lambda _e: self._run_query(reset_page=True))
+        self.source_combo.bind("<<ComboboxSelected>>", self._on_filter_changed)
 
         ttk.Label(parent, text="Keyword Search", style="FieldLabel.TLabel").grid(row=0, column=3, sticky="w")
         self.search_entry = ttk.Entry(parent, textvariable=self.search_var)
@@ -276,7 +366,7 @@ class LocalSearchUI:
             width=8,
         )
         self.page_size_combo.grid(row=1, column=5, sticky="w", padx=(0, 12), pady=(2, 0))
-        self.page_size_combo.bind("<<ComboboxSelected>>", lambda _e: self._run_query(reset_page=True))
+        self.page_size_combo.bind("<<ComboboxSelected>>", self._on_filter_changed)
 
         refresh_btn = ttk.Button(parent, text="Refresh", command=self._refresh_all)
         refresh_btn.grid(row=1, column=6, sticky="w", padx=(0, 8), pady=(2, 0))
@@ -297,11 +387,11 @@ class LocalSearchUI:
         self.tree.grid(row=0, column=0, sticky="nsew")
         self.tree.bind("<<TreeviewSelect>>", self._on_row_selected)
 
-        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        y_scroll.grid(row=0, column=1, sticky="ns")
+        self.y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.y_scroll.grid(row=0, column=1, sticky="ns")
         x_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
         x_scroll.grid(row=1, column=0, sticky="ew")
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        self.tree.configure(yscrollcommand=self.y_scroll.set, xscrollcommand=x_scroll.set)
 
         paging_frame = ttk.Frame(parent, style="Card.TFrame", padding=(0, 8, 0, 6))
         paging_frame.grid(row=1, column=0, sticky="ew")
@@ -339,38 +429,13 @@ class LocalSearchUI:
         source_values = ["All"]
 
         try:
-            with self.engine.connect() as conn:
-                as_of_rows = conn.execute(
-                    text(
-                        """
-                        SELECT DISTINCT as_of_date
-                        FROM (
-                            SELECT as_of_date FROM stg_funds
-                            UNION
-                            SELECT as_of_date FROM stg_holdings
-                            UNION
-                            SELECT as_of_date FROM stg_fund_links
-                        ) d
-                        WHERE as_of_date IS NOT NULL
-                        ORDER BY as_of_date DESC
-                        """
-                    )
-                ).fetchall()
-                as_of_values.extend(_format_value(row[0]) for row in as_of_rows)
-
-                source_rows = conn.execute(
-                    text(
-                        """
-                        SELECT DISTINCT source
-                        FROM stg_funds
-                        WHERE source IS NOT NULL AND TRIM(source) <> ''
-                        ORDER BY source
-                        """
-                    )
-                ).fetchall()
-                source_values.extend(_format_value(row[0]) for row in source_rows)
+            if self._filter_options_cache is None:
+                self._filter_options_cache = self._load_filter_options()
         except Exception as exc:  # intentionally broad for interactive UI
             messagebox.showwarning("Staging Lookup Warning", f"Could not load filter options: {exc}")
+        else:
+            as_of_values.extend(self._filter_options_cache[0])
+            source_values.extend(self._filter_options_cache[1])
 
         self.as_of_combo["values"] = as_of_values
         self.source_combo["values"] = source_values
@@ -380,6 +445,46 @@ class LocalSearchUI:
         if self.source_var.get() not in source_values:
             self.source_var.set("All")
 
+    def _load_filter_options(self) -> tuple[list[str], list[str]]:
+        as_of_values: list[str] = []
+        source_values: list[str] = []
+
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(stream_results=True, yield_per=500)
+            as_of_result = conn.execute(
+                text(
+                    """
+                    SELECT DISTINCT as_of_date
+                    FROM (
+                        SELECT as_of_date FROM stg_funds
+                        UNION
+                        SELECT as_of_date FROM stg_holdings
+                        UNION
+                        SELECT as_of_date FROM stg_fund_links
+                    ) d
+                    WHERE as_of_date IS NOT NULL
+                    ORDER BY as_of_date DESC
+                    """
+                )
+            )
+            for row in as_of_result:
+                as_of_values.append(_format_value(row[0]))
+
+            source_result = conn.execute(
+                text(
+                    """
+                    SELECT DISTINCT source
+                    FROM stg_funds
+                    WHERE source IS NOT NULL AND TRIM(source) <> ''
+                    ORDER BY source
+                    """
+                )
+            )
+            for row in source_result:
+                source_values.append(_format_value(row[0]))
+
+        return as_of_values, source_values
+
     def _dataset_spec(self) -> dict[str, Any]:
         return DATASET_SPECS[self.dataset_var.get()]
 
@@ -390,33 +495,101 @@ class LocalSearchUI:
         self.tree.delete(*self.tree.get_children())
         self.tree["columns"] = columns
 
-        for key, _expr, heading, width, anchor in spec["columns"]:
+        for key, _expr, heading, width, anchor, _kind in spec["columns"]:
             self.tree.heading(key, text=heading, command=lambda column=key: self._on_sort(column))
             self.tree.column(key, width=width, minwidth=80, anchor=anchor, stretch=True)
 
+        self._col_formatters = [(col[0], COLUMN_FORMATTERS[col[5]]) for col in spec["columns"]]
         self.sort_column = spec["default_sort"]
         self.sort_desc = False
 
+    def _cancel_pending_search(self) -> None:
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+
     def _on_dataset_changed(self, _event: tk.Event[tk.Misc] | None = None) -> None:
+        self._cancel_pending_search()
+        self._clear_page_cache()
         self._configure_tree_for_dataset()
         self._run_query(reset_page=True)
 
+    def _on_filter_changed(self, _event: tk.Event[tk.Misc] | None = None) -> None:
+        self._cancel_pending_search()
+        self._run_query(reset_page=True)
+
     def _on_search_keyup(self, _event: tk.Event[tk.Misc]) -> None:
-        if self._search_after_id is not None:
-            self.root.after_cancel(self._search_after_id)
-        self._search_after_id = self.root.after(280, lambda: self._run_query(reset_page=True))
+        self._cancel_pending_search()
+        keyword = self.search_var.get().strip()
+        # A single character matches nearly every row; wait for more input.
+        if keyword == self._last_submitted_keyword or 0 < len(keyword) < MIN_KEYWORD_LENGTH:
+            return
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._run_debounced_search)
+
+    def _run_debounced_search(self) -> None:
+        self._search_after_id = None
+        self._run_query(reset_page=True)
 
     def _clear_search(self) -> None:
+        self._cancel_pending_search()
         self.search_var.set("")
         self._run_query(reset_page=True)
 
     def _refresh_all(self) -> None:
+        self._clear_page_cache()
+        self._filter_options_cache = None
+        self._fulltext_ready = None
         self._reload_filter_options()
         self._run_query(reset_page=True)
 
-    def _build_where_clause(self, spec: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    def _clear_page_cache(self) -> None:
+        with self._page_cache_lock:
+            self._page_cache.clear()
+
+    def _cached_page(self, key: tuple[Any, ...]) -> tuple[list[dict[str, Any]], int] | None:
+        with self._page_cache_lock:
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                self._page_cache.move_to_end(key)
+            return cached
+
+    def _store_page(self, key: tuple[Any, ...], rows: list[dict[str, Any]], total_rows: int) -> None:
+        with self._page_cache_lock:
+            self._page_cache[key] = (rows, total_rows)
+            self._page_cache.move_to_end(key)
+            if len(self._page_cache) > PAGE_CACHE_MAX:
+                self._page_cache.popitem(last=False)
+
+    def _fulltext_available(self) -> bool:
+        # MATCH needs MySQL plus the FULLTEXT indexes from sql/30_indexes.sql; otherwise use LIKE.
+        if self._fulltext_ready is None:
+            self._fulltext_ready = False
+            if self.engine.dialect.name in {"mysql", "mariadb"}:
+                try:
+                    with self.engine.connect() as conn:
+                        names = {
+                            str(row[0])
+                            for row in conn.execute(
+                                text(
+                                    """
+                                    SELECT DISTINCT INDEX_NAME
+                                    FROM information_schema.STATISTICS
+                                    WHERE TABLE_SCHEMA = DATABASE() AND INDEX_TYPE = 'FULLTEXT'
+                                    """
+                                )
+                            )
+                        }
+                    self._fulltext_ready = FULLTEXT_INDEXES <= names
+                except Exception:  # fall back to LIKE search
+                    pass
+        return self._fulltext_ready
+
+    def _build_where_clause(
+        self, spec: dict[str, Any]
+    ) -> tuple[str, dict[str, Any], tuple[bool, bool, tuple[bool, ...]]]:
         conditions: list[str] = []
         params: dict[str, Any] = {}
+        token_modes: list[bool] = []
 
         as_of_date = self.as_of_var.get().strip()
         if as_of_date and as_of_date != "All":
@@ -430,19 +603,45 @@ class LocalSearchUI:
 
         keyword = self.search_var.get().strip()
         if keyword:
+            # Indexed prefix MATCH per word where possible; LIKE for short/punctuated tokens and other databases.
+            fulltext = self._fulltext_available()
+            single_match = len(spec["fulltext_groups"]) == 1
             token_groups: list[str] = []
+            match_terms: list[str] = []
             for idx, token in enumerate(keyword.split()):
                 key = f"kw{idx}"
-                params[key] = f"%{token}%"
-                per_token_exprs = [f"CAST({expr} AS CHAR) LIKE :{key}" for expr in spec["search_exprs"]]
+                use_match = (
+                    fulltext
+                    and FULLTEXT_TOKEN_PATTERN.fullmatch(token) is not None
+                    and token.lower() not in FULLTEXT_STOPWORDS
+                )
+                token_modes.append(use_match)
+                if not use_match:
+                    params[key] = f"%{token}%"
+                    per_token_exprs = [f"CAST({expr} AS CHAR) LIKE :{key}" for expr in spec["search_exprs"]]
+                elif single_match:
+                    # One FULLTEXT index covers every column: all terms go into a single MATCH.
+                    match_terms.append(f"+{token}*")
+                    continue
+                else:
+                    params[key] = f"+{token}*"
+                    per_token_exprs = [
+                        f"MATCH({', '.join(cols)}) AGAINST (:{key} IN BOOLEAN MODE)" for cols in spec["fulltext_groups"]
+                    ]
                 token_groups.append("(" + " OR ".join(per_token_exprs) + ")")
+            if match_terms:
+                params["kw_match"] = " ".join(match_terms)
+                cols = ", ".join(spec["fulltext_groups"][0])
+                token_groups.insert(0, f"(MATCH({cols}) AGAINST (:kw_match IN BOOLEAN MODE))")
             conditions.append("(" + " AND ".join(token_groups) + ")")
 
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
 
-        return where_clause, params
+        # The SQL text depends only on which filters are set and how each token is matched.
+        shape = ("as_of_date" in params, "source" in params, tuple(token_modes))
+        return where_clause, params, shape
 
     def _run_query(self, reset_page: bool) -> None:
         if reset_page:
@@ -460,78 +659,215 @@ class LocalSearchUI:
             page_size = 50
             self.page_size_var.set("50")
 
-        where_clause, params = self._build_where_clause(spec)
-        sort_direction = "DESC" if self.sort_desc else "ASC"
-
-        select_cols = ", ".join(f"{expr} AS {name}" for name, expr, *_ in spec["columns"])
-        count_sql = f"SELECT COUNT(*) {spec['from_sql']} {where_clause}"
-        data_sql = (
-            f"SELECT {select_cols} {spec['from_sql']} {where_clause} "
-            f"ORDER BY {self.sort_column} {sort_direction} "
-            "LIMIT :limit_rows OFFSET :offset_rows"
+        where_clause, params, shape = self._build_where_clause(spec)
+        self._last_submitted_keyword = self.search_var.get().strip()
+
+        stmt_key = (self.dataset_var.get(), shape, self.sort_column, self.sort_desc)
+        # The key columns break sort ties, so page order is stable and a page's last row can seek the next.
+        seek_columns = [self.sort_column] + [key for key in spec["key_columns"] if key != self.sort_column]
+        statements = self._stmt_cache.get(stmt_key)
+        if statements is None:
+            sort_direction = "DESC" if self.sort_desc else "ASC"
+            exprs = {name: expr for name, expr, *_ in spec["columns"]}
+            select_cols = ", ".join(f"{expr} AS {name}" for name, expr, *_ in spec["columns"])
+            order_by = ", ".join(f"{exprs[key]} {sort_direction}" for key in seek_columns)
+            seek = (
+                f"({', '.join(exprs[key] for key in seek_columns)}) {'<' if self.sort_desc else '>'} "
+                f"({', '.join(f':seek{idx}' for idx in range(len(seek_columns)))})"
+            )
+            if self.sort_desc:
+                # NULLs sort last when descending and fail the row comparison.
+                seek = f"({seek} OR {exprs[self.sort_column]} IS NULL)"
+            seek_where = f"{where_clause} AND {seek}" if where_clause else f"WHERE {seek}"
+            statements = (
+                text(f"SELECT COUNT(*) {spec['from_sql']} {where_clause}"),
+                text(
+                    f"SELECT {select_cols} {spec['from_sql']} {where_clause} "
+                    f"ORDER BY {order_by} LIMIT :limit_rows OFFSET :offset_rows"
+                ),
+                text(f"SELECT {select_cols} {spec['from_sql']} {seek_where} ORDER BY {order_by} LIMIT :limit_rows"),
+                text(
+                    f"SELECT {select_cols}, COUNT(*) OVER () AS {TOTAL_ROWS_KEY} {spec['from_sql']} {where_clause} "
+                    f"ORDER BY {order_by} LIMIT :limit_rows OFFSET :offset_rows"
+                ),
+            )
+            self._stmt_cache[stmt_key] = statements
+        count_stmt, data_stmt, seek_stmt, counted_stmt = statements
+
+        # Paging and sorting keep the filters, so the last COUNT(*) still holds.
+        signature = (
+            self.dataset_var.get(),
+            self.as_of_var.get(),
+            self.source_var.get(),
+            self._last_submitted_keyword,
+            page_size,
         )
+        recount = reset_page or signature != self._filter_signature
+
+        def cache_key(page: int) -> tuple[Any, ...]:
+            return (
+                self.dataset_var.get(),
+                tuple(sorted(params.items())),
+                self.sort_column,
+                self.sort_desc,
+                page,
+                page_size,
+            )
 
+        def page_query(page: int, previous_rows: list[dict[str, Any]] | None) -> tuple[TextClause, dict[str, Any]]:
+            # Seek past the previous page's last row when it is known; OFFSET makes the DB skip every earlier row.
+            if previous_rows and len(previous_rows) == page_size:
+                last = [previous_rows[-1].get(key) for key in seek_columns]
+                if None not in last:
+                    seek_params = {f"seek{idx}": value for idx, value in enumerate(last)}
+                    return seek_stmt, {**params, **seek_params, "limit_rows": page_size}
+            return data_stmt, {**params, "limit_rows": page_size, "offset_rows": (page - 1) * page_size}
+
+        def previous_rows(page: int) -> list[dict[str, Any]] | None:
+            if page <= 1:
+                return None
+            cached = self._cached_page(cache_key(page - 1))
+            return cached[0] if cached is not None else None
+
+        self._query_gen += 1
+        gen = self._query_gen
         t0 = time.perf_counter()
-        try:
-            with self.engine.connect() as conn:
-                total_rows = int(conn.execute(text(count_sql), params).scalar_one())
 
-                total_pages = max(1, math.ceil(total_rows / page_size)) if total_rows else 1
-                if self.current_page > total_pages:
-                    self.current_page = total_pages
+        def show(rows: list[dict[str, Any]], total_rows: int, total_pages: int, page: int, cached: bool) -> None:
+            if gen != self._query_gen:
+                return  # superseded by a newer query while this one ran
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+
+            self.current_page = page
+            self.total_rows = total_rows
+            self._filter_signature = signature
+            self.total_pages = total_pages
+            self._last_rows = rows
+
+            self._render_rows(rows)
+            self._update_page_controls()
+            dataset_label = spec["label"]
+            self.status_label.configure(
+                text=(
+                    f"Dataset: {dataset_label} | Rows: {len(rows)} on page {self.current_page}/{self.total_pages} "
+                    f"(total {self.total_rows}) | Query: {elapsed_ms:.1f} ms{' (cached)' if cached else ''}"
+                )
+            )
 
-                query_params = dict(params)
-                query_params["limit_rows"] = page_size
-                query_params["offset_rows"] = (self.current_page - 1) * page_size
+            # Users nearly always page forward next, so warm that page while they read this one.
+            next_page = self.current_page + 1
+            if next_page <= self.total_pages and self._cached_page(cache_key(next_page)) is None:
+                self._executor.submit(self._prefetch_page, cache_key(next_page), *page_query(next_page, rows), total_rows)
 
-                row_mappings = conn.execute(text(data_sql), query_params).mappings().all()
-                rows = [dict(row) for row in row_mappings]
-        except Exception as exc:  # intentionally broad for interactive UI
-            messagebox.showerror("Query Error", str(exc))
+        cached = self._cached_page(cache_key(self.current_page))
+        if cached is not None:
+            show(cached[0], cached[1], _page_count(cached[1], page_size), self.current_page, cached=True)
             return
 
-        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        known_total = None if recount else self.total_rows
+        requested_page = self.current_page
+        requested_query = page_query(requested_page, previous_rows(requested_page))
 
-        self.total_rows = total_rows
-        self.total_pages = max(1, math.ceil(total_rows / page_size)) if total_rows else 1
-        self._last_rows = rows
-
-        self._render_rows(rows)
-        self._update_page_controls()
-        dataset_label = spec["label"]
-        self.status_label.configure(
-            text=(
-                f"Dataset: {dataset_label} | Rows: {len(rows)} on page {self.current_page}/{self.total_pages} "
-                f"(total {self.total_rows}) | Query: {elapsed_ms:.1f} ms"
-            )
-        )
+        def fetch() -> tuple[list[dict[str, Any]], int, int, int]:
+            with self.engine.connect() as conn:
+                total_rows = known_total
+                rows = None
+                if total_rows is None and requested_query[0] is data_stmt and self._window_count_ok:
+                    # COUNT(*) OVER () returns the total with the page: one round-trip instead of two.
+                    try:
+                        rows = list(map(dict, conn.execute(counted_stmt, requested_query[1]).mappings()))
+                    except DBAPIError:
+                        conn.rollback()
+                        self._window_count_ok = False  # no window functions here: keep a separate COUNT
+                        rows = None
+                    if rows:
+                        total_rows = int(rows[0][TOTAL_ROWS_KEY])
+                        for row in rows:
+                            del row[TOTAL_ROWS_KEY]
+                    elif rows is not None and requested_page == 1:
+                        total_rows = 0
+                    else:
+                        rows = None  # past the last page: count, clamp and re-query below
+                if total_rows is None:
+                    total_rows = int(conn.execute(count_stmt, params).scalar_one())
+
+                total_pages = _page_count(total_rows, page_size)
+                page = min(requested_page, total_pages)
+                if rows is None or page != requested_page:
+                    stmt, query_params = requested_query if page == requested_page else page_query(page, None)
+                    rows = list(map(dict, conn.execute(stmt, query_params).mappings()))
+            self._store_page(cache_key(page), rows, total_rows)
+            return rows, total_rows, total_pages, page
+
+        def done(future: Future[tuple[list[dict[str, Any]], int, int, int]]) -> None:
+            if gen != self._query_gen:
+                return
+            try:
+                rows, total_rows, total_pages, page = future.result()
+            except Exception as exc:  # intentionally broad for interactive UI
+                messagebox.showerror("Query Error", str(exc))
+                return
+            show(rows, total_rows, total_pages, page, cached=False)
+
+        self.status_label.configure(text="Running query...")
+        future = self._executor.submit(fetch)
+        # Tk is not thread-safe: hand the result back to the event loop.
+        future.add_done_callback(lambda f: self._ui_queue.put((done, (f,))))
+
+    def _prefetch_page(
+        self,
+        key: tuple[Any, ...],
+        data_stmt: TextClause,
+        query_params: dict[str, Any],
+        total_rows: int,
+    ) -> None:
+        # Runs off the Tk thread: touch only the page cache, never widgets.
+        try:
+            with self.engine.connect() as conn:
+                rows = list(map(dict, conn.execute(data_stmt, query_params).mappings()))
+        except Exception:  # a failed prefetch just means a cache miss later
+            return
+        self._store_page(key, rows, total_rows)
 
     def _render_rows(self, rows: list[dict[str, Any]]) -> None:
-        self.tree.delete(*self.tree.get_children())
+        formatters = self._col_formatters
+        all_values = [[fmt(row.get(key)) for key, fmt in formatters] for row in rows]
+
+        # Detach the scrollbar while filling so it is not updated per row, and
+        # rewrite existing items in place instead of rebuilding the tree.
+        self.tree.configure(yscrollcommand=lambda *_args: None)
+        existing = self.tree.get_children()
+        self.tree.selection_set(())
         self._item_rows.clear()
 
-        spec = self._dataset_spec()
-        keys = [col[0] for col in spec["columns"]]
-
-        for row in rows:
-            item_values = [_format_value(row.get(key)) for key in keys]
+        for item_id, item_values, row in zip(existing, all_values, rows):
+            self.tree.item(item_id, values=item_values)
+            self._item_rows[item_id] = row
+        if len(existing) > len(rows):
+            self.tree.delete(*existing[len(rows) :])
+        for item_values, row in zip(all_values[len(existing) :], rows[len(existing) :]):
             item_id = self.tree.insert("", "end", values=item_values)
             self._item_rows[item_id] = row
 
+        self.tree.configure(yscrollcommand=self.y_scroll.set)
+        self.tree.yview_moveto(0)
         self._set_details({})
 
     def _update_page_controls(self) -> None:
-        self.page_label.configure(text=f"Page {self.current_page} / {self.total_pages}")
+        # Every widget call is a Tcl round-trip, so only touch what changed.
+        label = f"Page {self.current_page} / {self.total_pages}"
+        prev_disabled = self.current_page <= 1
+        next_disabled = self.current_page >= self.total_pages
+        last_label, last_prev, last_next = self._page_controls_state
 
-        if self.current_page <= 1:
-            self.prev_btn.state(["disabled"])
-        else:
-            self.prev_btn.state(["!disabled"])
+        if label != last_label:
+            self.page_label.configure(text=label)
+        if prev_disabled != last_prev:
+            self.prev_btn.state(["disabled" if prev_disabled else "!disabled"])
+        if next_disabled != last_next:
+            self.next_btn.state(["disabled" if next_disabled else "!disabled"])
 
-        if self.current_page >= self.total_pages:
-            self.next_btn.state(["disabled"])
-        else:
-            self.next_btn.state(["!disabled"])
+        self._page_controls_state = (label, prev_disabled, next_disabled)
 
     def _go_previous(self) -> None:
         if self.current_page > 1:
@@ -561,6 +897,11 @@ class LocalSearchUI:
         self._set_details(row)
 
     def _set_details(self, row: dict[str, Any]) -> None:
+        shown = row or None
+        if shown is self._details_row:
+            return
+        self._details_row = shown
+
         lines: list[str] = []
         if row:
             max_key = max(len(key) for key in row)
@@ -589,13 +930,28 @@ class LocalSearchUI:
         if not target:
             return
 
-        import pandas as pd
+        keys = [col[0] for col in self._dataset_spec()["columns"]]
+        rows = list(self._last_rows)
+
+        def write() -> None:
+            try:
+                with open(target, "w", newline="", encoding="utf-8") as fh:
+                    writer = csv.writer(fh)
+                    writer.writerow(keys)
+                    writer.writerows([row.get(key) for key in keys] for row in rows)
+            except OSError as exc:
+                self._ui_queue.put((messagebox.showerror, ("Export CSV", f"Could not save {target}: {exc}")))
+                return
+            self._ui_queue.put((messagebox.showinfo, ("Export CSV", f"Saved: {target}")))
 
-        pd.DataFrame(self._last_rows).to_csv(target, index=False)
-        messagebox.showinfo("Export CSV", f"Saved: {target}")
+        threading.Thread(target=write, daemon=True).start()
 
     def run(self) -> None:
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self.engine.dispose()
 
 
 def main() -> int:
@@ -7,8 +7,13 @@ from datetime import date
 from pathlib import Path
 import subprocess
 import sys
+from types import ModuleType
+from typing import Sequence
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from pipelines import run_build_mart, run_build_staging, run_db_smoke_test  # noqa: E402
 
 
 def _parse_args() -> argparse.Namespace:
@@ -20,35 +25,37 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--max-depth", type=int, default=6, help="Max recursive trace depth.")
     parser.add_argument("--skip-smoke-test", action="store_true", help="Skip DB smoke test step.")
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each step in a fresh Python subprocess instead of in-process.",
+    )
     return parser.parse_args()
 
 
-def _run_step(step_name: str, command: list[str]) -> None:
-    print(f"[RUN] {step_name}: {' '.join(command)}", flush=True)
-    subprocess.run(command, cwd=REPO_ROOT, check=True)
+def _run_step(step_name: str, step: ModuleType, argv: Sequence[str] = (), isolated: bool = False) -> None:
+    print(f"[RUN] {step_name}: {' '.join(argv)}", flush=True)
+    if isolated:
+        subprocess.run([sys.executable, str(step.__file__), *argv], cwd=REPO_ROOT, check=True)
+        return
+    # Steps run in this process so they share imports and the cached, pooled engines.
+    return_code = step.main(list(argv)) if argv else step.main()
+    if return_code != 0:
+        raise RuntimeError(f"Step {step_name} failed with exit code {return_code}")
 
 
 def main() -> int:
     args = _parse_args()
-    python_bin = sys.executable
 
     if not args.skip_smoke_test:
-        _run_step("db_smoke_test", [python_bin, "pipelines/run_db_smoke_test.py"])
+        _run_step("db_smoke_test", run_db_smoke_test, isolated=args.isolated)
 
-    _run_step(
-        "build_staging",
-        [python_bin, "pipelines/run_build_staging.py", "--as-of-date", args.as_of_date],
-    )
+    _run_step("build_staging", run_build_staging, ["--as-of-date", args.as_of_date], args.isolated)
     _run_step(
         "build_mart",
-        [
-            python_bin,
-            "pipelines/run_build_mart.py",
-            "--as-of-date",
-            args.as_of_date,
-            "--max-depth",
-            str(max(1, args.max_depth)),
-        ],
+        run_build_mart,
+        ["--as-of-date", args.as_of_date, "--max-depth", str(max(1, args.max_depth))],
+        args.isolated,
     )
     print("run_refresh_all completed", f"as_of_date={args.as_of_date}", f"max_depth={max(1, args.max_depth)}")
     return 0
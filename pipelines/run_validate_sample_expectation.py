@@ -6,9 +6,11 @@ import argparse
 from datetime import date
 from pathlib import Path
 import sys
+from typing import Iterable
 
 import pandas as pd
-from sqlalchemy import inspect, text
+from pandas.api.types import union_categoricals
+from sqlalchemy import bindparam, inspect, text
 
 # Allow running directly from repo root without package installation.
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -16,11 +18,28 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 from db.connections import create_traceability_mart_engine  # noqa: E402
 from utils.validation import require_columns  # noqa: E402
 
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:  # Optional: the "arrow" extra parses CSVs with Arrow's multithreaded reader.
+    CSV_ENGINE = "c"
+
 DEFAULT_EXPECTED_CSV = (
     Path(__file__).resolve().parents[1] / "data" / "samples" / "expected_true_exposure_sample.csv"
 )
 
 KEY_COLS = ["root_fund_id", "final_asset_id"]
+VALUE_COLS = ["effective_weight", "path_depth"]
+STREAM_BATCH_ROWS = 50_000
+
+_ACTUAL_QUERY = text(
+    """
+    SELECT root_fund_id, final_asset_id, effective_weight, path_depth
+    FROM mart_true_exposure
+    WHERE as_of_date = :as_of_date AND root_fund_id IN :roots
+    """
+).bindparams(bindparam("roots", expanding=True))
 
 
 def _parse_args() -> argparse.Namespace:
@@ -45,54 +64,66 @@ def _parse_args() -> argparse.Namespace:
 
 
 def _load_expected(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    # Read ids as text up front so numeric-looking codes keep their leading zeros and skip type inference.
+    df = pd.read_csv(path, engine=CSV_ENGINE, dtype={col: str for col in KEY_COLS})
     require_columns(df, {"root_fund_id", "final_asset_id", "effective_weight", "path_depth"})
-    df = df.copy()
-    df["root_fund_id"] = df["root_fund_id"].astype(str).str.strip()
-    df["final_asset_id"] = df["final_asset_id"].astype(str).str.strip()
-    df["effective_weight"] = pd.to_numeric(df["effective_weight"], errors="coerce")
-    df["path_depth"] = pd.to_numeric(df["path_depth"], errors="coerce").astype("Int64")
-    return df
+    # Freshly parsed and unaliased, so the columns are converted in place without a defensive copy.
+    return _normalize_exposure(df)
 
 
-def _load_actual(as_of_date: str) -> pd.DataFrame:
+def _load_actual(as_of_date: str, expected_roots: Iterable[str]) -> pd.DataFrame:
     engine = create_traceability_mart_engine()
-    existing = set(inspect(engine).get_table_names())
-    if "mart_true_exposure" not in existing:
-        return pd.DataFrame(columns=["root_fund_id", "final_asset_id", "effective_weight", "path_depth"])
-
-    query = text(
-        """
-        SELECT root_fund_id, final_asset_id, effective_weight, path_depth
-        FROM mart_true_exposure
-        WHERE as_of_date = :as_of_date
-        """
-    )
-    with engine.connect() as conn:
-        df = pd.read_sql(query, conn, params={"as_of_date": as_of_date})
-
-    if df.empty:
-        return df
-
-    df = df.copy()
-    df["root_fund_id"] = df["root_fund_id"].astype(str).str.strip()
-    df["final_asset_id"] = df["final_asset_id"].astype(str).str.strip()
+    # Only the sample's root funds are compared, so let the root_fund_id index do the filtering.
+    params = {"as_of_date": as_of_date, "roots": sorted(set(expected_roots))}
+    # Server-side cursor: each batch is normalized (keys become categories) before the next is fetched.
+    with engine.connect().execution_options(stream_results=True, max_row_buffer=STREAM_BATCH_ROWS) as conn:
+        # A single-table existence probe on the same connection, not a listing of every table in the schema.
+        if not inspect(conn).has_table("mart_true_exposure"):
+            return pd.DataFrame(columns=KEY_COLS + VALUE_COLS)
+        chunks = [
+            _normalize_exposure(chunk)
+            for chunk in pd.read_sql(_ACTUAL_QUERY, conn, params=params, chunksize=STREAM_BATCH_ROWS)
+        ]
+    if len(chunks) == 1:
+        return chunks[0]
+    values = pd.concat([chunk[VALUE_COLS] for chunk in chunks], ignore_index=True)
+    keys = {col: union_categoricals([chunk[col] for chunk in chunks]) for col in KEY_COLS}
+    return pd.DataFrame({**keys, **{col: values[col] for col in VALUE_COLS}})
+
+
+def _normalize_exposure(df: pd.DataFrame) -> pd.DataFrame:
+    for col in KEY_COLS:
+        df[col] = df[col].astype(str).str.strip().astype("category")
     df["effective_weight"] = pd.to_numeric(df["effective_weight"], errors="coerce")
     df["path_depth"] = pd.to_numeric(df["path_depth"], errors="coerce").astype("Int64")
     return df
 
 
+def _align_key_categories(expected_df: pd.DataFrame, actual_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Shared categories let isin/merge compare integer codes instead of hashing strings.
+    expected_df, actual_df = expected_df.copy(deep=False), actual_df.copy(deep=False)
+    for col in KEY_COLS:
+        categories = union_categoricals(
+            [pd.Categorical(expected_df[col]), pd.Categorical(actual_df[col])], ignore_order=True
+        ).categories
+        dtype = pd.CategoricalDtype(categories)
+        expected_df[col] = expected_df[col].astype(dtype)
+        actual_df[col] = actual_df[col].astype(dtype)
+    return expected_df, actual_df
+
+
 def _validate(expected_df: pd.DataFrame, actual_df: pd.DataFrame, tolerance: float) -> tuple[bool, list[str]]:
     messages: list[str] = []
 
-    expected_roots = set(expected_df["root_fund_id"].tolist())
-    actual_df = actual_df[actual_df["root_fund_id"].isin(expected_roots)].copy()
+    expected_df, actual_df = _align_key_categories(expected_df, actual_df)
 
-    expected_keys = set(map(tuple, expected_df[KEY_COLS].itertuples(index=False, name=None)))
-    actual_keys = set(map(tuple, actual_df[KEY_COLS].itertuples(index=False, name=None)))
+    actual_df = actual_df[actual_df["root_fund_id"].isin(expected_df["root_fund_id"])]
 
-    missing = sorted(expected_keys - actual_keys)
-    extras = sorted(actual_keys - expected_keys)
+    expected_keys = pd.MultiIndex.from_frame(expected_df[KEY_COLS])
+    actual_keys = pd.MultiIndex.from_frame(actual_df[KEY_COLS])
+
+    missing = sorted(expected_keys[~expected_keys.isin(actual_keys)].unique())
+    extras = sorted(actual_keys[~actual_keys.isin(expected_keys)].unique())
 
     if missing:
         messages.append(f"Missing rows in actual: {missing}")
@@ -106,20 +137,41 @@ def _validate(expected_df: pd.DataFrame, actual_df: pd.DataFrame, tolerance: flo
         suffixes=("_expected", "_actual"),
     )
 
-    for row in merged.itertuples(index=False):
-        weight_diff = abs(float(row.effective_weight_expected) - float(row.effective_weight_actual))
-        if weight_diff > tolerance:
+    # Compare whole columns at once; only the (usually few) failing rows reach Python.
+    weight_diff = (
+        merged["effective_weight_expected"].astype("float64") - merged["effective_weight_actual"].astype("float64")
+    ).abs().to_numpy()
+    weight_bad = weight_diff > tolerance
+    depth_bad = (
+        merged["path_depth_expected"].astype("int64").to_numpy() != merged["path_depth_actual"].astype("int64").to_numpy()
+    )
+
+    bad = weight_bad | depth_bad
+    failing = merged[bad]
+    # Plain column iterators: no namedtuple per row, and the masks/diffs computed above are reused.
+    for root, asset, weight_expected, weight_actual, depth_expected, depth_actual, diff, weight_off, depth_off in zip(
+        failing["root_fund_id"],
+        failing["final_asset_id"],
+        failing["effective_weight_expected"],
+        failing["effective_weight_actual"],
+        failing["path_depth_expected"],
+        failing["path_depth_actual"],
+        weight_diff[bad].tolist(),
+        weight_bad[bad].tolist(),
+        depth_bad[bad].tolist(),
+    ):
+        if weight_off:
             messages.append(
                 "Weight mismatch "
-                f"({row.root_fund_id}, {row.final_asset_id}): "
-                f"expected={row.effective_weight_expected}, actual={row.effective_weight_actual}, diff={weight_diff}"
+                f"({root}, {asset}): "
+                f"expected={weight_expected}, actual={weight_actual}, diff={diff}"
             )
 
-        if int(row.path_depth_expected) != int(row.path_depth_actual):
+        if depth_off:
             messages.append(
                 "Depth mismatch "
-                f"({row.root_fund_id}, {row.final_asset_id}): "
-                f"expected={row.path_depth_expected}, actual={row.path_depth_actual}"
+                f"({root}, {asset}): "
+                f"expected={depth_expected}, actual={depth_actual}"
             )
 
     return len(messages) == 0, messages
@@ -133,7 +185,7 @@ def main() -> int:
         raise FileNotFoundError(f"Expected CSV not found: {expected_path}")
 
     expected_df = _load_expected(expected_path)
-    actual_df = _load_actual(args.as_of_date)
+    actual_df = _load_actual(args.as_of_date, expected_df["root_fund_id"])
 
     passed, messages = _validate(expected_df, actual_df, args.weight_tolerance)
 
@@ -142,7 +194,7 @@ def main() -> int:
             "run_validate_sample_expectation passed",
             f"as_of_date={args.as_of_date}",
             f"rows(expected)={len(expected_df)}",
-            f"rows(actual_filtered)={len(actual_df[actual_df['root_fund_id'].isin(set(expected_df['root_fund_id']))])}",
+            f"rows(actual_filtered)={len(actual_df)}",
         )
         return 0
 
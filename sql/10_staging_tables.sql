@@ -7,7 +7,7 @@ CREATE TABLE IF NOT EXISTS stg_funds (
   currency VARCHAR(8),
   as_of_date DATE,
   loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
 CREATE TABLE IF NOT EXISTS stg_holdings (
   fund_id VARCHAR(128) NOT NULL,
@@ -17,7 +17,7 @@ CREATE TABLE IF NOT EXISTS stg_holdings (
   weight DECIMAL(18,8),
   as_of_date DATE,
   loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
 CREATE TABLE IF NOT EXISTS stg_fund_links (
   feeder_fund_id VARCHAR(128) NOT NULL,
@@ -25,4 +25,11 @@ CREATE TABLE IF NOT EXISTS stg_fund_links (
   confidence DECIMAL(8,6),
   as_of_date DATE,
   loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+CREATE TABLE IF NOT EXISTS stg_filter_values (
+  kind VARCHAR(32) NOT NULL,
+  value VARCHAR(128) NOT NULL,
+  as_of_date DATE,
+  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
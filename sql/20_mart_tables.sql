@@ -9,3 +9,27 @@ CREATE TABLE IF NOT EXISTS mart_true_exposure (
   calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (root_fund_id, final_asset_id, as_of_date)
 );
+
+CREATE TABLE IF NOT EXISTS mart_top_assets (
+  root_scope VARCHAR(16) NOT NULL,
+  asset_type VARCHAR(32) NOT NULL,
+  asset_rank INT NOT NULL,
+  asset_id VARCHAR(128) NOT NULL,
+  asset_name VARCHAR(512),
+  total_weight DOUBLE NOT NULL,
+  as_of_date DATE NOT NULL,
+  calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (as_of_date, root_scope, asset_type, asset_rank)
+);
+
+CREATE TABLE IF NOT EXISTS mart_top_masters (
+  master_rank INT NOT NULL,
+  master_fund_id VARCHAR(128) NOT NULL,
+  master_name VARCHAR(512),
+  master_source VARCHAR(32),
+  score DOUBLE NOT NULL,
+  feeder_count INT NOT NULL,
+  as_of_date DATE NOT NULL,
+  calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (as_of_date, master_rank)
+);
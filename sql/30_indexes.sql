@@ -4,7 +4,19 @@ CREATE INDEX idx_stg_holdings_fund_id ON stg_holdings (fund_id);
 CREATE INDEX idx_stg_holdings_asset_id ON stg_holdings (asset_id);
 CREATE INDEX idx_stg_links_feeder ON stg_fund_links (feeder_fund_id);
 CREATE INDEX idx_stg_links_master ON stg_fund_links (master_fund_id);
+CREATE INDEX idx_stg_funds_as_of ON stg_funds (as_of_date, loaded_at);
+CREATE INDEX idx_stg_holdings_as_of ON stg_holdings (as_of_date, loaded_at);
+CREATE INDEX idx_stg_links_as_of ON stg_fund_links (as_of_date, loaded_at);
+CREATE INDEX idx_stg_filter_values_kind ON stg_filter_values (kind, as_of_date);
+CREATE FULLTEXT INDEX ft_stg_funds ON stg_funds (fund_id, fund_name, source, currency);
+CREATE FULLTEXT INDEX ft_stg_funds_name_source ON stg_funds (fund_name, source);
+CREATE FULLTEXT INDEX ft_stg_funds_name ON stg_funds (fund_name);
+CREATE FULLTEXT INDEX ft_stg_holdings ON stg_holdings (fund_id, asset_id, asset_name, asset_type);
+CREATE FULLTEXT INDEX ft_stg_links ON stg_fund_links (feeder_fund_id, master_fund_id);
 
 USE fund_traceability_mart;
 
 CREATE INDEX idx_mart_true_exposure_asset ON mart_true_exposure (final_asset_id);
+CREATE INDEX idx_mart_true_exposure_as_of_asset ON mart_true_exposure (as_of_date, final_asset_id, effective_weight);
+CREATE INDEX idx_mart_true_exposure_root ON mart_true_exposure (root_fund_id, as_of_date, effective_weight, path_depth);
+CREATE INDEX idx_mart_true_exposure_as_of_calc ON mart_true_exposure (as_of_date, calculated_at);
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 
 from config.settings import DatabaseConfig, settings
 
+# Sized for the dashboard's bundle thread pool plus concurrent pipeline smoke checks.
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+
 
 def _mysql_url(host: str, port: int, user: str, password: str, name: str) -> str:
     return f"mysql+pymysql://{user}:{password}@{host}:{port}/{name}"
 
 
+@lru_cache(maxsize=None)
 def _engine(db_config: DatabaseConfig) -> Engine:
+    # One pooled engine per database for the whole process, so chained pipeline steps reuse connections.
     return create_engine(
         _mysql_url(
             db_config.host,
@@ -21,7 +29,14 @@ def _engine(db_config: DatabaseConfig) -> Engine:
             db_config.password,
             db_config.name,
         ),
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
         pool_pre_ping=True,
+        pool_recycle=1800,
+        # Reuse the most recently returned connection so idle extras age out and hot ones stay warm.
+        pool_use_lifo=True,
+        # Pin utf8mb4 in the driver rather than the URL, which connectorx reuses for its own client.
+        connect_args={"charset": "utf8mb4"},
     )
 
 
@@ -0,0 +1,25 @@
+"""Render bound statements as plain MySQL text for clients that take SQL strings only."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql.elements import TextClause
+
+
+@lru_cache(maxsize=None)
+def _literal_dialect(backslash_escapes: bool) -> Dialect:
+    # A "format" paramstyle (pymysql, mysqlclient) doubles every % for the driver's own interpolation;
+    # the rendered text bypasses that driver, so render under "named", which leaves % alone.
+    dialect = mysql.dialect(paramstyle="named")
+    dialect._backslash_escapes = backslash_escapes
+    return dialect
+
+
+def render_mysql_literal(statement: TextClause, params: dict[str, Any], dialect: Dialect) -> str:
+    """``statement`` with ``params`` inlined as literals, quoted the way ``dialect``'s server expects."""
+    target = _literal_dialect(getattr(dialect, "_backslash_escapes", True))
+    return str(statement.bindparams(**params).compile(dialect=target, compile_kwargs={"literal_binds": True}))
@@ -0,0 +1,62 @@
+"""Streamed reads and batched partition writes shared by the staging and mart builds."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pandas as pd
+from sqlalchemy import column, inspect, table, text
+from sqlalchemy.engine import Connection, Engine, Inspector
+from sqlalchemy.sql.elements import TextClause
+
+STREAM_BATCH_ROWS = 10_000
+WRITE_BATCH_ROWS = 10_000
+
+
+def read_streamed(engine: Engine, query: TextClause, params: dict[str, object] | None = None) -> pd.DataFrame:
+    # Server-side cursor: rows arrive in bounded batches instead of one fully buffered result set.
+    with engine.connect().execution_options(stream_results=True, max_row_buffer=STREAM_BATCH_ROWS) as conn:
+        result = conn.execute(query, params or {})
+        columns = list(result.keys())
+        frames = [
+            pd.DataFrame.from_records(batch, columns=columns, coerce_float=True)
+            for batch in result.partitions(STREAM_BATCH_ROWS)
+        ]
+    if len(frames) <= 1:
+        return frames[0] if frames else pd.DataFrame(columns=columns)
+    # A batch whose column is all NULL must not decide that column's dtype for the whole read.
+    frames = [frame.dropna(axis=1, how="all") for frame in frames]
+    return pd.concat(frames, ignore_index=True).reindex(columns=columns)
+
+
+@lru_cache(maxsize=None)
+def inspector(engine: Engine) -> Inspector:
+    # Inspectors memoize their reflection queries, so one per engine serves every lookup in the run.
+    return inspect(engine)
+
+
+def delete_partition(conn: Connection, table_name: str, as_of_date: str) -> None:
+    conn.execute(
+        text(f"DELETE FROM {table_name} WHERE as_of_date = :as_of_date"),
+        {"as_of_date": as_of_date},
+    )
+
+
+def db_values(values: pd.Series) -> list[object]:
+    cells = values.astype(object).where(values.notna(), None).tolist()
+    if isinstance(values.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(values.dtype):
+        return [cell.to_pydatetime() if cell is not None else None for cell in cells]
+    return cells
+
+
+def insert_frame(
+    conn: Connection, table_name: str, df: pd.DataFrame, constants: dict[str, object] | None = None
+) -> None:
+    # executemany on one cached INSERT; the driver folds each chunk into multi-row VALUES under its packet cap.
+    constants = constants or {}
+    names = list(df.columns)
+    target = table(table_name, *(column(name) for name in [*names, *constants]))
+    for start in range(0, len(df), WRITE_BATCH_ROWS):
+        chunk = df.iloc[start : start + WRITE_BATCH_ROWS]
+        rows = zip(*(db_values(chunk[name]) for name in names))
+        conn.execute(target.insert(), [{**dict(zip(names, row)), **constants} for row in rows])
@@ -0,0 +1,53 @@
+"""Load DDL files as executable statements."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Quoted strings and comments are matched whole so a ';' inside them never ends a statement.
+_SQL_TOKENS = re.compile(
+    r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`|--[^\n]*|#[^\n]*|/\*.*?\*/|;",
+    re.DOTALL,
+)
+
+
+def split_sql_statements(sql_text: str) -> list[str]:
+    statements: list[str] = []
+    parts: list[str] = []
+    position = 0
+    for match in _SQL_TOKENS.finditer(sql_text):
+        token = match.group()
+        parts.append(sql_text[position : match.start()])
+        position = match.end()
+        if token == ";":
+            statement = "".join(parts).strip()
+            if statement:
+                statements.append(statement)
+            parts = []
+        elif not token.startswith(("--", "#", "/*")):
+            parts.append(token)
+    parts.append(sql_text[position:])
+    tail = "".join(parts).strip()
+    if tail:
+        statements.append(tail)
+    return statements
+
+
+@lru_cache(maxsize=None)
+def _load_statements(path: Path, mtime_ns: int) -> tuple[str, ...]:
+    return tuple(split_sql_statements(path.read_text(encoding="utf-8")))
+
+
+def load_sql_statements(path: Path) -> tuple[str, ...]:
+    return _load_statements(path, path.stat().st_mtime_ns)
+
+
+def run_sql_file(engine: Engine, path: Path) -> None:
+    with engine.begin() as conn:
+        for statement in load_sql_statements(path):
+            conn.execute(text(statement))
@@ -5,7 +5,9 @@ from __future__ import annotations
 import pandas as pd
 from sqlalchemy.engine import Engine
 
+from extract.sql_reader import read_sql_frame
+
 
 def read_global_funds(engine: Engine) -> pd.DataFrame:
     query = "SELECT * FROM global_funds"
-    return pd.read_sql(query, engine)
+    return read_sql_frame(query, engine)
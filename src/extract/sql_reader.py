@@ -0,0 +1,21 @@
+"""Read whole source tables into DataFrames, Arrow-native where possible."""
+
+from __future__ import annotations
+
+import pandas as pd
+from sqlalchemy.engine import Engine
+
+try:
+    import connectorx as cx
+except ImportError:  # Optional: install the "arrow" extra for Arrow-native extracts.
+    cx = None
+
+
+def read_sql_frame(query: str, engine: Engine) -> pd.DataFrame:
+    """Run a bind-free query, through connectorx into Arrow buffers when the engine is MySQL."""
+    if cx is not None and engine.dialect.name in {"mysql", "mariadb"}:
+        # connectorx copies column-major into Arrow instead of building one Python object per cell.
+        url = engine.url.set(drivername="mysql").render_as_string(hide_password=False)
+        table = cx.read_sql(url, query, return_type="arrow")
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return pd.read_sql(query, engine)
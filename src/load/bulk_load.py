@@ -0,0 +1,68 @@
+"""Replace a table's contents in one bulk load instead of row inserts."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool
+
+MYSQL_NULL = r"\N"
+# LOAD DATA's default format: tab-separated, backslash-escaped, \N for NULL.
+_MYSQL_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def to_mysql_tsv(df: pd.DataFrame) -> str:
+    """Render rows in the text format LOAD DATA reads with its default FIELDS/LINES options."""
+    if df.empty:
+        return ""
+    columns: list[pd.Series] = []
+    for name in df.columns:
+        values = df[name]
+        nulls = values.isna().to_numpy()
+        if pd.api.types.is_bool_dtype(values):
+            text = values.astype("Int8").astype(str)
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            text = values.dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+        else:
+            text = values.astype(str)
+            for raw, escaped in _MYSQL_ESCAPES:
+                text = text.str.replace(raw, escaped, regex=False)
+        columns.append(text.mask(nulls, MYSQL_NULL))
+    lines = columns[0]
+    for text in columns[1:]:
+        lines = lines + "\t" + text
+    return "\n".join(lines) + "\n"
+
+
+def _load_data_local_infile(df: pd.DataFrame, table_name: str, engine: Engine) -> None:
+    fd, path = tempfile.mkstemp(suffix=".tsv")
+    # LOCAL INFILE is a client capability, so enable it only on this short-lived engine.
+    infile_engine = create_engine(engine.url, poolclass=NullPool, connect_args={"local_infile": True})
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+            fh.write(to_mysql_tsv(df))
+        table = infile_engine.dialect.identifier_preparer.quote(table_name)
+        with infile_engine.begin() as conn:
+            conn.exec_driver_sql(f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4", (path,))
+    finally:
+        infile_engine.dispose()
+        os.unlink(path)
+
+
+def replace_table(df: pd.DataFrame, table_name: str, engine: Engine) -> None:
+    """Recreate ``table_name`` from ``df``'s dtypes and fill it, via LOAD DATA on MySQL."""
+    df.head(0).to_sql(table_name, engine, if_exists="replace", index=False)
+    if df.empty:
+        return
+    if engine.dialect.name in {"mysql", "mariadb"}:
+        try:
+            _load_data_local_infile(df, table_name, engine)
+            return
+        except DBAPIError:  # server or driver refuses LOCAL INFILE: fall back to batched inserts
+            pass
+    df.to_sql(table_name, engine, if_exists="append", index=False, chunksize=10_000)
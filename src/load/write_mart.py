@@ -5,6 +5,8 @@ from __future__ import annotations
 import pandas as pd
 from sqlalchemy.engine import Engine
 
+from load.bulk_load import replace_table
+
 
 def write_mart_table(df: pd.DataFrame, table_name: str, engine: Engine) -> None:
-    df.to_sql(table_name, engine, if_exists="replace", index=False)
+    replace_table(df, table_name, engine)
@@ -10,7 +10,7 @@ def compute_effective_exposure(paths_df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame(columns=["root_fund_id", "final_asset_id", "effective_weight", "path_depth"])
 
     grouped = (
-        paths_df.groupby(["root_fund_id", "final_asset_id"], as_index=False)
+        paths_df.groupby(["root_fund_id", "final_asset_id"], as_index=False, observed=True)
         .agg(effective_weight=("path_weight", "sum"), path_depth=("depth", "max"))
     )
     return grouped
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pandas as pd
+
 
 _CURRENCY_ALIASES = {
     "BAHT": "THB",
@@ -12,4 +14,10 @@ _CURRENCY_ALIASES = {
 
 
 def normalize_currency(value: str) -> str:
-    return _CURRENCY_ALIASES.get(value.strip().upper(), value.strip().upper())
+    cleaned = value.strip().upper()
+    return _CURRENCY_ALIASES.get(cleaned, cleaned)
+
+
+def normalize_currency_series(values: pd.Series) -> pd.Series:
+    # Few distinct codes across many rows: normalise each once, then map through a hash lookup.
+    return values.map({value: normalize_currency(value) for value in values.unique()})
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import random
 import time
 from collections.abc import Callable
 from typing import TypeVar
@@ -9,13 +10,27 @@ from typing import TypeVar
 T = TypeVar("T")
 
 
-def retry(fn: Callable[[], T], attempts: int = 3, delay_seconds: float = 0.25) -> T:
+def retry(
+    fn: Callable[[], T],
+    attempts: int = 3,
+    delay_seconds: float = 0.25,
+    max_delay_seconds: float = 8.0,
+    exceptions: tuple[type[Exception], ...] = (Exception,),
+    jitter: bool = True,
+) -> T:
+    """Call ``fn`` up to ``attempts`` times, backing off exponentially between failures."""
     last_error: Exception | None = None
-    for _ in range(attempts):
+    for attempt in range(attempts):
         try:
             return fn()
-        except Exception as exc:  # intentionally broad for infrastructure calls
+        except exceptions as exc:  # broad by default for infrastructure calls; narrow via ``exceptions``
             last_error = exc
-            time.sleep(delay_seconds)
+        if attempt == attempts - 1:
+            break
+        delay = min(max_delay_seconds, delay_seconds * 2**attempt)
+        if jitter:
+            # Spread concurrent workers out so they do not retry against the database in lockstep.
+            delay = random.uniform(delay / 2, delay)
+        time.sleep(delay)
     assert last_error is not None
     raise last_error
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+
+from load.bulk_load import replace_table, to_mysql_tsv
+
+
+class TestBulkLoad(unittest.TestCase):
+    def test_tsv_escapes_specials_and_marks_nulls(self) -> None:
+        df = pd.DataFrame(
+            {
+                "name": ["a\\b", "tab\there", "line\nbreak", None],
+                "weight": [0.5, np.nan, 1.0, 2.0],
+                "active": [True, False, True, False],
+            }
+        )
+        self.assertEqual(
+            to_mysql_tsv(df),
+            "a\\\\b\t0.5\t1\ntab\\there\t\\N\t0\nline\\nbreak\t1.0\t1\n\\N\t2.0\t0\n",
+        )
+
+    def test_replace_table_falls_back_to_inserts_off_mysql(self) -> None:
+        engine = create_engine("sqlite://")
+        first = pd.DataFrame({"fund_id": ["F1", "F2"], "weight": [0.25, 0.75]})
+        replace_table(first, "mart_demo", engine)
+        replace_table(first.head(1), "mart_demo", engine)
+
+        loaded = pd.read_sql("SELECT * FROM mart_demo", engine)
+        pd.testing.assert_frame_equal(loaded, first.head(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
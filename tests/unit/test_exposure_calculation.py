@@ -9,7 +9,7 @@ import pandas as pd
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
-from pipelines.run_build_mart import _compute_true_exposure
+from pipelines.run_build_mart import _build_top_assets, _build_top_masters, _compute_true_exposure
 
 
 class TestExposureCalculation(unittest.TestCase):
@@ -43,7 +43,7 @@ class TestExposureCalculation(unittest.TestCase):
     def _get_exposure(self, df: pd.DataFrame, root: str, asset: str) -> tuple[float, int]:
         row = df[(df["root_fund_id"] == root) & (df["final_asset_id"] == asset)]
         self.assertEqual(len(row), 1)
-        return float(row.iloc[0]["effective_weight"]), int(row.iloc[0]["path_depth"])
+        return float(row["effective_weight"].iat[0]), int(row["path_depth"].iat[0])
 
     def test_multilayer_exposure_with_confidence(self) -> None:
         result = _compute_true_exposure(self._sample_holdings(), self._sample_links(), max_depth=6)
@@ -75,6 +75,31 @@ class TestExposureCalculation(unittest.TestCase):
         self.assertEqual(cycle_depth, 3)
         self.assertLess(len(result), 100)
 
+    def test_missing_links_or_holdings_table_builds_from_the_other_side(self) -> None:
+        # A missing staging table loads as a frame with no columns at all.
+        holdings_only = _compute_true_exposure(self._sample_holdings(), pd.DataFrame(), max_depth=6)
+        eq_us, eq_us_depth = self._get_exposure(holdings_only, "F_MASTER_C", "EQ_US_TECH")
+        self.assertAlmostEqual(eq_us, 0.42, places=9)
+        self.assertEqual(eq_us_depth, 3)
+
+        links_only = _compute_true_exposure(pd.DataFrame(), self._sample_links(), max_depth=6)
+        self.assertTrue(links_only.empty)
+
+    def test_top_assets_ranked_per_scope_and_type(self) -> None:
+        holdings, links = self._sample_holdings(), self._sample_links()
+        result = _compute_true_exposure(holdings, links, max_depth=6)
+        top = _build_top_assets(result, holdings, links)
+
+        equity = top[(top["root_scope"] == "feeders") & (top["asset_type"] == "equity")]
+        self.assertEqual(equity["asset_id"].tolist(), ["EQ_US_TECH", "EQ_EU_BLUECHIP"])
+        self.assertEqual(equity["asset_rank"].tolist(), [1, 2])
+        self.assertAlmostEqual(float(equity["total_weight"].iat[0]), 0.63, places=9)
+        self.assertEqual(set(top["root_scope"]), {"all", "feeders"})
+
+        masters = _build_top_masters(links, pd.DataFrame())
+        self.assertEqual(masters["master_fund_id"].tolist(), ["F_CYCLE_1", "F_MASTER_C", "F_MASTER_B"])
+        self.assertEqual(masters["master_rank"].tolist(), [1, 2, 3])
+
 
 if __name__ == "__main__":
     unittest.main()
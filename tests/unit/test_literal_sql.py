@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+
+from sqlalchemy import text
+from sqlalchemy.dialects.mysql import pymysql
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+
+from db.literal_sql import render_mysql_literal
+
+
+class TestLiteralSql(unittest.TestCase):
+    def test_percent_in_cursor_and_filter_values_is_not_doubled(self) -> None:
+        statement = text(
+            "SELECT t.fund_id FROM stg_funds t WHERE t.source = :source "
+            "AND (t.fund_name, t.fund_id) > (:cur_sort, :cur_k0) ORDER BY t.fund_name, t.fund_id LIMIT :limit"
+        )
+        rendered = render_mysql_literal(
+            statement,
+            {"source": "5% club", "cur_sort": "Bond 5% Plus", "cur_k0": "F1", "limit": 50},
+            pymysql.dialect(),
+        )
+        self.assertIn("t.source = '5% club'", rendered)
+        self.assertIn("> ('Bond 5% Plus', 'F1')", rendered)
+        self.assertNotIn("%%", rendered)
+
+    def test_quotes_and_backslashes_are_escaped(self) -> None:
+        rendered = render_mysql_literal(
+            text("SELECT :name, :pattern"), {"name": "O'Neil \\ Co", "pattern": "%5!%%"}, pymysql.dialect()
+        )
+        self.assertEqual(rendered, "SELECT 'O''Neil \\\\ Co', '%5!%%'")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,13 @@ from pathlib import Path
 import sys
 import unittest
 
+import pandas as pd
+
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT / "src"))
 
 from transform.normalize.canonical_ids import canonical_id
-from transform.normalize.currency_normalizer import normalize_currency
+from transform.normalize.currency_normalizer import normalize_currency, normalize_currency_series
 from transform.normalize.ticker_normalizer import normalize_ticker
 
 
@@ -23,6 +25,10 @@ class TestNormalizers(unittest.TestCase):
         self.assertEqual(normalize_ticker("spy"), "SPY")
         self.assertEqual(normalize_ticker(" BRK.B "), "BRK.B")
 
+    def test_currency_series_matches_scalar(self) -> None:
+        currencies = pd.Series(["baht", " Dollar ", "eur", "baht"])
+        self.assertEqual(normalize_currency_series(currencies).tolist(), [normalize_currency(v) for v in currencies])
+
     def test_canonical_id_is_stable_and_case_insensitive(self) -> None:
         left = canonical_id(" Fund A ", "USD", "X")
         right = canonical_id("fund a", "usd", "x")
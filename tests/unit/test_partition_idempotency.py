@@ -2,11 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 import sys
-import tempfile
 import unittest
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
@@ -15,137 +14,127 @@ from pipelines.run_build_mart import _write_partition as write_mart_partition
 from pipelines.run_build_staging import _write_partition as write_staging_partition
 
 
-class TestPartitionIdempotency(unittest.TestCase):
+def _fast_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    # Test data is disposable: skip journal writes and sync barriers on every commit.
+    cursor = dbapi_connection.cursor()
+    cursor.executescript("PRAGMA journal_mode=MEMORY; PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY;")
+    cursor.close()
+
+
+class _PartitionTestCase(unittest.TestCase):
+    """One private in-memory database per test class, so the classes share no state and can run in parallel."""
+
+    table_name: str
+    # Partition-leading clustered keys: per-date deletes and counts are contiguous range scans.
+    ddl: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = create_engine("sqlite:///:memory:")
+        event.listen(cls.engine, "connect", _fast_sqlite_pragmas)
+        # The schema is created once; tests only reset rows.
+        with cls.engine.begin() as conn:
+            conn.execute(text(cls.ddl))
+        # Statements are fixed per class, so build them once rather than per test and per check.
+        cls.reset_query = text(f"DELETE FROM {cls.table_name}")
+        cls.counts_query = text(f"SELECT as_of_date, COUNT(*) FROM {cls.table_name} GROUP BY as_of_date")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.engine.dispose()
+
     def setUp(self) -> None:
-        self.tmp = tempfile.TemporaryDirectory()
-        self.db_path = Path(self.tmp.name) / "test.db"
-        self.engine = create_engine(f"sqlite:///{self.db_path}")
-
-    def tearDown(self) -> None:
-        self.engine.dispose()
-        self.tmp.cleanup()
-
-    def _count(self, table_name: str, as_of_date: str | None = None) -> int:
-        if as_of_date is None:
-            query = text(f"SELECT COUNT(*) FROM {table_name}")
-            params = {}
-        else:
-            query = text(f"SELECT COUNT(*) FROM {table_name} WHERE as_of_date = :as_of_date")
-            params = {"as_of_date": as_of_date}
+        with self.engine.begin() as conn:
+            conn.execute(self.reset_query)
 
+    def _counts_by_date(self) -> dict[str, int]:
+        # One grouped scan per check instead of a COUNT round trip per partition.
         with self.engine.connect() as conn:
-            return int(conn.execute(query, params).scalar_one())
+            return {as_of_date: int(count) for as_of_date, count in conn.execute(self.counts_query)}
+
+
+class TestStagingPartitionIdempotency(_PartitionTestCase):
+    table_name = "stg_funds"
+    ddl = """
+        CREATE TABLE stg_funds (
+          fund_id TEXT,
+          fund_name TEXT,
+          source TEXT,
+          currency TEXT,
+          as_of_date TEXT,
+          PRIMARY KEY (as_of_date, fund_id)
+        ) WITHOUT ROWID
+    """
 
     def test_staging_write_is_idempotent_per_as_of_date(self) -> None:
-        with self.engine.begin() as conn:
-            conn.execute(
-                text(
-                    """
-                    CREATE TABLE stg_funds (
-                      fund_id TEXT,
-                      fund_name TEXT,
-                      source TEXT,
-                      currency TEXT,
-                      as_of_date TEXT
-                    )
-                    """
-                )
-            )
-
         first = pd.DataFrame(
-            [
-                {
-                    "fund_id": "F1",
-                    "fund_name": "Fund 1",
-                    "source": "global",
-                    "currency": "USD",
-                    "as_of_date": "2026-02-14",
-                },
-                {
-                    "fund_id": "F2",
-                    "fund_name": "Fund 2",
-                    "source": "global",
-                    "currency": "USD",
-                    "as_of_date": "2026-02-14",
-                },
-            ]
+            {
+                "fund_id": ["F1", "F2"],
+                "fund_name": ["Fund 1", "Fund 2"],
+                "source": ["global", "global"],
+                "currency": ["USD", "USD"],
+                "as_of_date": ["2026-02-14", "2026-02-14"],
+            }
         )
         self.assertEqual(write_staging_partition(self.engine, "stg_funds", "2026-02-14", first), 2)
-        self.assertEqual(self._count("stg_funds", "2026-02-14"), 2)
+        self.assertEqual(self._counts_by_date(), {"2026-02-14": 2})
 
         rerun_same_day = pd.DataFrame(
-            [
-                {
-                    "fund_id": "F3",
-                    "fund_name": "Fund 3",
-                    "source": "global",
-                    "currency": "USD",
-                    "as_of_date": "2026-02-14",
-                }
-            ]
+            {
+                "fund_id": ["F3"],
+                "fund_name": ["Fund 3"],
+                "source": ["global"],
+                "currency": ["USD"],
+                "as_of_date": ["2026-02-14"],
+            }
         )
         self.assertEqual(write_staging_partition(self.engine, "stg_funds", "2026-02-14", rerun_same_day), 1)
-        self.assertEqual(self._count("stg_funds", "2026-02-14"), 1)
+        self.assertEqual(self._counts_by_date(), {"2026-02-14": 1})
 
         next_day = rerun_same_day.copy()
         next_day["as_of_date"] = "2026-02-15"
         self.assertEqual(write_staging_partition(self.engine, "stg_funds", "2026-02-15", next_day), 1)
-        self.assertEqual(self._count("stg_funds"), 2)
-        self.assertEqual(self._count("stg_funds", "2026-02-14"), 1)
-        self.assertEqual(self._count("stg_funds", "2026-02-15"), 1)
+        self.assertEqual(self._counts_by_date(), {"2026-02-14": 1, "2026-02-15": 1})
+
+
+class TestMartPartitionIdempotency(_PartitionTestCase):
+    table_name = "mart_true_exposure"
+    ddl = """
+        CREATE TABLE mart_true_exposure (
+          root_fund_id TEXT,
+          final_asset_id TEXT,
+          effective_weight REAL,
+          path_depth INTEGER,
+          as_of_date TEXT,
+          PRIMARY KEY (as_of_date, root_fund_id, final_asset_id)
+        ) WITHOUT ROWID
+    """
 
     def test_mart_write_is_idempotent_per_as_of_date(self) -> None:
-        with self.engine.begin() as conn:
-            conn.execute(
-                text(
-                    """
-                    CREATE TABLE mart_true_exposure (
-                      root_fund_id TEXT,
-                      final_asset_id TEXT,
-                      effective_weight REAL,
-                      path_depth INTEGER,
-                      as_of_date TEXT
-                    )
-                    """
-                )
-            )
-
         first = pd.DataFrame(
-            [
-                {
-                    "root_fund_id": "TH_FEEDER_MAIN",
-                    "final_asset_id": "EQ_US_TECH",
-                    "effective_weight": 0.42,
-                    "path_depth": 4,
-                },
-                {
-                    "root_fund_id": "TH_FEEDER_MAIN",
-                    "final_asset_id": "BOND_GOV_10Y",
-                    "effective_weight": 0.30,
-                    "path_depth": 3,
-                },
-            ]
+            {
+                "root_fund_id": ["TH_FEEDER_MAIN", "TH_FEEDER_MAIN"],
+                "final_asset_id": ["EQ_US_TECH", "BOND_GOV_10Y"],
+                "effective_weight": [0.42, 0.3],
+                "path_depth": [4, 3],
+            }
         )
         self.assertEqual(write_mart_partition(self.engine, "2026-02-14", first), 2)
-        self.assertEqual(self._count("mart_true_exposure", "2026-02-14"), 2)
+        self.assertEqual(self._counts_by_date(), {"2026-02-14": 2})
 
         rerun_same_day = pd.DataFrame(
-            [
-                {
-                    "root_fund_id": "TH_FEEDER_MAIN",
-                    "final_asset_id": "EQ_EU_BLUECHIP",
-                    "effective_weight": 0.28,
-                    "path_depth": 4,
-                }
-            ]
+            {
+                "root_fund_id": ["TH_FEEDER_MAIN"],
+                "final_asset_id": ["EQ_EU_BLUECHIP"],
+                "effective_weight": [0.28],
+                "path_depth": [4],
+            }
         )
         self.assertEqual(write_mart_partition(self.engine, "2026-02-14", rerun_same_day), 1)
-        self.assertEqual(self._count("mart_true_exposure", "2026-02-14"), 1)
+        self.assertEqual(self._counts_by_date(), {"2026-02-14": 1})
 
         self.assertEqual(write_mart_partition(self.engine, "2026-02-15", rerun_same_day), 1)
-        self.assertEqual(self._count("mart_true_exposure"), 2)
-        self.assertEqual(self._count("mart_true_exposure", "2026-02-14"), 1)
-        self.assertEqual(self._count("mart_true_exposure", "2026-02-15"), 1)
+        self.assertEqual(self._counts_by_date(), {"2026-02-14": 1, "2026-02-15": 1})
 
 
 if __name__ == "__main__":
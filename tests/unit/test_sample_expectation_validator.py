@@ -4,6 +4,7 @@ from pathlib import Path
 import sys
 import unittest
 
+import numpy as np
 import pandas as pd
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -12,53 +13,34 @@ sys.path.insert(0, str(ROOT))
 from pipelines.run_validate_sample_expectation import _validate
 
 
-class TestSampleExpectationValidator(unittest.TestCase):
-    def _expected_df(self) -> pd.DataFrame:
-        return pd.DataFrame(
-            [
-                {
-                    "root_fund_id": "TH_FEEDER_MAIN",
-                    "final_asset_id": "EQ_US_TECH",
-                    "effective_weight": 0.42,
-                    "path_depth": 4,
-                },
-                {
-                    "root_fund_id": "TH_FEEDER_MAIN",
-                    "final_asset_id": "BOND_GOV_10Y",
-                    "effective_weight": 0.30,
-                    "path_depth": 3,
-                },
-            ]
-        )
+# Built once with the validator's numeric dtypes: _validate never mutates its inputs, so tests share them.
+_EXPECTED = pd.DataFrame(
+    {
+        "root_fund_id": ["TH_FEEDER_MAIN", "TH_FEEDER_MAIN"],
+        "final_asset_id": ["EQ_US_TECH", "BOND_GOV_10Y"],
+        "effective_weight": np.array([0.42, 0.3], dtype="float64"),
+        "path_depth": np.array([4, 3], dtype="int64"),
+    }
+)
+_ACTUAL_MISMATCH = pd.DataFrame(
+    {
+        "root_fund_id": ["TH_FEEDER_MAIN", "TH_FEEDER_MAIN"],
+        "final_asset_id": ["EQ_US_TECH", "UNEXPECTED_ASSET"],
+        "effective_weight": np.array([0.4, 0.01], dtype="float64"),
+        "path_depth": np.array([2, 1], dtype="int64"),
+    }
+)
+
 
+class TestSampleExpectationValidator(unittest.TestCase):
     def test_validate_passes_when_data_matches(self) -> None:
-        expected = self._expected_df()
-        actual = expected.copy()
-        passed, messages = _validate(expected, actual, tolerance=1e-9)
+        passed, messages = _validate(_EXPECTED, _EXPECTED, tolerance=1e-9)
 
         self.assertTrue(passed)
         self.assertEqual(messages, [])
 
     def test_validate_detects_missing_extra_and_mismatch(self) -> None:
-        expected = self._expected_df()
-        actual = pd.DataFrame(
-            [
-                {
-                    "root_fund_id": "TH_FEEDER_MAIN",
-                    "final_asset_id": "EQ_US_TECH",
-                    "effective_weight": 0.40,
-                    "path_depth": 2,
-                },
-                {
-                    "root_fund_id": "TH_FEEDER_MAIN",
-                    "final_asset_id": "UNEXPECTED_ASSET",
-                    "effective_weight": 0.01,
-                    "path_depth": 1,
-                },
-            ]
-        )
-
-        passed, messages = _validate(expected, actual, tolerance=1e-9)
+        passed, messages = _validate(_EXPECTED, _ACTUAL_MISMATCH, tolerance=1e-9)
 
         self.assertFalse(passed)
         joined = "\n".join(messages)
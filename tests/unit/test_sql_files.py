@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+
+from db.sql_files import load_sql_statements, split_sql_statements
+
+
+class TestSqlFiles(unittest.TestCase):
+    def test_semicolons_inside_literals_and_comments_do_not_split(self) -> None:
+        sql_text = "-- setup; header\nINSERT INTO t VALUES ('a;b', 'it''s');\n/* ; */ SELECT 1;\nSELECT 2"
+        self.assertEqual(
+            split_sql_statements(sql_text),
+            ["INSERT INTO t VALUES ('a;b', 'it''s')", "SELECT 1", "SELECT 2"],
+        )
+
+    def test_repo_ddl_files_split_into_whole_statements(self) -> None:
+        statements = load_sql_statements(ROOT / "sql" / "20_mart_tables.sql")
+        self.assertTrue(statements)
+        self.assertTrue(all(statement.upper().startswith(("USE", "CREATE")) for statement in statements))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,47 +9,70 @@ import pandas as pd
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
-from pipelines.run_build_staging import _normalize_holdings, _normalize_links
+from pipelines.run_build_staging import _build_filter_values, _normalize_holdings, _normalize_links
+
+
+_KNOWN_FUNDS: frozenset[str] = frozenset({"F_MASTER_A"})
 
 
 class TestStagingNormalization(unittest.TestCase):
     def test_normalize_holdings_drops_missing_asset_id(self) -> None:
         raw = pd.DataFrame(
-            [
-                {
-                    "fund_id": "F_MASTER_A",
-                    "asset_id": "EQ_US_TECH",
-                    "asset_name": "US Tech Basket",
-                    "asset_type": "equity",
-                    "weight": 0.6,
-                },
-                {
-                    "fund_id": "F_MASTER_A",
-                    "asset_id": None,
-                    "asset_name": "Missing asset",
-                    "asset_type": "equity",
-                    "weight": 0.1,
-                },
-            ]
+            {
+                # Repeated codes as categoricals: the normalizer must not assume object dtype.
+                "fund_id": pd.Categorical(["F_MASTER_A", "F_MASTER_A"]),
+                "asset_id": ["EQ_US_TECH", None],
+                "asset_name": ["US Tech Basket", "Missing asset"],
+                "asset_type": pd.Categorical(["equity", "equity"]),
+                "weight": [0.6, 0.1],
+            }
         )
 
-        normalized = _normalize_holdings(raw, "2026-02-14", known_fund_ids={"F_MASTER_A"})
+        normalized = _normalize_holdings(raw, "2026-02-14", known_fund_ids=_KNOWN_FUNDS)
 
         self.assertEqual(len(normalized), 1)
-        self.assertEqual(normalized.iloc[0]["asset_id"], "EQ_US_TECH")
+        self.assertEqual(normalized["asset_id"].iat[0], "EQ_US_TECH")
 
     def test_normalize_links_drops_missing_master_id(self) -> None:
         raw = pd.DataFrame(
-            [
-                {"feeder_fund_id": "TH_FEEDER_MAIN", "master_fund_id": "F_MASTER_C", "confidence": 1.0},
-                {"feeder_fund_id": "TH_FEEDER_BROKEN", "master_fund_id": None, "confidence": 0.8},
-            ]
+            {
+                "feeder_fund_id": ["TH_FEEDER_MAIN", "TH_FEEDER_BROKEN"],
+                "master_fund_id": ["F_MASTER_C", None],
+                "confidence": [1.0, 0.8],
+            }
         )
 
         normalized = _normalize_links(raw, "2026-02-14")
 
         self.assertEqual(len(normalized), 1)
-        self.assertEqual(normalized.iloc[0]["feeder_fund_id"], "TH_FEEDER_MAIN")
+        self.assertEqual(normalized["feeder_fund_id"].iat[0], "TH_FEEDER_MAIN")
+
+    def test_build_filter_values_marks_partition_and_dedupes(self) -> None:
+        funds = pd.DataFrame(
+            {
+                "fund_id": ["F1", "F2", "F3"],
+                "source": pd.Categorical(["global", "global", "thai"]),
+            }
+        )
+        links = pd.DataFrame(
+            {
+                "feeder_fund_id": ["TH_B", "TH_A", "TH_B"],
+                "master_fund_id": ["F1", "F2", "F3"],
+            }
+        )
+
+        values = _build_filter_values(funds, links, "2026-02-14")
+
+        self.assertEqual(
+            list(values.itertuples(index=False, name=None)),
+            [
+                ("partition", "2026-02-14", "2026-02-14"),
+                ("source", "global", "2026-02-14"),
+                ("source", "thai", "2026-02-14"),
+                ("feeder", "TH_A", "2026-02-14"),
+                ("feeder", "TH_B", "2026-02-14"),
+            ],
+        )
 
 
 if __name__ == "__main__":